@@ -0,0 +1,135 @@
+"""benchmarks/explain.py.
+
+Explain-plan check for the bot's MongoDB access patterns: every query must
+be served by an index (no COLLSCAN), and projected reads must not fetch
+more than their projection. Needs a real MongoDB (mongomock cannot explain).
+
+    python -m benchmarks.explain --mongo-url mongodb://127.0.0.1:27017
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, List, Optional, Set, Type
+from pydantic import BaseModel
+
+BENCH_DB = "swipe_bot_explain"
+
+
+def _stages(plan: Dict[str, Any]) -> Set[str]:
+    stages = {plan.get("stage", "")}
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages |= _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages |= _stages(child)
+    return stages
+
+
+def _winning_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    # Aggregations nest the plan of their first (cursor) stage.
+    if "queryPlanner" in explain:
+        return explain["queryPlanner"]["winningPlan"]
+    for stage in explain.get("stages", []):
+        for value in stage.values():
+            if isinstance(value, dict) and "queryPlanner" in value:
+                return value["queryPlanner"]["winningPlan"]
+    return {}
+
+
+def access_patterns() -> List[Dict[str, Any]]:
+    """
+    The commands the bot issues against `users` and `announcements`, with
+    their projections.
+    """
+    from beanie.odm.utils.projection import get_projection
+    from src.database import (
+        Announcement,
+        AnnouncementData,
+        BotUser,
+        UserAuth,
+        UserLocale,
+    )
+    from src.database.listings import nearby_pipeline
+
+    def user(name: str, projection: Optional[Type[BaseModel]]) -> Dict[str, Any]:
+        query = BotUser.find_one(BotUser.telegram_id == 1)
+        command = {"find": "users", "filter": query.get_filter_query(), "limit": 1}
+        if projection:
+            command["projection"] = get_projection(projection)
+        return {"name": name, "command": command}
+
+    latest = Announcement.find(Announcement.listing_id <= 1)
+    return [
+        user("locale lookup (LanguageMiddleware)", UserLocale),
+        user("auth lookup (API clients)", UserAuth),
+        user("full document (/start, language)", None),
+        {
+            "name": "latest page (browse snapshot)",
+            "command": {
+                "find": "announcements",
+                "filter": latest.get_filter_query(),
+                "sort": {"listing_id": -1},
+                "limit": 3,
+                "projection": get_projection(AnnouncementData),
+            },
+        },
+        {
+            "name": "nearby page (Near me)",
+            "command": {
+                "aggregate": "announcements",
+                "pipeline": nearby_pipeline(50.45, 30.52, 3, max_distance=10_000),
+                "cursor": {},
+            },
+        },
+    ]
+
+
+async def check(mongo_url: str) -> int:
+    """
+    Explains every access pattern and returns the number of failures.
+    """
+    from beanie import init_beanie
+    from pymongo import AsyncMongoClient
+    from src.database import DOCUMENT_MODELS, BotUser, verify_indexes
+
+    client = AsyncMongoClient(mongo_url)
+    db = client[BENCH_DB]
+    await init_beanie(database=db, document_models=DOCUMENT_MODELS)
+    await verify_indexes(DOCUMENT_MODELS)
+    await BotUser(telegram_id=1, full_name="Explain").insert()
+
+    failures = 0
+    try:
+        for item in access_patterns():
+            explain = await db.command(
+                "explain", item["command"], verbosity="queryPlanner"
+            )
+            stages = _stages(_winning_plan(explain))
+            ok = "COLLSCAN" not in stages and bool(
+                stages & {"IXSCAN", "GEO_NEAR_2DSPHERE"}
+            )
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {item['name']}: {sorted(stages)}")
+    finally:
+        await client.drop_database(BENCH_DB)
+        await client.close()
+    return failures
+
+
+def main() -> None:
+    """
+    CLI entry point; exits 1 when any query is not index-backed.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--mongo-url", default="mongodb://127.0.0.1:27017")
+    args = parser.parse_args()
+
+    failures = asyncio.run(check(args.mongo_url))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""benchmarks/fakes.py.
+
+In-process fakes for the two HTTP services the bot talks to: the Telegram
+Bot API and the Swipe backend. Both are aiohttp apps with configurable
+latency that count the calls they receive.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from aiohttp import web
+
+FAKE_IMAGE = os.urandom(200 * 1024)
+
+
+def free_port() -> int:
+    """
+    Returns a TCP port that is currently free on localhost.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeServer:
+    """
+    Base class: runs an aiohttp app on localhost and counts requests per route.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, port: Optional[int] = None):
+        self.latency = latency_ms / 1000
+        self.port = port or free_port()
+        self.calls: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running server.
+        """
+        return f"http://127.0.0.1:{self.port}"
+
+    def build_app(self) -> web.Application:
+        """
+        Returns the aiohttp application to serve.
+        """
+        raise NotImplementedError
+
+    async def delay(self) -> None:
+        """
+        Simulates network and backend latency.
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def start(self) -> None:
+        """
+        Starts serving.
+        """
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class FakeTelegramServer(FakeServer):
+    """
+    Minimal Bot API: answers the methods the bot uses with plausible objects
+    and serves file downloads.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, port: Optional[int] = None):
+        super().__init__(latency_ms, port)
+        self._message_id = 0
+        # Calls per (chat id, method), for journeys checking what they got.
+        self.chat_calls: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def build_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/bot{token}/{method}", self._handle_method)
+        app.router.add_get("/file/bot{token}/{path:.+}", self._handle_file)
+        return app
+
+    def _next_message(self, params: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        self._message_id += 1
+        chat_id = int(params.get("chat_id", 1))
+        return {
+            "message_id": self._message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": 123456, "is_bot": True, "first_name": "SwipeBot"},
+            **extra,
+        }
+
+    def _edited_message(self, params: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        return {
+            "message_id": int(params.get("message_id", 0)),
+            "date": int(time.time()),
+            "edit_date": int(time.time()),
+            "chat": {"id": int(params.get("chat_id", 1)), "type": "private"},
+            "from": {"id": 123456, "is_bot": True, "first_name": "SwipeBot"},
+            **extra,
+        }
+
+    def _photo_file_id(self, media: str) -> str:
+        if media.startswith("http"):
+            self.calls["photo_url_fetch"] += 1
+        elif media.startswith("attach://"):
+            # An uploaded file (e.g. a rendered map) gets a fresh id.
+            self.calls["photo_upload"] += 1
+            return f"upload-{self.calls['photo_upload']}"
+        return _file_id(media)
+
+    def _result(self, method: str, params: Dict[str, Any]) -> Any:
+        # pylint: disable=too-many-return-statements
+        if method == "getMe":
+            return {
+                "id": 123456,
+                "is_bot": True,
+                "first_name": "SwipeBot",
+                "username": "swipe_bot",
+            }
+        if method in ("sendMessage", "editMessageText"):
+            return self._next_message(params, text=params.get("text", ""))
+        if method == "sendMediaGroup":
+            media = json.loads(params.get("media", "[]"))
+            urls = [m["media"] for m in media if m["media"].startswith("http")]
+            self.calls["photo_url_fetch"] += len(urls)
+            return [
+                self._next_message(params, photo=[_photo_size(_file_id(m["media"]))])
+                for m in media
+            ]
+        if method == "sendPhoto":
+            return self._next_message(
+                params,
+                photo=[_photo_size(self._photo_file_id(params["photo"]))],
+                caption=params.get("caption", ""),
+            )
+        if method == "editMessageMedia":
+            media = json.loads(params.get("media", "{}"))
+            return self._edited_message(
+                params,
+                photo=[_photo_size(self._photo_file_id(media["media"]))],
+                caption=media.get("caption", ""),
+            )
+        if method == "editMessageCaption":
+            return self._edited_message(params, caption=params.get("caption", ""))
+        if method == "sendLocation":
+            return self._next_message(
+                params,
+                location={
+                    "latitude": float(params.get("latitude", 0)),
+                    "longitude": float(params.get("longitude", 0)),
+                },
+            )
+        if method == "getFile":
+            file_id = params.get("file_id", "file")
+            return {**_photo_size(file_id), "file_path": f"photos/{file_id}.jpg"}
+        if method == "getMyCommands":
+            return []
+        return True
+
+    async def _handle_method(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.calls[method] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            params = dict(await request.post())
+            if "chat_id" in params:
+                self.chat_calls[(int(params["chat_id"]), method)] += 1
+            await self.delay()
+            result = self._result(method, params)
+        finally:
+            self.in_flight -= 1
+        return web.json_response({"ok": True, "result": result})
+
+    async def _handle_file(self, _request: web.Request) -> web.Response:
+        self.calls["file_download"] += 1
+        await self.delay()
+        return web.Response(body=FAKE_IMAGE, content_type="image/jpeg")
+
+
+def _file_id(media: str) -> str:
+    # Photos sent by URL get a stable id, photos sent by file_id keep theirs.
+    if media.startswith("http"):
+        return "url-" + hashlib.sha1(media.encode("utf-8")).hexdigest()[:16]
+    return media
+
+
+def _photo_size(file_id: str) -> Dict[str, Any]:
+    return {
+        "file_id": file_id,
+        "file_unique_id": f"u{file_id}",
+        "width": 1280,
+        "height": 960,
+        "file_size": len(FAKE_IMAGE),
+    }
+
+
+def fake_listing(listing_id: int) -> Dict[str, Any]:
+    """
+    Builds a deterministic listing in the Swipe API response format.
+    """
+    return {
+        "id": listing_id,
+        "address": f"Baker St, {listing_id}",
+        "price": 50_000 + listing_id * 100,
+        "area": 40 + listing_id % 60,
+        "number_of_rooms": str(1 + listing_id % 4),
+        "description": "Bright apartment close to the park. " * 3,
+        "latitude": f"{50.45 + listing_id % 100 / 1000:.5f}",
+        "longitude": f"{30.52 + listing_id % 100 / 1000:.5f}",
+        "owner": {"phone": "+380000000000"},
+        "images": [
+            {"image_url": f"https://img.example.com/{listing_id}/{n}.jpg"}
+            for n in range(3)
+        ],
+    }
+
+
+class FakeSwipeServer(FakeServer):
+    """
+    Fake Swipe backend covering auth, listings and profile endpoints.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        port: Optional[int] = None,
+        total_listings: int = 500,
+    ):
+        super().__init__(latency_ms, port)
+        self.total_listings = total_listings
+        self.created: List[Dict[str, Any]] = []
+
+    def build_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.middlewares.append(self._count)
+        app.router.add_post("/auth/register", self._ok)
+        app.router.add_post("/auth/verify", self._ok)
+        app.router.add_post("/auth/forgot-password", self._ok)
+        app.router.add_post("/auth/reset-password", self._ok)
+        app.router.add_post("/auth/login", self._tokens)
+        app.router.add_post("/auth/refresh", self._tokens)
+        app.router.add_get("/announcements/", self._listings)
+        app.router.add_get("/announcements/my", self._my_listings)
+        app.router.add_post("/announcements/", self._create_listing)
+        app.router.add_get("/users/me", self._profile)
+        return app
+
+    @web.middleware
+    async def _count(self, request: web.Request, handler):
+        self.calls[f"{request.method} {request.path}"] += 1
+        await self.delay()
+        return await handler(request)
+
+    async def _ok(self, _request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    async def _tokens(self, _request: web.Request) -> web.Response:
+        return web.json_response(
+            {"access_token": "access-token", "refresh_token": "refresh-token"}
+        )
+
+    def _page(self, request: web.Request, total: int) -> List[Dict[str, Any]]:
+        limit = int(request.query.get("limit", 10))
+        offset = int(request.query.get("offset", 0))
+        return [fake_listing(i) for i in range(offset, min(offset + limit, total))]
+
+    async def _listings(self, request: web.Request) -> web.Response:
+        return web.json_response(self._page(request, self.total_listings))
+
+    async def _my_listings(self, request: web.Request) -> web.Response:
+        return web.json_response(self._page(request, 5))
+
+    async def _create_listing(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.created.append(payload)
+        return web.json_response({"id": len(self.created)}, status=201)
+
+    async def _profile(self, _request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "id": 1,
+                "email": "user@example.com",
+                "first_name": "Bench",
+                "last_name": "User",
+                "phone": "+380000000000",
+            }
+        )
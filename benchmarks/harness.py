@@ -0,0 +1,475 @@
+"""benchmarks/harness.py.
+
+Runs the real Dispatcher and main_router offline: the Bot API and the Swipe
+backend are replaced by the fakes from benchmarks.fakes, Redis by fakeredis
+(or a scratch local database) and MongoDB by mongomock-motor (or a local
+server). Updates are fed straight into `Dispatcher.feed_update` and every
+step is timed.
+
+fakeredis and mongomock-motor are optional and not part of the project
+dependencies:
+
+    pip install fakeredis mongomock-motor
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import logging
+import os
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pymongo import monitoring
+from benchmarks.fakes import FakeSwipeServer, FakeTelegramServer
+
+BENCH_ENV = {
+    "BOT_TOKEN": "123456:benchmark",
+    "MONGO_DB_NAME": "swipe_bot_benchmark",
+    "MONGO_URL": "mongodb://127.0.0.1:27017",
+    "REDIS_URL": "redis://127.0.0.1:6379/15",
+    "TRACING_ENABLED": "false",
+    "I18N_VALIDATE_ON_STARTUP": "false",
+    # No tiles on disk and no tile server: maps render on a blank background.
+    "MAP_SNAPSHOT_ENABLED": "true",
+}
+
+# Step of the update being handled, for errors the bot logs instead of raising.
+_current_step: ContextVar[Optional[str]] = ContextVar("current_step", default=None)
+
+MONGOMOCK_METHODS = (
+    "find",
+    "find_one",
+    "insert_one",
+    "insert_many",
+    "replace_one",
+    "update_one",
+    "update_many",
+    "delete_one",
+    "delete_many",
+    "aggregate",
+    "count_documents",
+)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class StepRecorder:
+    """
+    Collects per-step latencies.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    def record(self, step: str, seconds: float) -> None:
+        """
+        Adds one latency sample.
+        """
+        self.samples[step].append(seconds)
+
+    @property
+    def total(self) -> int:
+        """
+        Number of recorded samples over all steps.
+        """
+        return sum(len(v) for v in self.samples.values())
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns count and p50/p95/p99/max in milliseconds per step.
+        """
+        result = {}
+        for step, values in self.samples.items():
+            ordered = sorted(values)
+            result[step] = {
+                "count": len(ordered),
+                "p50_ms": percentile(ordered, 50) * 1000,
+                "p95_ms": percentile(ordered, 95) * 1000,
+                "p99_ms": percentile(ordered, 99) * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        return result
+
+
+class StepErrorHandler(logging.Handler):
+    """
+    Counts records of ERROR and above logged by the bot while a step is
+    handled as errors of that step: handlers catch and log failed sends, so
+    they never reach `feed`.
+    """
+
+    def __init__(self, recorder: StepRecorder):
+        super().__init__(logging.ERROR)
+        self.recorder = recorder
+
+    def emit(self, record: logging.LogRecord) -> None:
+        step = _current_step.get()
+        if step is not None and record.name.startswith("src."):
+            self.recorder.errors[step] += 1
+
+
+class MongoCallCounter(monitoring.CommandListener):
+    """
+    Counts MongoDB commands by name (real server only).
+    """
+
+    def __init__(self, counter: Counter):
+        self.counter = counter
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.counter[event.command_name] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+def _count_mongomock_calls(counter: Counter) -> None:
+    """
+    mongomock emits no command events, so its collection methods are wrapped.
+    Only the outermost call is counted (find_one is implemented via find).
+    """
+    from mongomock.collection import Collection
+
+    depth = [0]
+    for name in MONGOMOCK_METHODS:
+        original = getattr(Collection, name)
+        if getattr(original, "__counted__", False):
+            continue
+
+        def wrapper(self, *args, __original=original, __name=name, **kwargs):
+            if not depth[0]:
+                counter[__name] += 1
+            depth[0] += 1
+            try:
+                return __original(self, *args, **kwargs)
+            finally:
+                depth[0] -= 1
+
+        wrapper.__counted__ = True
+        setattr(Collection, name, wrapper)
+
+
+def _patch_mongomock_for_beanie() -> None:
+    """
+    Beanie passes server-only options mongomock does not know about.
+    """
+    from mongomock.database import Database
+
+    original = Database.list_collection_names
+    if getattr(original, "__patched__", False):
+        return
+
+    def list_collection_names(self, filter=None, session=None, **_kwargs):
+        # pylint: disable=redefined-builtin
+        return original(self, filter=filter, session=session)
+
+    list_collection_names.__patched__ = True
+    Database.list_collection_names = list_collection_names
+
+    # pymongo's UpdateOne passes `sort`, which mongomock's bulk builder lacks.
+    from mongomock.collection import BulkOperationBuilder
+
+    add_update = BulkOperationBuilder.add_update
+
+    def add_update_without_sort(self, *args, sort=None, **kwargs):
+        # pylint: disable=unused-argument
+        return add_update(self, *args, **kwargs)
+
+    BulkOperationBuilder.add_update = add_update_without_sort
+
+
+def _count_redis_calls(redis, counter: Counter) -> None:
+    original = redis.execute_command
+
+    async def execute_command(*args, **kwargs):
+        counter[str(args[0]).upper()] += 1
+        return await original(*args, **kwargs)
+
+    redis.execute_command = execute_command
+
+
+class BenchEnvironment:
+    """
+    Fake services plus a fully configured bot application.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        telegram_latency_ms: float = 0.0,
+        swipe_latency_ms: float = 0.0,
+        redis_url: Optional[str] = None,
+        mongo_url: Optional[str] = None,
+        total_listings: int = 500,
+    ):
+        self.telegram = FakeTelegramServer(telegram_latency_ms)
+        self.swipe = FakeSwipeServer(swipe_latency_ms, total_listings=total_listings)
+        self.redis_url = redis_url
+        self.mongo_url = mongo_url
+        self.recorder = StepRecorder()
+        self._error_handler = StepErrorHandler(self.recorder)
+        self.redis_calls: Counter = Counter()
+        self.mongo_calls: Counter = Counter()
+        self.redis = None
+        self.bot = None
+        self.dp = None
+        self._update_id = 0
+
+    async def _connect_redis(self):
+        if self.redis_url:
+            from redis.asyncio import Redis
+
+            redis = Redis.from_url(self.redis_url, decode_responses=True)
+            await redis.flushdb()
+            return redis
+        try:
+            from fakeredis.aioredis import FakeRedis
+        except ImportError as e:
+            raise SystemExit(
+                "fakeredis is not installed; pass --redis-url to use a local Redis"
+            ) from e
+        return FakeRedis(decode_responses=True)
+
+    async def _connect_mongo(self, db_name: str):
+        if self.mongo_url:
+            from pymongo import AsyncMongoClient
+
+            client = AsyncMongoClient(
+                self.mongo_url, event_listeners=[MongoCallCounter(self.mongo_calls)]
+            )
+            await client.drop_database(db_name)
+            return client
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError as e:
+            raise SystemExit(
+                "mongomock-motor is not installed; pass --mongo-url to use a local"
+                " MongoDB"
+            ) from e
+        _count_mongomock_calls(self.mongo_calls)
+        _patch_mongomock_for_beanie()
+        return AsyncMongoMockClient()
+
+    async def start(self) -> None:
+        """
+        Starts the fakes and builds the application against them.
+        """
+        from aiogram.client.session.aiohttp import AiohttpSession
+        from aiogram.client.telegram import TelegramAPIServer
+
+        await self.telegram.start()
+        await self.swipe.start()
+        logging.getLogger().addHandler(self._error_handler)
+
+        for key, value in BENCH_ENV.items():
+            os.environ.setdefault(key, value)
+        os.environ["SWIPE_API_BASE_URL"] = self.swipe.url
+
+        from src.config import get_settings
+        from src.main import create_app, init_mongo
+
+        get_settings.cache_clear()
+        self.redis = await self._connect_redis()
+        client = await self._connect_mongo(get_settings().MONGO_DB_NAME)
+        session = AiohttpSession(api=TelegramAPIServer.from_base(self.telegram.url))
+        self.bot, self.dp, _ = create_app(redis=self.redis, session=session)
+        await init_mongo(client)
+        await self._fill_search_index()
+        _count_redis_calls(self.redis, self.redis_calls)
+
+    async def _fill_search_index(self) -> None:
+        # One full sync of the fake feed into the mirror, done before counting
+        # starts so the journeys' Swipe API figures stay comparable.
+        from src.database import iter_listings
+        from src.infrastructure.search import listing_index
+        from src.infrastructure.sync import ListingSync
+
+        listing_sync = ListingSync(interval=0, full_interval=0, page_size=100)
+        await listing_sync.sync_once(full=True)
+        await listing_index.load(iter_listings())
+        listing_index.ready = await listing_sync.is_synced()
+        self.swipe.calls.clear()
+        self.mongo_calls.clear()
+
+    async def stop(self) -> None:
+        """
+        Releases all resources.
+        """
+        logging.getLogger().removeHandler(self._error_handler)
+        if self.bot:
+            await self.bot.session.close()
+        if self.redis is not None:
+            await self.redis.aclose()
+        await self.telegram.stop()
+        await self.swipe.stop()
+
+    async def feed(self, step: str, payload: Dict[str, Any]) -> None:
+        """
+        Feeds one update (given as a Bot API dict) and records its latency.
+        """
+        from aiogram.types import Update
+
+        self._update_id += 1
+        update = Update.model_validate(
+            {"update_id": self._update_id, **payload}, context={"bot": self.bot}
+        )
+        token = _current_step.set(step)
+        started = time.perf_counter()
+        try:
+            await self.dp.feed_update(self.bot, update)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.recorder.errors[step] += 1
+            logging.getLogger(__name__).warning("Step %s failed: %s", step, e)
+        finally:
+            _current_step.reset(token)
+        self.recorder.record(step, time.perf_counter() - started)
+
+    def user(self, user_id: int, language_code: str = "en") -> "VirtualUser":
+        """
+        Returns a virtual user bound to this environment.
+        """
+        return VirtualUser(self, user_id, language_code)
+
+    def report(self, wall_seconds: float) -> Dict[str, Any]:
+        """
+        Returns throughput, per-step latency and backend call counts.
+        """
+        return {
+            "wall_seconds": wall_seconds,
+            "updates": self.recorder.total,
+            "updates_per_second": self.recorder.total / wall_seconds,
+            "steps": self.recorder.summary(),
+            "errors": dict(self.recorder.errors),
+            "calls": {
+                "telegram": dict(self.telegram.calls),
+                "swipe_api": dict(self.swipe.calls),
+                "redis": dict(self.redis_calls),
+                "mongo": dict(self.mongo_calls),
+            },
+        }
+
+
+class VirtualUser:
+    """
+    Produces Telegram updates on behalf of one simulated user.
+    """
+
+    def __init__(self, env: BenchEnvironment, user_id: int, language_code: str):
+        self.env = env
+        self.user_id = user_id
+        self.language_code = language_code
+        self._message_id = 0
+
+    @property
+    def _from(self) -> Dict[str, Any]:
+        return {
+            "id": self.user_id,
+            "is_bot": False,
+            "first_name": f"User{self.user_id}",
+            "username": f"user{self.user_id}",
+            "language_code": self.language_code,
+        }
+
+    def _message(self, **content: Any) -> Dict[str, Any]:
+        self._message_id += 1
+        return {
+            "message_id": self._message_id,
+            "date": int(datetime.now().timestamp()),
+            "chat": {"id": self.user_id, "type": "private"},
+            "from": self._from,
+            **content,
+        }
+
+    def sent(self, method: str) -> int:
+        """
+        Number of `method` calls the bot made to this user's chat so far.
+        """
+        return self.env.telegram.chat_calls[(self.user_id, method)]
+
+    def fail(self, step: str, reason: str) -> None:
+        """
+        Records a failed expectation of a journey as an error of the step.
+        """
+        self.env.recorder.errors[step] += 1
+        logging.getLogger(__name__).warning("Step %s failed: %s", step, reason)
+
+    async def text(self, step: str, text: str) -> None:
+        """
+        Sends a text message.
+        """
+        await self.env.feed(step, {"message": self._message(text=text)})
+
+    async def command(self, step: str, command: str, args: str = "") -> None:
+        """
+        Sends a bot command, e.g. "start", optionally with arguments.
+        """
+        entity = {"type": "bot_command", "offset": 0, "length": len(command) + 1}
+        text = f"/{command} {args}" if args else f"/{command}"
+        await self.env.feed(
+            step, {"message": self._message(text=text, entities=[entity])}
+        )
+
+    async def callback(self, step: str, data: str) -> None:
+        """
+        Presses an inline button with the given callback data.
+        """
+        bot_message = self._message(text="...")
+        bot_message["from"] = {"id": 123456, "is_bot": True, "first_name": "Bot"}
+        await self.env.feed(
+            step,
+            {
+                "callback_query": {
+                    "id": f"{self.user_id}-{self._message_id}",
+                    "from": self._from,
+                    "chat_instance": str(self.user_id),
+                    "data": data,
+                    "message": bot_message,
+                }
+            },
+        )
+
+    async def location(self, step: str, latitude: float, longitude: float) -> None:
+        """
+        Shares a location.
+        """
+        await self.env.feed(
+            step,
+            {
+                "message": self._message(
+                    location={"latitude": latitude, "longitude": longitude}
+                )
+            },
+        )
+
+    async def photo(
+        self, step: str, file_id: str, media_group_id: Optional[str] = None
+    ) -> None:
+        """
+        Sends a photo, optionally as part of an album.
+        """
+        sizes = [
+            {
+                "file_id": file_id,
+                "file_unique_id": f"u{file_id}",
+                "width": 1280,
+                "height": 960,
+            }
+        ]
+        content: Dict[str, Any] = {"photo": sizes}
+        if media_group_id:
+            content["media_group_id"] = media_group_id
+        await self.env.feed(step, {"message": self._message(**content)})
@@ -0,0 +1,119 @@
+"""benchmarks/journeys.py.
+
+Scripted user journeys replayed by the benchmark and load-test runners.
+Each journey is a coroutine taking a VirtualUser; step names are prefixed
+with the journey name.
+"""
+
+from typing import Awaitable, Callable, Dict
+from benchmarks.harness import VirtualUser
+from src.bot.callbacks import MenuCallback
+from src.bot.i18n.actions import ACTION_LABELS, TextAction
+
+Journey = Callable[..., Awaitable[None]]
+
+
+def _email(user: VirtualUser) -> str:
+    return f"user{user.user_id}@example.com"
+
+
+async def registration(user: VirtualUser, **_options) -> None:
+    """
+    /start -> Registration -> five form steps -> verification code.
+    """
+    await user.command("registration.start", "start")
+    await user.callback("registration.open", MenuCallback(action="registration").pack())
+    await user.text("registration.first_name", "Bench")
+    await user.text("registration.last_name", "User")
+    await user.text("registration.email", _email(user))
+    await user.text("registration.phone", "+380000000000")
+    await user.text("registration.password", "secret-password")
+    await user.text("registration.code", "123456")
+
+
+async def login(user: VirtualUser, **_options) -> None:
+    """
+    /start -> Login -> email -> password.
+    """
+    await user.command("login.start", "start")
+    await user.callback("login.open", MenuCallback(action="login").pack())
+    await user.text("login.email", _email(user))
+    await user.text("login.password", "secret-password")
+
+
+async def browse(user: VirtualUser, pages: int = 50, **_options) -> None:
+    """
+    Opens all listings, shows the first page on the map and turns `pages`
+    pages forward.
+    """
+    await user.callback("browse.open", MenuCallback(action="listings").pack())
+    shown = user.sent("sendPhoto")
+    await user.text("browse.map", ACTION_LABELS[TextAction.SHOW_MAP])
+    if user.sent("sendPhoto") == shown:
+        user.fail("browse.map", "no map photo was sent")
+    for _ in range(pages):
+        await user.text("browse.page_next", ACTION_LABELS[TextAction.PAGE_NEXT])
+    await user.text("browse.exit", ACTION_LABELS[TextAction.BACK_TO_MENU])
+
+
+async def search(user: VirtualUser, pages: int = 50, **_options) -> None:
+    """
+    Quick /search by address, then the filter wizard (price range, skipped
+    area and rooms, address keywords) and `pages` pages of its results, and
+    a rooms-only search that must find listings. Needs a logged-in user.
+    """
+    skip = ACTION_LABELS[TextAction.SKIP]
+    await user.command("search.quick", "search", "baker")
+    await user.text("search.exit", ACTION_LABELS[TextAction.BACK_TO_MENU])
+    await user.callback("search.open", MenuCallback(action="search").pack())
+    await user.text("search.price", "50000-90000")
+    await user.text("search.area", skip)
+    await user.text("search.rooms", skip)
+    await user.text("search.keywords", "baker")
+    for _ in range(pages):
+        await user.text("search.page_next", ACTION_LABELS[TextAction.PAGE_NEXT])
+    await user.text("search.exit", ACTION_LABELS[TextAction.BACK_TO_MENU])
+
+    await user.callback("search.open", MenuCallback(action="search").pack())
+    await user.text("search.price", skip)
+    await user.text("search.area", skip)
+    await user.text("search.rooms", "2")
+    shown = user.sent("sendPhoto") + user.sent("sendMediaGroup")
+    await user.text("search.keywords", skip)
+    if user.sent("sendPhoto") + user.sent("sendMediaGroup") == shown:
+        user.fail("search.keywords", "the rooms filter found no listings")
+    await user.text("search.exit", ACTION_LABELS[TextAction.BACK_TO_MENU])
+
+
+async def view_profile(user: VirtualUser, **_options) -> None:
+    """
+    Opens the profile screen.
+    """
+    await user.callback("profile.open", MenuCallback(action="profile").pack())
+
+
+async def create_listing(user: VirtualUser, photos: int = 10, **_options) -> None:
+    """
+    Walks the seven creation steps and uploads a `photos`-photo album.
+    """
+    await user.callback("create.open", MenuCallback(action="create_listing").pack())
+    await user.text("create.address", "Baker St, 221B")
+    await user.text("create.apartment", "12")
+    await user.text("create.price", "100000")
+    await user.text("create.area", "55")
+    await user.text("create.description", "Sunny two-room apartment.")
+    await user.location("create.location", 50.4501, 30.5234)
+    album = f"album-{user.user_id}"
+    for n in range(photos):
+        await user.photo("create.photo", f"photo-{user.user_id}-{n}", album)
+    await user.text("create.done", ACTION_LABELS[TextAction.DONE])
+
+
+JOURNEYS: Dict[str, Journey] = {
+    "registration": registration,
+    "login": login,
+    "browse": browse,
+    "search": search,
+    "view_profile": view_profile,
+    "create_listing": create_listing,
+}
@@ -0,0 +1,262 @@
+"""benchmarks/load.py.
+
+Load generator: virtual users sign up, log in, then loop over a weighted mix
+of journeys with exponential think times. Concurrency is raised in stages;
+for each stage the saturation report shows throughput, update latency,
+event-loop lag, FSM data held in Redis, process RSS and the number of Bot
+API requests in flight from the bot (the outgoing request queue).
+
+    python -m benchmarks.load --stages 10,100,500,1000 --stage-seconds 30 \\
+        --mix browse=0.6,view_profile=0.2,create_listing=0.2
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import resource
+import time
+from typing import Any, Dict, List, Optional
+from benchmarks.harness import BenchEnvironment, StepRecorder, percentile
+
+DEFAULT_MIX = "browse=0.6,view_profile=0.2,create_listing=0.2"
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parses "journey=weight,..." into a dict.
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up from a short sleep.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(time.perf_counter() - started - self.interval)
+
+    def start(self) -> None:
+        """
+        Starts sampling.
+        """
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+
+    def drain(self) -> List[float]:
+        """
+        Returns and resets the collected samples.
+        """
+        samples, self.samples = self.samples, []
+        return samples
+
+    async def stop(self) -> None:
+        """
+        Stops sampling.
+        """
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+def in_flight_middleware(counter: Dict[str, int]):
+    """
+    Bot session middleware tracking outgoing Bot API requests in flight,
+    including those waiting for a free connection.
+    """
+
+    async def middleware(make_request, bot, method):
+        counter["current"] += 1
+        counter["max"] = max(counter["max"], counter["current"])
+        try:
+            return await make_request(bot, method)
+        finally:
+            counter["current"] -= 1
+
+    return middleware
+
+
+async def fsm_data_bytes(redis) -> int:
+    """
+    Total size of the FSM data values stored in Redis.
+    """
+    total = 0
+    async for key in redis.scan_iter(match="fsm:*:data", count=500):
+        total += await redis.strlen(key)
+    return total
+
+
+class LoadTest:
+    """
+    Runs staged load against a BenchEnvironment.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, env: BenchEnvironment, args: argparse.Namespace):
+        from benchmarks.journeys import JOURNEYS
+
+        self.env = env
+        self.args = args
+        self.journeys = JOURNEYS
+        self.mix = parse_mix(args.mix)
+        unknown = set(self.mix) - set(JOURNEYS)
+        if unknown:
+            raise SystemExit(f"Unknown journeys: {', '.join(sorted(unknown))}")
+        self.lag = LoopLagMonitor()
+        self.in_flight = {"current": 0, "max": 0}
+        self.users: List[asyncio.Task] = []
+        self.running = True
+
+    async def virtual_user(self, user_id: int) -> None:
+        """
+        Signs up, logs in, then loops over the journey mix until stopped.
+        """
+        user = self.env.user(user_id)
+        await self.journeys["registration"](user)
+        await self.journeys["login"](user)
+        names, weights = list(self.mix), list(self.mix.values())
+        while self.running:
+            await asyncio.sleep(random.expovariate(1 / self.args.think_time))
+            if not self.running:
+                break
+            name = random.choices(names, weights)[0]
+            await self.journeys[name](
+                user, pages=self.args.pages, photos=self.args.photos
+            )
+
+    async def stage(self, concurrency: int) -> Dict[str, Any]:
+        """
+        Raises the number of users to `concurrency` and measures one stage.
+        """
+        self.env.recorder = StepRecorder()
+        self.in_flight["max"] = self.in_flight["current"]
+        self.lag.drain()
+
+        for n in range(len(self.users), concurrency):
+            self.users.append(
+                asyncio.create_task(self.virtual_user(100_000 + n), name=f"vu-{n}")
+            )
+
+        started = time.perf_counter()
+        await asyncio.sleep(self.args.stage_seconds)
+        wall = time.perf_counter() - started
+
+        recorder = self.env.recorder
+        latencies = sorted(v for values in recorder.samples.values() for v in values)
+        lag = sorted(self.lag.drain())
+        return {
+            "concurrency": concurrency,
+            "updates": len(latencies),
+            "updates_per_second": len(latencies) / wall,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "loop_lag_p99_ms": percentile(lag, 99) * 1000,
+            "loop_lag_max_ms": (lag[-1] if lag else 0.0) * 1000,
+            "fsm_kb": await fsm_data_bytes(self.env.redis) / 1024,
+            "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "bot_requests_in_flight_max": self.in_flight["max"],
+            "errors": sum(recorder.errors.values()),
+            "steps": recorder.summary(),
+        }
+
+    async def run(self, stages: List[int]) -> List[Dict[str, Any]]:
+        """
+        Runs all stages and returns one result per stage.
+        """
+        self.env.bot.session.middleware(in_flight_middleware(self.in_flight))
+        self.lag.start()
+        results = []
+        try:
+            for concurrency in stages:
+                result = await self.stage(concurrency)
+                print_stage(result)
+                results.append(result)
+        finally:
+            self.running = False
+            for task in self.users:
+                task.cancel()
+            await asyncio.gather(*self.users, return_exceptions=True)
+            await self.lag.stop()
+        return results
+
+
+def print_stage(result: Dict[str, Any]) -> None:
+    """
+    Prints one row of the saturation table.
+    """
+    print(
+        f"{result['concurrency']:>7}{result['updates_per_second']:>10.1f}"
+        f"{result['p50_ms']:>9.0f}{result['p95_ms']:>9.0f}{result['p99_ms']:>9.0f}"
+        f"{result['loop_lag_p99_ms']:>10.1f}{result['fsm_kb']:>10.1f}"
+        f"{result['rss_mb']:>9.0f}{result['bot_requests_in_flight_max']:>10}"
+        f"{result['errors']:>7}",
+        flush=True,
+    )
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Starts the environment and runs the staged load test.
+    """
+    env = BenchEnvironment(
+        telegram_latency_ms=args.telegram_latency_ms,
+        swipe_latency_ms=args.swipe_latency_ms,
+        redis_url=args.redis_url,
+        mongo_url=args.mongo_url,
+    )
+    await env.start()
+    print(
+        f"{'users':>7}{'upd/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'lag p99':>10}{'fsm KB':>10}{'rss MB':>9}{'tg queue':>10}{'errs':>7}"
+    )
+    try:
+        return await LoadTest(env, args).run(
+            [int(s) for s in args.stages.split(",") if s.strip()]
+        )
+    finally:
+        await env.stop()
+
+
+def main() -> None:
+    """
+    CLI entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--stages", default="10,50,100,250")
+    parser.add_argument("--stage-seconds", type=float, default=30.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--think-time", type=float, default=2.0, help="mean, s")
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--photos", type=int, default=3)
+    parser.add_argument("--telegram-latency-ms", type=float, default=20.0)
+    parser.add_argument("--swipe-latency-ms", type=float, default=30.0)
+    parser.add_argument("--redis-url", help="scratch Redis database (it is flushed)")
+    parser.add_argument("--mongo-url", help="local MongoDB (benchmark db is dropped)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""benchmarks/run.py.
+
+Offline end-to-end benchmark: every virtual user replays the selected
+journeys in order against the real dispatcher and fake backends; users run
+concurrently. Prints throughput, p50/p95/p99 per step and Redis/Mongo/HTTP
+call counts.
+
+    python -m benchmarks.run --users 10 --telegram-latency-ms 30 \\
+        --swipe-latency-ms 50 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List
+from benchmarks.harness import BenchEnvironment
+
+DEFAULT_JOURNEYS = "registration,login,browse,create_listing"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """
+    Prints a human readable summary of a benchmark report.
+    """
+    print(
+        f"{report['updates']} updates in {report['wall_seconds']:.2f}s "
+        f"({report['updates_per_second']:.1f} updates/s)"
+    )
+    print(f"\n{'step':<28}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for step, stats in report["steps"].items():
+        print(
+            f"{step:<28}{stats['count']:>7}{stats['p50_ms']:>10.1f}"
+            f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    if report["errors"]:
+        print(f"\nerrors: {report['errors']}")
+    for backend, calls in report["calls"].items():
+        total = sum(calls.values())
+        detail = ", ".join(f"{k}={v}" for k, v in sorted(calls.items()))
+        print(f"\n{backend}: {total} calls\n  {detail}")
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Runs the benchmark and returns its report.
+    """
+    from benchmarks.journeys import JOURNEYS  # pylint: disable=import-outside-toplevel
+
+    names: List[str] = [n.strip() for n in args.journeys.split(",") if n.strip()]
+    unknown = set(names) - set(JOURNEYS)
+    if unknown:
+        raise SystemExit(f"Unknown journeys: {', '.join(sorted(unknown))}")
+
+    env = BenchEnvironment(
+        telegram_latency_ms=args.telegram_latency_ms,
+        swipe_latency_ms=args.swipe_latency_ms,
+        redis_url=args.redis_url,
+        mongo_url=args.mongo_url,
+    )
+    await env.start()
+
+    async def replay(user_id: int) -> None:
+        user = env.user(user_id)
+        for name in names:
+            await JOURNEYS[name](user, pages=args.pages, photos=args.photos)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(replay(1000 + n) for n in range(args.users)))
+        return env.report(time.perf_counter() - started)
+    finally:
+        await env.stop()
+
+
+def main() -> None:
+    """
+    CLI entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--journeys", default=DEFAULT_JOURNEYS)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--photos", type=int, default=10)
+    parser.add_argument("--telegram-latency-ms", type=float, default=20.0)
+    parser.add_argument("--swipe-latency-ms", type=float, default=30.0)
+    parser.add_argument("--redis-url", help="scratch Redis database (it is flushed)")
+    parser.add_argument("--mongo-url", help="local MongoDB (benchmark db is dropped)")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""benchmarks/startup.py.
+
+Cold start regression benchmark: spawns fresh interpreters that import
+`src.main` and build the application (no network I/O), and fails when the
+median cold start exceeds the budget.
+
+    python -m benchmarks.startup --runs 5 --budget-ms 6500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import json
+from src.infrastructure.profiling import StartupProfiler
+
+profiler = StartupProfiler(top={top})
+profiler.start()
+with profiler.phase("import_main"):
+    import src.main
+with profiler.phase("create_app"):
+    src.main.create_app()
+print(json.dumps(profiler.report()))
+"""
+
+DUMMY_ENV = {
+    "BOT_TOKEN": "123456:benchmark",
+    "MONGO_URL": "mongodb://127.0.0.1:27017",
+    "MONGO_DB_NAME": "swipe_bot_benchmark",
+    "REDIS_URL": "redis://127.0.0.1:6379/15",
+    "SWIPE_API_BASE_URL": "http://127.0.0.1:8000",
+}
+
+
+def run_once(top: int) -> dict:
+    """
+    Runs one cold start in a fresh interpreter and returns its profile.
+    """
+    env = {**DUMMY_ENV, **os.environ}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(top=top)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    profile["wall"] = wall
+    return profile
+
+
+def main() -> int:
+    """
+    Runs the benchmark and compares the median cold start with the budget.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--runs", type=int, default=5)
+    # About a third above the measured median (~4.9 s) to absorb run-to-run noise.
+    parser.add_argument("--budget-ms", type=float, default=6500.0)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # The first run warms the bytecode cache; it is reported but not scored.
+    warmup = run_once(args.top)
+    print(f"warm-up run: {warmup['wall'] * 1000:.0f} ms")
+
+    profiles = [run_once(args.top) for _ in range(args.runs)]
+    walls = [p["wall"] * 1000 for p in profiles]
+    median = statistics.median(walls)
+
+    last = profiles[-1]
+    print("phases (last run):")
+    for name, value in last["phases"].items():
+        print(f"  {name:<20} {value * 1000:8.1f} ms")
+    print("slowest imports (last run, cumulative):")
+    for entry in last["imports"]:
+        print(f"  {entry['module']:<50} {entry['cumulative'] * 1000:8.1f} ms")
+
+    print(
+        f"cold start: median {median:.0f} ms, min {min(walls):.0f} ms, "
+        f"max {max(walls):.0f} ms over {args.runs} runs "
+        f"(budget {args.budget_ms:.0f} ms)"
+    )
+    if median > args.budget_ms:
+        print("FAIL: cold start exceeds the budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,5 +3,11 @@
 from .language import LanguageCallback
 from .menu import MenuCallback
 from .listings import ListingCallback
+from .saved_searches import SavedSearchCallback
 
-__all__ = ["LanguageCallback", "MenuCallback", "ListingCallback"]
+__all__ = [
+    "LanguageCallback",
+    "MenuCallback",
+    "ListingCallback",
+    "SavedSearchCallback",
+]
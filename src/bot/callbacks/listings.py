@@ -7,8 +7,10 @@ from aiogram.filters.callback_data import CallbackData
 class ListingCallback(CallbackData, prefix="lst"):
     """
     Callback for listing navigation.
-    action: next, prev, geo
+    action: next, prev, geo, fav, photos, details, card
+    index: photo shown by "photos"
     """
 
     action: str
     id: Optional[int] = None
+    index: Optional[int] = None
@@ -0,0 +1,13 @@
+"""src/bot/callbacks/saved_searches.py."""
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class SavedSearchCallback(CallbackData, prefix="ss"):
+    """
+    Callback for saved search management.
+    action: delete
+    """
+
+    action: str
+    id: str
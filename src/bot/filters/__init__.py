@@ -0,0 +1,6 @@
+"""src/bot/filters/__init__.py."""
+
+from .action import ActionFilter
+from .admin import AdminFilter
+
+__all__ = ["ActionFilter", "AdminFilter"]
@@ -0,0 +1,28 @@
+"""src/bot/filters/action.py."""
+
+from typing import Optional
+from aiogram.filters import Filter
+from aiogram.types import Message
+from src.bot.i18n import TextAction
+
+
+class ActionFilter(Filter):
+    """
+    Matches messages whose text resolved to the given action.
+    Relies on 'text_action' injected by TextActionMiddleware.
+    """
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self, action: TextAction):
+        """
+        Initializes the filter.
+        """
+        self.action = action
+
+    async def __call__(
+        self, message: Message, text_action: Optional[TextAction] = None
+    ) -> bool:
+        """
+        Compares the pre-resolved action of the message.
+        """
+        return text_action is self.action
@@ -0,0 +1,21 @@
+"""src/bot/filters/admin.py."""
+
+from aiogram.filters import Filter
+from aiogram.types import Message
+from src.config import get_settings
+
+
+class AdminFilter(Filter):
+    """
+    Matches messages from the users listed in the ADMIN_IDS setting.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(self, message: Message) -> bool:
+        """
+        Checks the sender against the configured admins.
+        """
+        return (
+            message.from_user is not None
+            and message.from_user.id in get_settings().ADMIN_IDS
+        )
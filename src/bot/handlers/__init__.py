@@ -1,14 +1,15 @@
 """src/bot/handlers/__init__.py"""
 
 from aiogram import Router
+from .admin import router as admin_router
 from .common import router as common_router
 from .auth import router as auth_router
 from .menu import router as menu_router
 from .announcement import router as announcement_router
 
-
 main_router = Router()
 
+main_router.include_router(admin_router)
 main_router.include_router(auth_router)
 main_router.include_router(announcement_router)
 main_router.include_router(menu_router)
@@ -0,0 +1,66 @@
+"""src/bot/handlers/admin.py."""
+
+import logging
+from typing import Optional
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+from aiogram.utils.i18n import I18n, gettext as _
+from src.bot.filters import AdminFilter
+from src.bot.utils import Broadcaster
+
+router = Router()
+router.message.filter(AdminFilter())
+logger = logging.getLogger(__name__)
+
+
+@router.message(Command("broadcast"))
+async def cmd_broadcast(
+    message: Message,
+    command: CommandObject,
+    i18n: I18n,
+    broadcaster: Optional[Broadcaster] = None,
+):
+    """
+    Queues a message to all active users: /broadcast <text>. Lines starting
+    with a locale tag such as [ru] begin the text for that language.
+    """
+    if broadcaster is None:
+        await message.answer(_("Broadcasts are not available right now."))
+        return
+    # html_text keeps the admin's formatting; drop the command itself.
+    parts = message.html_text.split(maxsplit=1) if command.args else []
+    if len(parts) < 2:
+        await message.answer(
+            _(
+                "Usage: /broadcast <text>\n"
+                "Start a line with [ru] or [en] to give that language its own text."
+            ),
+            parse_mode=None,
+        )
+        return
+
+    job_id = await broadcaster.create(parts[1], message.chat.id, i18n.current_locale)
+    if job_id is None:
+        await message.answer(_("The broadcast text is empty."))
+        return
+    logger.info("Admin %s started broadcast %s", message.from_user.id, job_id)
+
+
+@router.message(Command("broadcast_cancel"))
+async def cmd_broadcast_cancel(
+    message: Message,
+    command: CommandObject,
+    broadcaster: Optional[Broadcaster] = None,
+):
+    """
+    Cancels an unfinished broadcast: /broadcast_cancel <id>.
+    """
+    job_id = (command.args or "").strip()
+    if broadcaster is None or not job_id.isdigit():
+        await message.answer(_("Usage: /broadcast_cancel <id>"), parse_mode=None)
+        return
+    if await broadcaster.cancel(job_id):
+        await message.answer(_("Broadcast #{id} will be cancelled.").format(id=job_id))
+    else:
+        await message.answer(_("Broadcast #{id} is not running.").format(id=job_id))
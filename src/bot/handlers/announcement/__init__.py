@@ -3,11 +3,16 @@
 from aiogram import Router
 from .get_announcement import router as get_announcement_router
 from .create_announcement import router as create_announcement_router
-
+from .search import router as search_router
+from .saved_searches import router as saved_searches_router
+from .inline import router as inline_router
 
 router = Router()
 
+router.include_router(saved_searches_router)
 router.include_router(get_announcement_router)
 router.include_router(create_announcement_router)
+router.include_router(search_router)
+router.include_router(inline_router)
 
 __all__ = ["router"]
@@ -4,8 +4,10 @@ import logging
 from aiogram import Router, F, Bot
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, ReplyKeyboardRemove
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import MenuCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction, text_actions
 from src.bot.keyboards.inline import get_main_menu_keyboard
 from src.bot.keyboards.reply import (
     get_cancel_keyboard,
@@ -20,7 +22,7 @@ from src.bot.utils import (
     remove_reply_keyboard,
     encode_image_to_base64,
 )
-from src.database import BotUser
+from src.database import BotUser, UserAuth
 from src.infrastructure.api import SwipeApiClient, SwipeAPIError
 
 router = Router()
@@ -76,7 +78,7 @@ async def input_apt_number(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text == _("Back"):
+    if text_actions.resolve(message.text) is TextAction.BACK:
         await cleanup_last_step(state, message)
         await state.set_state(CreateAnnouncementSG.InputAddress)
         msg = await message.answer(
@@ -104,7 +106,7 @@ async def input_price(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text == _("Back"):
+    if text_actions.resolve(message.text) is TextAction.BACK:
         await cleanup_last_step(state, message)
         await state.set_state(CreateAnnouncementSG.InputApartmentNumber)
         msg = await message.answer(
@@ -141,7 +143,7 @@ async def input_area(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text == _("Back"):
+    if text_actions.resolve(message.text) is TextAction.BACK:
         await cleanup_last_step(state, message)
         await state.set_state(CreateAnnouncementSG.InputPrice)
         msg = await message.answer(
@@ -177,7 +179,7 @@ async def input_description(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text == _("Back"):
+    if text_actions.resolve(message.text) is TextAction.BACK:
         await cleanup_last_step(state, message)
         await state.set_state(CreateAnnouncementSG.InputArea)
         msg = await message.answer(
@@ -244,7 +246,7 @@ async def input_image(message: Message, state: FSMContext, bot: Bot):
         await message.answer(_("Failed to process image."))
 
 
-@router.message(CreateAnnouncementSG.InputImages, F.text == __("Done"))
+@router.message(CreateAnnouncementSG.InputImages, ActionFilter(TextAction.DONE))
 async def finish_creation(message: Message, state: FSMContext):
     """
     Final step: Submit data to API.
@@ -269,7 +271,9 @@ async def finish_creation(message: Message, state: FSMContext):
         "communication_method": "any",
     }
 
-    user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == message.from_user.id, projection_model=UserAuth
+    )
 
     api = SwipeApiClient(user=user)
 
@@ -3,33 +3,71 @@
 import logging
 import html
 import asyncio
-from typing import Dict, Any, List, Optional, NamedTuple
+from typing import Awaitable, Callable, Dict, Any, List, Optional, NamedTuple, Tuple
 from aiogram import Router, F
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, InputMediaPhoto, ReplyKeyboardRemove
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
+from redis.asyncio import Redis
 from src.bot.callbacks import MenuCallback, ListingCallback
-from src.bot.keyboards.inline import get_item_keyboard, get_main_menu_keyboard
-from src.bot.keyboards.reply import get_listings_reply_keyboard
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction
+from src.bot.keyboards.inline import (
+    get_card_keyboard,
+    get_item_keyboard,
+    get_main_menu_keyboard,
+    set_saved_button,
+)
+from src.bot.keyboards.reply import (
+    get_back_to_menu_keyboard,
+    get_listings_reply_keyboard,
+)
 from src.bot.states import ListingsSG
-from src.database import BotUser
+from src.bot.utils import (
+    PLACEHOLDER_PHOTO_URL,
+    MapSnapshots,
+    PhotoFileCache,
+    format_price,
+)
+from src.config import get_settings
+from src.database import (
+    BotUser,
+    UserAuth,
+    favorite_ids,
+    get_listings,
+    latest_listings,
+    listing_watermark,
+    nearby_listings,
+    saved_listing_ids,
+    toggle_favorite,
+)
 from src.infrastructure.api import SwipeApiClient, SwipeAPIError
+from src.infrastructure.maps import TileStore
+from src.infrastructure.search import SearchFilters, listing_index
+from src.infrastructure.tracing import tracer
 
 router = Router()
 logger = logging.getLogger(__name__)
 
 ITEMS_PER_PAGE = 2
+# Description length on a compact card, and on a photo caption in general
+# (captions are limited to 1024 characters).
+CARD_DESCRIPTION_LENGTH = 200
+CAPTION_DESCRIPTION_LENGTH = 500
 
 
 class ListingContext(NamedTuple):
     """Container for listing display data to avoid too many arguments."""
 
     text: str
-    media_group: List[InputMediaPhoto]
+    photo_urls: List[str]
     has_prev: bool
     has_next: bool
     offset: int
     current_item: Dict[str, Any]
+    saved: bool = False
+    details: str = ""
 
 
 async def _cleanup_batch_messages(message: Message, state: FSMContext):
@@ -62,29 +100,57 @@ async def _cleanup_batch_messages(message: Message, state: FSMContext):
     await state.update_data(batch_msg_ids=[], geo_msg_id=None, menu_msg_id=None)
 
 
-def _prepare_media_group(images: List[Dict[str, Any]]) -> List[InputMediaPhoto]:
+def _photo_urls(images: List[Dict[str, Any]]) -> List[str]:
     """
-    Prepares a list of InputMediaPhoto for sending an album.
+    Returns the photo URLs of a listing, or the placeholder when it has none.
     Limits the number of images to 10 (Telegram API limit).
     """
-    media_group = []
     if images:
-        for img in images[:10]:
-            media_group.append(InputMediaPhoto(media=img["image_url"]))
-    else:
-        media_group.append(
-            InputMediaPhoto(media="https://via.placeholder.com/600x400?text=No+Photo")
+        return [img["image_url"] for img in images[:10]]
+    return [PLACEHOLDER_PHOTO_URL]
+
+
+def _prepare_media_group(media: List[str]) -> List[InputMediaPhoto]:
+    """
+    Prepares a list of InputMediaPhoto (file_ids or URLs) for sending an album.
+    """
+    return [InputMediaPhoto(media=item) for item in media]
+
+
+async def _send_album(
+    message: Message, photo_cache: PhotoFileCache, context: ListingContext
+) -> List[Message]:
+    """
+    Sends the listing photos, by cached file_id where possible, and caches
+    the file_ids Telegram assigns to photos that were sent by URL.
+    """
+    item = context.current_item
+    version = item.get("updated_at")
+    media = await photo_cache.resolve(item["id"], context.photo_urls, version)
+    try:
+        album_messages = await message.answer_media_group(
+            media=_prepare_media_group(media)
         )
-    return media_group
+    except TelegramBadRequest:
+        if media == context.photo_urls:
+            raise
+        # A cached file_id was rejected: forget them and send by URL.
+        logger.warning("Cached photos of listing %s rejected.", item["id"])
+        await photo_cache.invalidate(item["id"], context.photo_urls)
+        media = context.photo_urls
+        album_messages = await message.answer_media_group(
+            media=_prepare_media_group(media)
+        )
+    if any(sent == url for sent, url in zip(media, context.photo_urls)):
+        await photo_cache.store(item["id"], context.photo_urls, album_messages, version)
+    return album_messages
 
 
-def _prepare_announcement_text(item: Dict[str, Any], mode: str) -> str:
+def _prepare_announcement_text(
+    item: Dict[str, Any], mode: str, with_contact: bool = True
+) -> str:
     """Helper to format announcement text."""
-    try:
-        price_val = float(item["price"])
-        price = f"${price_val:,.0f}".replace(",", " ")
-    except (ValueError, TypeError):
-        price = str(item.get("price", "N/A"))
+    price = format_price(item.get("price"))
 
     address = html.escape(item.get("address", ""))
     description = html.escape(item.get("description", "") or "")
@@ -98,55 +164,204 @@ def _prepare_announcement_text(item: Dict[str, Any], mode: str) -> str:
     )
 
     title_prefix = _("<b>MY LISTING</b>\n") if mode == "my" else ""
+    if mode == "nearby" and item.get("distance") is not None:
+        title_prefix = _("<i>{distance:.1f} km away</i>\n").format(
+            distance=item["distance"] / 1000
+        )
 
-    return (
-        f"{title_prefix}"
-        f"<b>{price}</b> | {area} м²\n"
-        f"{address}\n\n"
-        f"{description}\n\n"
-        f"{phone}"
-    )
+    text = f"{title_prefix}<b>{price}</b> | {area} м²\n{address}\n\n{description}"
+    return f"{text}\n\n{phone}" if with_contact else text
+
+
+def _prepare_caption(
+    item: Dict[str, Any],
+    mode: str,
+    length: int = CAPTION_DESCRIPTION_LENGTH,
+    with_contact: bool = True,
+) -> str:
+    """
+    Announcement text for a photo caption, with the description cut to `length`.
+    """
+    description = item.get("description") or ""
+    if len(description) > length:
+        description = description[:length].rstrip() + "…"
+        item = {**item, "description": description}
+    return _prepare_announcement_text(item, mode, with_contact)
+
+
+async def _remember_listing(
+    state: FSMContext,
+    item: Dict[str, Any],
+    msg_ids: List[int],
+    card: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Records the messages, coordinates and card data of a listing on the page.
+    """
+    data = await state.get_data()
+    current_batch_ids = data.get("batch_msg_ids", [])
+    current_batch_ids.extend(msg_ids)
+
+    batch_coords = data.get("batch_coords", {})
+    if item.get("latitude") and item.get("longitude"):
+        batch_coords[str(item["id"])] = {
+            "lat": item["latitude"],
+            "lon": item["longitude"],
+            "title": f"{format_price(item.get('price'))} | {item.get('address', '')}",
+        }
+
+    update: Dict[str, Any] = {
+        "batch_msg_ids": current_batch_ids,
+        "batch_coords": batch_coords,
+    }
+    if card is not None:
+        batch_cards = data.get("batch_cards", {})
+        batch_cards[str(item["id"])] = card
+        update["batch_cards"] = batch_cards
+    await state.update_data(**update)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+async def _send_photo(
+    photo_cache: PhotoFileCache,
+    listing_id: int,
+    urls: List[str],
+    index: int,
+    version: Optional[str],
+    send: Callable[[str], Awaitable[Any]],
+) -> Any:
+    """
+    Sends (or edits in) one photo of a listing through `send`, by cached
+    file_id where possible, and caches the file_id of a photo sent by URL.
+    """
+    media = await photo_cache.resolve(listing_id, urls, version)
+    try:
+        sent = await send(media[index])
+    except TelegramBadRequest:
+        if media[index] == urls[index]:
+            raise
+        logger.warning("Cached photos of listing %s rejected.", listing_id)
+        await photo_cache.invalidate(listing_id, urls)
+        media = list(urls)
+        sent = await send(urls[index])
+    if media[index] == urls[index] and isinstance(sent, Message):
+        await photo_cache.store_photo(listing_id, urls, index, sent, version)
+    return sent
+
+
+async def _send_listing_card(
+    message: Message,
+    state: FSMContext,
+    photo_cache: PhotoFileCache,
+    context: ListingContext,
+) -> None:
+    """
+    Sends a listing as a compact card: its first photo with a short caption.
+    The other photos and the full text are loaded on demand.
+    """
+    item = context.current_item
+    urls = context.photo_urls
+    try:
+        card_msg = await _send_photo(
+            photo_cache,
+            item["id"],
+            urls,
+            0,
+            item.get("updated_at"),
+            lambda media: message.answer_photo(
+                media,
+                caption=context.text,
+                reply_markup=get_card_keyboard(
+                    item["id"], len(urls), saved=context.saved
+                ),
+            ),
+        )
+        card = {
+            "photos": urls,
+            "version": item.get("updated_at"),
+            "summary": context.text,
+            "details": context.details,
+            "saved": context.saved,
+        }
+        await _remember_listing(state, item, [card_msg.message_id], card=card)
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("Failed to send listing card: %s", e)
 
 
 async def _send_listing_content(
-    message: Message, state: FSMContext, context: ListingContext
+    message: Message,
+    state: FSMContext,
+    photo_cache: PhotoFileCache,
+    context: ListingContext,
 ) -> None:
     """Helper to send the album and control message."""
     try:
-        album_messages = await message.answer_media_group(media=context.media_group)
+        album_messages = await _send_album(message, photo_cache, context)
         new_album_ids = [m.message_id for m in album_messages]
 
         control_msg = await message.answer(
             text=context.text,
-            reply_markup=get_item_keyboard(context.current_item["id"]),
+            reply_markup=get_item_keyboard(
+                context.current_item["id"], saved=context.saved
+            ),
         )
         new_album_ids.append(control_msg.message_id)
 
-        data = await state.get_data()
-        current_batch_ids = data.get("batch_msg_ids", [])
-        current_batch_ids.extend(new_album_ids)
-
-        batch_coords = data.get("batch_coords", {})
-        item = context.current_item
-        if item.get("latitude") and item.get("longitude"):
-            batch_coords[str(item["id"])] = {
-                "lat": item["latitude"],
-                "lon": item["longitude"],
-            }
-
-        await state.update_data(
-            batch_msg_ids=current_batch_ids, batch_coords=batch_coords
-        )
+        await _remember_listing(state, context.current_item, new_album_ids)
         await asyncio.sleep(0.3)
 
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("Failed to send listing message: %s", e)
 
 
+async def _fetch_favorites(
+    telegram_id: int, offset: int
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Helper to fetch a page of saved listings from the synced local mirror,
+    and whether more saved ids follow it.
+    """
+    ids = await favorite_ids(telegram_id, offset, ITEMS_PER_PAGE + 1)
+    # Ids the mirror lacks are skipped; the sync unsaves purged listings.
+    listings = await get_listings(ids[:ITEMS_PER_PAGE])
+    return listings, len(ids) > ITEMS_PER_PAGE
+
+
 async def _fetch_listings(
-    user: BotUser, mode: str, offset: int
+    user: UserAuth, data: Dict[str, Any], offset: int
 ) -> Optional[List[Dict[str, Any]]]:
-    """Helper to fetch listings from API."""
+    """
+    Helper to fetch listings from the local mirror (search and nearby modes,
+    and all listings once it is synced), or from the API.
+    """
+    mode = data.get("listing_mode", "all")
+    if mode == "search":
+        filters = SearchFilters(**data.get("search_filters", {}))
+        ids = listing_index.search(
+            filters,
+            limit=ITEMS_PER_PAGE + 1,
+            offset=offset,
+            max_id=data.get("snapshot_id"),
+        )
+        return await get_listings(ids)
+    if mode == "nearby":
+        point = data["nearby_point"]
+        return await nearby_listings(
+            point["lat"],
+            point["lon"],
+            ITEMS_PER_PAGE + 1,
+            offset=offset,
+            max_distance=get_settings().NEARBY_RADIUS_KM * 1000,
+            max_id=data.get("snapshot_id"),
+        )
+    if mode == "all" and data.get("snapshot_id") is not None:
+        # Pages stay consistent while the feed changes: newer listings are
+        # left out until browsing starts over.
+        return await latest_listings(
+            ITEMS_PER_PAGE + 1, offset=offset, max_id=data["snapshot_id"]
+        )
+
     api = SwipeApiClient(user=user)
     try:
         fetch_func = (
@@ -163,8 +378,9 @@ async def _fetch_listings(
 
 
 # pylint: disable=too-many-locals, too-many-statements
+@tracer.traced("show_listings_batch")
 async def show_listings_batch(
-    message: Message, state: FSMContext, user: BotUser, offset: int
+    message: Message, state: FSMContext, redis: Redis, user: UserAuth, offset: int
 ):
     """
     Fetches a batch of listings from the API and displays them sequentially.
@@ -173,7 +389,11 @@ async def show_listings_batch(
     data = await state.get_data()
     mode = data.get("listing_mode", "all")
 
-    listings = await _fetch_listings(user, mode, offset)
+    if mode == "favorites":
+        listings, has_next = await _fetch_favorites(user.telegram_id, offset)
+    else:
+        listings = await _fetch_listings(user, data, offset)
+        has_next = listings is not None and len(listings) > ITEMS_PER_PAGE
 
     if listings is None:
         await message.answer(_("Error loading listings."))
@@ -182,6 +402,26 @@ async def show_listings_batch(
     if not listings:
         if offset > 0:
             await message.answer(_("No more listings."))
+        elif mode == "nearby":
+            await message.answer(
+                _("No listings found within {radius:g} km.").format(
+                    radius=get_settings().NEARBY_RADIUS_KM
+                ),
+                reply_markup=get_back_to_menu_keyboard(),
+            )
+        elif mode == "search":
+            await message.answer(
+                _("No listings match your search."),
+                reply_markup=get_back_to_menu_keyboard(),
+            )
+        elif mode == "favorites":
+            await message.answer(
+                _(
+                    "You have no saved listings yet. Press <b>☆ Save</b> "
+                    "under a listing to keep it here."
+                ),
+                reply_markup=get_back_to_menu_keyboard(),
+            )
         else:
             msg = (
                 _("You haven't created any listings yet.")
@@ -193,34 +433,52 @@ async def show_listings_batch(
 
     await _cleanup_batch_messages(message, state)
 
-    has_next = len(listings) > ITEMS_PER_PAGE
     has_prev = offset > 0
 
     items_to_show = listings[:ITEMS_PER_PAGE]
 
-    await state.update_data(batch_msg_ids=[], batch_coords={})
+    await state.update_data(batch_msg_ids=[], batch_coords={}, batch_cards={})
+    photo_cache = PhotoFileCache(redis, message.bot.id)
+    as_cards = mode in get_settings().LISTING_CARD_MODES
+    if mode == "favorites":
+        saved_ids = {item["id"] for item in items_to_show}
+    else:
+        saved_ids = await saved_listing_ids(user.telegram_id) if user else set()
 
     for item in items_to_show:
-        text = _prepare_announcement_text(item, mode)
-        media_group = _prepare_media_group(item.get("images", []))
+        if as_cards:
+            text = _prepare_caption(item, mode, CARD_DESCRIPTION_LENGTH)
+        else:
+            text = _prepare_announcement_text(item, mode)
 
         ctx = ListingContext(
             text=text,
-            media_group=media_group,
+            photo_urls=_photo_urls(item.get("images", [])),
             has_prev=False,
             has_next=False,
             offset=offset,
             current_item=item,
+            saved=item["id"] in saved_ids,
+            details=_prepare_caption(item, mode) if as_cards else "",
         )
-        await _send_listing_content(message, state, ctx)
+        if as_cards:
+            await _send_listing_card(message, state, photo_cache, ctx)
+        else:
+            await _send_listing_content(message, state, photo_cache, ctx)
 
+    data = await state.get_data()
     page_num = (offset // ITEMS_PER_PAGE) + 1
     nav_msg = await message.answer(
         text=_("**Announcement Page {page}**").format(page=page_num),
-        reply_markup=get_listings_reply_keyboard(has_prev, has_next),
+        reply_markup=get_listings_reply_keyboard(
+            has_prev,
+            has_next,
+            can_save=mode == "search",
+            can_map=get_settings().MAP_SNAPSHOT_ENABLED
+            and bool(data.get("batch_coords")),
+        ),
     )
 
-    data = await state.get_data()
     batch_ids = data.get("batch_msg_ids", [])
     batch_ids.append(nav_msg.message_id)
     await state.update_data(batch_msg_ids=batch_ids, offset=offset)
@@ -230,40 +488,70 @@ async def show_listings_batch(
 
 
 @router.callback_query(MenuCallback.filter(F.action == "listings"))
-async def start_listings(query: CallbackQuery, state: FSMContext):
+async def start_listings(query: CallbackQuery, state: FSMContext, redis: Redis):
     """
     Enters listing browsing mode (All listings).
     """
-    user = await BotUser.find_one(BotUser.telegram_id == query.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == query.from_user.id, projection_model=UserAuth
+    )
+    snapshot_id = await listing_watermark() if listing_index.ready else None
     await state.set_state(ListingsSG.Browsing)
-    await state.update_data(offset=0, listing_mode="all")
+    await state.update_data(offset=0, listing_mode="all", snapshot_id=snapshot_id)
     await query.message.delete()
 
-    await show_listings_batch(query.message, state, user, offset=0)
+    await show_listings_batch(query.message, state, redis, user, offset=0)
 
 
 @router.callback_query(MenuCallback.filter(F.action == "my_listings"))
-async def start_my_listings(query: CallbackQuery, state: FSMContext):
+async def start_my_listings(query: CallbackQuery, state: FSMContext, redis: Redis):
     """
     Enters listing browsing mode (My Listings).
     """
-    user = await BotUser.find_one(BotUser.telegram_id == query.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == query.from_user.id, projection_model=UserAuth
+    )
     await state.set_state(ListingsSG.Browsing)
     await state.update_data(offset=0, listing_mode="my")
     await query.message.delete()
 
-    await show_listings_batch(query.message, state, user, offset=0)
+    await show_listings_batch(query.message, state, redis, user, offset=0)
+
+
+@router.callback_query(MenuCallback.filter(F.action == "favorites"))
+async def start_favorites(query: CallbackQuery, state: FSMContext, redis: Redis):
+    """
+    Enters listing browsing mode (Saved listings). They are served from the
+    local mirror, so not before its first full sync.
+    """
+    if not listing_index.ready:
+        await query.answer(
+            _("Saved listings are still loading, please try again in a minute."),
+            show_alert=True,
+        )
+        return
+
+    user = await BotUser.find_one(
+        BotUser.telegram_id == query.from_user.id, projection_model=UserAuth
+    )
+    await state.set_state(ListingsSG.Browsing)
+    await state.update_data(offset=0, listing_mode="favorites")
+    await query.message.delete()
+
+    await show_listings_batch(query.message, state, redis, user, offset=0)
 
 
 # --- PAGINATION HANDLERS (Reply Buttons) ---
 
 
-@router.message(ListingsSG.Browsing, F.text == "➡️")
-async def page_next_reply(message: Message, state: FSMContext):
+@router.message(ListingsSG.Browsing, ActionFilter(TextAction.PAGE_NEXT))
+async def page_next_reply(message: Message, state: FSMContext, redis: Redis):
     """
     Handles Next Page button.
     """
-    user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == message.from_user.id, projection_model=UserAuth
+    )
     data = await state.get_data()
     new_offset = data.get("offset", 0) + ITEMS_PER_PAGE
 
@@ -272,15 +560,17 @@ async def page_next_reply(message: Message, state: FSMContext):
     except Exception:  # pylint: disable=broad-exception-caught
         pass
 
-    await show_listings_batch(message, state, user, new_offset)
+    await show_listings_batch(message, state, redis, user, new_offset)
 
 
-@router.message(ListingsSG.Browsing, F.text == "⬅️")
-async def page_prev_reply(message: Message, state: FSMContext):
+@router.message(ListingsSG.Browsing, ActionFilter(TextAction.PAGE_PREV))
+async def page_prev_reply(message: Message, state: FSMContext, redis: Redis):
     """
     Handles Previous Page button.
     """
-    user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == message.from_user.id, projection_model=UserAuth
+    )
     data = await state.get_data()
     new_offset = max(0, data.get("offset", 0) - ITEMS_PER_PAGE)
 
@@ -289,7 +579,7 @@ async def page_prev_reply(message: Message, state: FSMContext):
     except Exception:  # pylint: disable=broad-exception-caught
         pass
 
-    await show_listings_batch(message, state, user, new_offset)
+    await show_listings_batch(message, state, redis, user, new_offset)
 
 
 @router.callback_query(ListingCallback.filter(F.action == "geo"))
@@ -326,7 +616,181 @@ async def show_geolocation(
         await query.answer(_("Location not found for this item."), show_alert=True)
 
 
-@router.message(ListingsSG.Browsing, F.text == __("Back to Menu"))
+def _located_points(located: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+    points = []
+    for coords in located:
+        try:
+            points.append((float(coords["lat"]), float(coords["lon"])))
+        except (TypeError, ValueError):
+            continue
+    return points
+
+
+@router.message(ListingsSG.Browsing, ActionFilter(TextAction.SHOW_MAP))
+async def show_page_map(message: Message, state: FSMContext, redis: Redis):
+    """
+    Shows all located listings of the page on one map with numbered
+    markers, in place of the previous location or map message.
+    """
+    try:
+        await message.delete()
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+    data = await state.get_data()
+    located = [
+        coords
+        for coords in data.get("batch_coords", {}).values()
+        if _located_points([coords])
+    ]
+    if not located:
+        msg = await message.answer(_("No listings on this page have a location."))
+        batch_ids = data.get("batch_msg_ids", [])
+        batch_ids.append(msg.message_id)
+        await state.update_data(batch_msg_ids=batch_ids)
+        return
+
+    prev_geo_id = data.get("geo_msg_id")
+    if prev_geo_id:
+        try:
+            await message.bot.delete_message(message.chat.id, prev_geo_id)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+    settings = get_settings()
+    snapshots = MapSnapshots(
+        redis,
+        message.bot.id,
+        TileStore(settings.MAP_TILES_PATH, settings.MAP_TILE_URL),
+        max_zoom=settings.MAP_MAX_ZOOM,
+    )
+    points = _located_points(located)
+    snapshot = await snapshots.resolve(points)
+    caption = "\n".join(
+        f"<b>{number}.</b> {html.escape(located[index].get('title', ''))}"
+        for number, index in enumerate(snapshot.order, start=1)
+    )
+    try:
+        map_msg = await message.answer_photo(snapshot.photo, caption=caption)
+    except TelegramBadRequest:
+        if not isinstance(snapshot.photo, str):
+            raise
+        logger.warning("Cached page map %s rejected.", snapshot.key)
+        await snapshots.invalidate(snapshot.key)
+        snapshot = await snapshots.resolve(points)
+        map_msg = await message.answer_photo(snapshot.photo, caption=caption)
+    if not isinstance(snapshot.photo, str):
+        await snapshots.store(snapshot.key, map_msg)
+    await state.update_data(geo_msg_id=map_msg.message_id)
+
+
+async def _listing_card(
+    query: CallbackQuery, callback_data: ListingCallback, state: FSMContext
+) -> Optional[Dict[str, Any]]:
+    data = await state.get_data()
+    card = data.get("batch_cards", {}).get(str(callback_data.id))
+    if card is None:
+        await query.answer(_("This listing is no longer shown."), show_alert=True)
+    return card
+
+
+@router.callback_query(ListingCallback.filter(F.action == "photos"))
+async def show_listing_photo(
+    query: CallbackQuery,
+    callback_data: ListingCallback,
+    state: FSMContext,
+    redis: Redis,
+):
+    """
+    Shows one photo of a card's gallery, editing the card in place. A photo
+    is only sent when the user pages to it.
+    """
+    card = await _listing_card(query, callback_data, state)
+    if card is None:
+        return
+    photos = card["photos"]
+    index = (callback_data.index or 0) % len(photos)
+    caption = f"{card['summary']}\n\n<i>{index + 1}/{len(photos)}</i>"
+    keyboard = get_card_keyboard(
+        callback_data.id, len(photos), saved=card["saved"], index=index
+    )
+    try:
+        await _send_photo(
+            PhotoFileCache(redis, query.bot.id),
+            callback_data.id,
+            photos,
+            index,
+            card["version"],
+            lambda media: query.message.edit_media(
+                InputMediaPhoto(media=media, caption=caption), reply_markup=keyboard
+            ),
+        )
+    except TelegramBadRequest as e:
+        logger.warning(
+            "Failed to show photo %s of listing %s: %s", index, callback_data.id, e
+        )
+    await query.answer()
+
+
+@router.callback_query(ListingCallback.filter(F.action.in_({"details", "card"})))
+async def toggle_listing_details(
+    query: CallbackQuery, callback_data: ListingCallback, state: FSMContext
+):
+    """
+    Switches a card's caption between the short text and the full one.
+    """
+    card = await _listing_card(query, callback_data, state)
+    if card is None:
+        return
+    details = callback_data.action == "details"
+    try:
+        await query.message.edit_caption(
+            caption=card["details"] if details else card["summary"],
+            reply_markup=get_card_keyboard(
+                callback_data.id,
+                len(card["photos"]),
+                saved=card["saved"],
+                details=details,
+            ),
+        )
+    except TelegramBadRequest as e:
+        logger.warning("Failed to edit card of listing %s: %s", callback_data.id, e)
+    await query.answer()
+
+
+@router.callback_query(ListingCallback.filter(F.action == "fav"))
+async def toggle_saved_listing(
+    query: CallbackQuery, callback_data: ListingCallback, state: FSMContext
+):
+    """
+    Saves or unsaves a listing and flips its button in place.
+    """
+    saved = await toggle_favorite(
+        query.from_user.id, callback_data.id, get_settings().FAVORITES_LIMIT
+    )
+    logger.info(
+        "User %s %s listing %s",
+        query.from_user.id,
+        "saved" if saved else "unsaved",
+        callback_data.id,
+    )
+    data = await state.get_data()
+    batch_cards = data.get("batch_cards", {})
+    if str(callback_data.id) in batch_cards:
+        batch_cards[str(callback_data.id)]["saved"] = saved
+        await state.update_data(batch_cards=batch_cards)
+    markup = query.message.reply_markup
+    await query.message.edit_reply_markup(
+        reply_markup=(
+            set_saved_button(markup, callback_data.id, saved)
+            if markup
+            else get_item_keyboard(callback_data.id, saved=saved)
+        )
+    )
+    await query.answer(_("Listing saved.") if saved else _("Removed from saved."))
+
+
+@router.message(ListingsSG.Browsing, ActionFilter(TextAction.BACK_TO_MENU))
 async def exit_listings(message: Message, state: FSMContext):
     """
     Exits the browsing mode, clears all messages, returns to Main Menu.
@@ -0,0 +1,168 @@
+"""src/bot/handlers/announcement/inline.py."""
+
+import asyncio
+import logging
+from typing import List, Optional, Union
+from aiogram import Router
+from aiogram.types import (
+    InlineQuery,
+    InlineQueryResultCachedPhoto,
+    InlineQueryResultPhoto,
+    InlineQueryResultsButton,
+)
+from aiogram.utils.i18n import I18n
+from aiogram.utils.i18n import gettext as _
+from redis.asyncio import Redis
+from src.bot.utils import (
+    InlinePage,
+    InlineResultCache,
+    PhotoFileCache,
+    QueryDebouncer,
+    format_price,
+    normalize_query,
+)
+from src.config import get_settings
+from src.database import BotUser, UserAuth, get_listings, latest_listings
+from src.infrastructure.metrics import INLINE_QUERIES_TOTAL
+from src.infrastructure.search import SearchFilters, listing_index
+from .get_announcement import _photo_urls, _prepare_caption
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+# Telegram-side cache time of an empty answer while the mirror loads.
+NOT_READY_CACHE_TIME = 5
+
+debouncer = QueryDebouncer()
+
+
+async def _search_page(
+    query: str, offset: int, limit: int, photo_cache: PhotoFileCache
+) -> Optional[InlinePage]:
+    """
+    Renders a page of listings matching the query from the local mirror, or
+    returns None while the mirror is not synced.
+    """
+    if not listing_index.ready:
+        return None
+    if query:
+        ids = listing_index.search(
+            SearchFilters(keywords=[query]), limit=limit + 1, offset=offset
+        )
+        listings = await get_listings(ids)
+    else:
+        listings = await latest_listings(limit + 1, offset=offset)
+
+    photo_urls = [_photo_urls(item.get("images", [])) for item in listings[:limit]]
+    # Photos Telegram already has are sent by file_id, without a download.
+    media = await asyncio.gather(
+        *(
+            photo_cache.resolve(item["id"], urls, item.get("updated_at"))
+            for item, urls in zip(listings, photo_urls)
+        )
+    )
+    entries = [
+        {
+            "id": str(item["id"]),
+            "photo": resolved[0],
+            "cached": resolved[0] != urls[0],
+            "thumbnail": urls[0],
+            "title": f"{format_price(item.get('price'))} | {item.get('area', 0)} м²",
+            "description": item.get("address", ""),
+            # Shared results leave the bot; owners' phones stay inside it.
+            "caption": _prepare_caption(item, "all", with_contact=False),
+        }
+        for item, urls, resolved in zip(listings, photo_urls, media)
+    ]
+    next_offset = str(offset + limit) if len(listings) > limit else ""
+    return InlinePage(entries, next_offset)
+
+
+def _results(
+    page: InlinePage,
+) -> List[Union[InlineQueryResultCachedPhoto, InlineQueryResultPhoto]]:
+    results: List[Union[InlineQueryResultCachedPhoto, InlineQueryResultPhoto]] = []
+    for entry in page.entries:
+        if entry["cached"]:
+            results.append(
+                InlineQueryResultCachedPhoto(
+                    id=entry["id"],
+                    photo_file_id=entry["photo"],
+                    title=entry["title"],
+                    description=entry["description"],
+                    caption=entry["caption"],
+                )
+            )
+        else:
+            results.append(
+                InlineQueryResultPhoto(
+                    id=entry["id"],
+                    photo_url=entry["photo"],
+                    thumbnail_url=entry["thumbnail"],
+                    title=entry["title"],
+                    description=entry["description"],
+                    caption=entry["caption"],
+                )
+            )
+    return results
+
+
+@router.inline_query()
+async def inline_search(inline_query: InlineQuery, redis: Redis, i18n: I18n):
+    """
+    Answers "@bot <address>" with matching listings, so they can be shared
+    in any chat. Pages are cached in Redis and by Telegram; a query that
+    misses the cache waits for the user to stop typing before it searches.
+    Users who are not logged in get a button that opens the bot to log in.
+    """
+    settings = get_settings()
+    user = await BotUser.find_one(
+        BotUser.telegram_id == inline_query.from_user.id, projection_model=UserAuth
+    )
+    if not user or not user.api_access_token:
+        INLINE_QUERIES_TOTAL.labels("anonymous").inc()
+        await inline_query.answer(
+            [],
+            cache_time=NOT_READY_CACHE_TIME,
+            is_personal=True,
+            button=InlineQueryResultsButton(
+                text=_("Log in to search listings"), start_parameter="login"
+            ),
+        )
+        return
+
+    query = normalize_query(inline_query.query)
+    offset = int(inline_query.offset) if inline_query.offset.isdigit() else 0
+    locale = i18n.current_locale
+    cache = InlineResultCache(redis, inline_query.bot.id, settings.INLINE_CACHE_TTL)
+
+    page = await cache.get(query, offset, locale)
+    if page is not None:
+        INLINE_QUERIES_TOTAL.labels("hit").inc()
+    else:
+        # Scrolling to the next page is not typing; only first pages wait.
+        if offset == 0 and not await debouncer.settle(
+            inline_query.from_user.id,
+            inline_query.id,
+            settings.INLINE_DEBOUNCE_MS / 1000,
+        ):
+            INLINE_QUERIES_TOTAL.labels("debounced").inc()
+            return
+        photo_cache = PhotoFileCache(redis, inline_query.bot.id)
+        page = await _search_page(query, offset, settings.INLINE_PAGE_SIZE, photo_cache)
+        if page is None:
+            INLINE_QUERIES_TOTAL.labels("not_ready").inc()
+            await inline_query.answer(
+                [], cache_time=NOT_READY_CACHE_TIME, is_personal=True
+            )
+            return
+        INLINE_QUERIES_TOTAL.labels("miss").inc()
+        await cache.store(query, offset, locale, page)
+
+    await inline_query.answer(
+        _results(page),
+        cache_time=settings.INLINE_CACHE_TIME,
+        # Telegram must not serve these to a user who has logged out.
+        is_personal=True,
+        next_offset=page.next_offset,
+    )
@@ -0,0 +1,137 @@
+"""src/bot/handlers/announcement/saved_searches.py."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+from aiogram import Router, F
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
+from aiogram.utils.i18n import gettext as _
+from beanie import PydanticObjectId
+from src.bot.callbacks import MenuCallback, SavedSearchCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction
+from src.bot.keyboards.inline import get_saved_searches_keyboard
+from src.bot.states import ListingsSG
+from src.bot.utils import format_price
+from src.config import get_settings
+from src.database import SavedSearch
+from src.infrastructure.search import SearchFilters, subscription_index
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+
+def _format_range(
+    low: Optional[float], high: Optional[float], fmt: Callable[[float], str]
+) -> str:
+    if low is not None and high is not None:
+        return f"{fmt(low)}–{fmt(high)}"
+    if low is not None:
+        return _("from {value}").format(value=fmt(low))
+    return _("up to {value}").format(value=fmt(high))
+
+
+def describe_filters(filters: SearchFilters) -> str:
+    """
+    One-line summary of search filters, e.g. "$50 000–100 000 · 2 rooms".
+    """
+    parts = []
+    if filters.min_price is not None or filters.max_price is not None:
+        parts.append(_format_range(filters.min_price, filters.max_price, format_price))
+    if filters.min_area is not None or filters.max_area is not None:
+        area = _format_range(filters.min_area, filters.max_area, lambda v: f"{v:g}")
+        parts.append(f"{area} м²")
+    if filters.rooms is not None:
+        parts.append(_("{count} rooms").format(count=filters.rooms))
+    parts.extend(f"«{keyword}»" for keyword in filters.keywords)
+    return " · ".join(parts) or _("All listings")
+
+
+async def _saved_searches_view(
+    telegram_id: int,
+) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
+    searches: List[SavedSearch] = (
+        await SavedSearch.find(SavedSearch.telegram_id == telegram_id)
+        .sort(+SavedSearch.created_at)
+        .to_list()
+    )
+    if not searches:
+        return (
+            _(
+                "You have no search alerts. Run a search and press "
+                "<b>Save Search</b> to get new matching listings here."
+            ),
+            None,
+        )
+    lines = [_("<b>Search Alerts</b>")]
+    for number, saved in enumerate(searches, start=1):
+        lines.append(f"{number}. {describe_filters(SearchFilters(**saved.filters))}")
+    keyboard = get_saved_searches_keyboard([str(saved.id) for saved in searches])
+    return "\n".join(lines), keyboard
+
+
+@router.message(ListingsSG.Browsing, ActionFilter(TextAction.SAVE_SEARCH))
+async def save_search(message: Message, state: FSMContext):
+    """
+    Saves the search being browsed as an alert subscription.
+    """
+    data = await state.get_data()
+    if data.get("listing_mode") != "search":
+        return
+
+    telegram_id = message.from_user.id
+    filters = SearchFilters(**data.get("search_filters", {}))
+    stored = filters.model_dump(exclude_defaults=True)
+    existing = await SavedSearch.find(SavedSearch.telegram_id == telegram_id).to_list()
+    limit = get_settings().SAVED_SEARCHES_LIMIT
+    if any(saved.filters == stored for saved in existing):
+        text = _("This search is already saved.")
+    elif len(existing) >= limit:
+        text = _(
+            "You already have {limit} search alerts. Delete one in your profile first."
+        ).format(limit=limit)
+    else:
+        saved = SavedSearch(
+            telegram_id=telegram_id,
+            filters=stored,
+            created_at=datetime.now(timezone.utc),
+        )
+        await saved.insert()
+        subscription_index.add(str(saved.id), telegram_id, filters)
+        logger.info("User %s saved search %s", telegram_id, stored)
+        text = _("Search saved. I will message you about new matching listings.")
+
+    msg = await message.answer(text)
+    batch_ids = data.get("batch_msg_ids", [])
+    batch_ids.append(msg.message_id)
+    await state.update_data(batch_msg_ids=batch_ids)
+
+
+@router.callback_query(MenuCallback.filter(F.action == "alerts"))
+async def show_saved_searches(query: CallbackQuery):
+    """
+    Lists the user's search alerts with delete buttons.
+    """
+    text, keyboard = await _saved_searches_view(query.from_user.id)
+    await query.message.answer(text, reply_markup=keyboard)
+    await query.answer()
+
+
+@router.callback_query(SavedSearchCallback.filter(F.action == "delete"))
+async def delete_saved_search(query: CallbackQuery, callback_data: SavedSearchCallback):
+    """
+    Deletes a search alert and refreshes the list in place.
+    """
+    saved = await SavedSearch.find_one(
+        SavedSearch.id == PydanticObjectId(callback_data.id),
+        SavedSearch.telegram_id == query.from_user.id,
+    )
+    if saved:
+        subscription_index.remove(str(saved.id))
+        await saved.delete()
+        logger.info("User %s deleted saved search %s", query.from_user.id, saved.id)
+
+    text, keyboard = await _saved_searches_view(query.from_user.id)
+    await query.message.edit_text(text, reply_markup=keyboard)
+    await query.answer(_("Search alert deleted."))
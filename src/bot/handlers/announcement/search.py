@@ -0,0 +1,324 @@
+"""src/bot/handlers/announcement/search.py."""
+
+import logging
+import re
+from typing import Optional, Tuple
+from aiogram import Router, F
+from aiogram.filters import Command, CommandObject
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.types import Message, CallbackQuery
+from aiogram.utils.i18n import gettext as _
+from redis.asyncio import Redis
+from src.bot.callbacks import MenuCallback
+from src.bot.i18n import TextAction, text_actions
+from src.bot.keyboards.inline import get_main_menu_keyboard
+from src.bot.keyboards.reply import get_location_keyboard, get_skip_keyboard
+from src.bot.states import ListingsSG, SearchSG
+from src.bot.utils import (
+    handle_cancel,
+    cleanup_last_step,
+    remove_reply_keyboard,
+    require_login,
+)
+from src.database import listing_watermark
+from src.config import get_settings
+from src.infrastructure.search import SearchFilters, listing_index
+from .get_announcement import show_listings_batch
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+_NUMBER = r"(\d+(?:[.,]\d+)?)"
+_RANGE = re.compile(rf"^{_NUMBER}?\s*([-–—])?\s*{_NUMBER}?$")
+
+# Wizard order; each step goes back to the previous one.
+STEPS = [
+    SearchSG.InputPrice,
+    SearchSG.InputArea,
+    SearchSG.InputRooms,
+    SearchSG.InputKeywords,
+]
+
+
+def parse_range(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Parses "50000-100000", "50000-" or "-100000"; a single number is an
+    upper bound. Raises ValueError on anything else.
+    """
+    match = _RANGE.match(text.strip().replace(" ", ""))
+    if not match or not (match.group(1) or match.group(3)):
+        raise ValueError(text)
+    low, dash, high = match.groups()
+    low = float(low.replace(",", ".")) if low else None
+    high = float(high.replace(",", ".")) if high else None
+    if not dash:
+        low, high = None, low
+    if low is not None and high is not None and low > high:
+        raise ValueError(text)
+    return low, high
+
+
+def _prompt(step: State) -> str:
+    prompts = {
+        SearchSG.InputPrice: _(
+            "<b>Search Listings</b>\n\n"
+            "Step 1/4: Enter the <b>price range</b> ($), "
+            "e.g. 50000-100000, 50000- or -100000:"
+        ),
+        SearchSG.InputArea: _(
+            "Step 2/4: Enter the <b>area range</b> (sq. m), e.g. 40-80:"
+        ),
+        SearchSG.InputRooms: _("Step 3/4: Enter the <b>number of rooms</b>:"),
+        SearchSG.InputKeywords: _(
+            "Step 4/4: Enter <b>address keywords</b> (street, district):"
+        ),
+    }
+    return prompts[step]
+
+
+async def _ask(message: Message, state: FSMContext, step: State) -> None:
+    """
+    Switches to a wizard step and sends its prompt.
+    """
+    await state.set_state(step)
+    msg = await message.answer(
+        text=_prompt(step),
+        reply_markup=get_skip_keyboard(with_back=step != STEPS[0]),
+    )
+    await state.update_data(last_bot_msg_id=msg.message_id)
+
+
+async def _go_back(message: Message, state: FSMContext) -> bool:
+    """
+    Returns to the previous step if the 'Back' button was pressed.
+    """
+    if text_actions.resolve(message.text) is not TextAction.BACK:
+        return False
+    await cleanup_last_step(state, message)
+    previous = STEPS[max(STEPS.index(await _current_step(state)) - 1, 0)]
+    await _ask(message, state, previous)
+    return True
+
+
+async def _current_step(state: FSMContext) -> State:
+    current = await state.get_state()
+    return next(step for step in STEPS if step.state == current)
+
+
+async def _update_filters(state: FSMContext, **values) -> None:
+    data = await state.get_data()
+    filters = {**data.get("search_filters", {}), **values}
+    await state.update_data(search_filters=filters)
+
+
+async def _browse_local(
+    message: Message, state: FSMContext, redis: Redis, **data
+) -> None:
+    """
+    Shows the first page of results served from the local listings mirror;
+    `data` selects the listing mode and its parameters.
+    """
+    user = await require_login(message, message.from_user.id)
+    if user is None:
+        await state.clear()
+        await remove_reply_keyboard(message)
+        return
+
+    if not listing_index.ready:
+        await state.clear()
+        await remove_reply_keyboard(message)
+        await message.answer(
+            _("Search is still loading listings, please try again in a minute."),
+            reply_markup=get_main_menu_keyboard(),
+        )
+        return
+
+    await state.set_state(ListingsSG.Browsing)
+    await state.update_data(offset=0, snapshot_id=await listing_watermark(), **data)
+    await show_listings_batch(message, state, redis, user, offset=0)
+
+
+async def run_search(
+    message: Message, state: FSMContext, redis: Redis, filters: SearchFilters
+) -> None:
+    """
+    Shows the first page of listings matching the filters from the local index.
+    """
+    logger.info("User %s searches %s", message.from_user.id, filters.model_dump())
+    await _browse_local(
+        message,
+        state,
+        redis,
+        listing_mode="search",
+        search_filters=filters.model_dump(exclude_defaults=True),
+    )
+
+
+@router.message(Command("search"))
+async def cmd_search(
+    message: Message, command: CommandObject, state: FSMContext, redis: Redis
+):
+    """
+    Handles /search: `/search <keywords>` searches by address right away,
+    a bare /search opens the filter wizard.
+    """
+    await state.clear()
+    if not await require_login(message, message.from_user.id):
+        return
+
+    if command.args:
+        await run_search(message, state, redis, SearchFilters(keywords=[command.args]))
+        return
+
+    await state.set_data({"search_filters": {}})
+    await _ask(message, state, SearchSG.InputPrice)
+
+
+@router.callback_query(MenuCallback.filter(F.action == "search"))
+async def start_search(query: CallbackQuery, state: FSMContext):
+    """
+    Opens the filter wizard from the main menu.
+    """
+    await state.clear()
+    if not await require_login(query.message, query.from_user.id):
+        return
+
+    await state.set_data({"search_filters": {}})
+    await query.message.delete()
+    await _ask(query.message, state, SearchSG.InputPrice)
+
+
+async def _input_range(
+    message: Message, state: FSMContext, field: str, next_step: State
+) -> None:
+    """
+    Shared handler for the price and area range steps.
+    """
+    if await handle_cancel(message, state) or await _go_back(message, state):
+        return
+
+    if text_actions.resolve(message.text) is TextAction.SKIP:
+        low, high = None, None
+    else:
+        try:
+            low, high = parse_range(message.text or "")
+        except ValueError:
+            msg = await message.answer(
+                _("Please enter a range like 50000-100000, 50000- or -100000.")
+            )
+            await state.update_data(last_bot_msg_id=msg.message_id)
+            return
+
+    await cleanup_last_step(state, message)
+    await _update_filters(state, **{f"min_{field}": low, f"max_{field}": high})
+    await _ask(message, state, next_step)
+
+
+@router.message(SearchSG.InputPrice)
+async def input_price_range(message: Message, state: FSMContext):
+    """
+    Saves the price range, asks for the area range.
+    """
+    await _input_range(message, state, "price", SearchSG.InputArea)
+
+
+@router.message(SearchSG.InputArea)
+async def input_area_range(message: Message, state: FSMContext):
+    """
+    Saves the area range, asks for the number of rooms.
+    """
+    await _input_range(message, state, "area", SearchSG.InputRooms)
+
+
+@router.message(SearchSG.InputRooms)
+async def input_rooms(message: Message, state: FSMContext):
+    """
+    Saves the number of rooms, asks for address keywords.
+    """
+    if await handle_cancel(message, state) or await _go_back(message, state):
+        return
+
+    rooms = None
+    if text_actions.resolve(message.text) is not TextAction.SKIP:
+        try:
+            rooms = int(message.text or "")
+            if rooms <= 0:
+                raise ValueError
+        except ValueError:
+            msg = await message.answer(_("Please enter a whole number of rooms."))
+            await state.update_data(last_bot_msg_id=msg.message_id)
+            return
+
+    await cleanup_last_step(state, message)
+    await _update_filters(state, rooms=rooms)
+    await _ask(message, state, SearchSG.InputKeywords)
+
+
+@router.message(SearchSG.InputKeywords)
+async def input_keywords(message: Message, state: FSMContext, redis: Redis):
+    """
+    Saves the address keywords and shows the results.
+    """
+    if await handle_cancel(message, state) or await _go_back(message, state):
+        return
+
+    keywords = []
+    if text_actions.resolve(message.text) is not TextAction.SKIP:
+        keywords = [message.text or ""]
+
+    await cleanup_last_step(state, message)
+    await _update_filters(state, keywords=keywords)
+    data = await state.get_data()
+    await run_search(message, state, redis, SearchFilters(**data["search_filters"]))
+
+
+@router.callback_query(MenuCallback.filter(F.action == "nearby"))
+async def start_nearby(query: CallbackQuery, state: FSMContext):
+    """
+    Asks for the user's location to list the listings around it.
+    """
+    await state.clear()
+    if not await require_login(query.message, query.from_user.id):
+        return
+
+    await query.message.delete()
+    await state.set_state(SearchSG.InputLocation)
+    msg = await query.message.answer(
+        text=_(
+            "Share your <b>location</b> using the button below to see "
+            "listings within {radius:g} km:"
+        ).format(radius=get_settings().NEARBY_RADIUS_KM),
+        reply_markup=get_location_keyboard(),
+    )
+    await state.update_data(last_bot_msg_id=msg.message_id)
+
+
+@router.message(SearchSG.InputLocation, F.location)
+async def input_nearby_location(message: Message, state: FSMContext, redis: Redis):
+    """
+    Shows listings nearest to the shared location first.
+    """
+    await cleanup_last_step(state, message)
+    logger.info("User %s searches listings nearby", message.from_user.id)
+    await _browse_local(
+        message,
+        state,
+        redis,
+        listing_mode="nearby",
+        nearby_point={
+            "lat": message.location.latitude,
+            "lon": message.location.longitude,
+        },
+    )
+
+
+@router.message(SearchSG.InputLocation)
+async def input_nearby_invalid(message: Message, state: FSMContext):
+    """
+    Handles anything but a location at the "Near me" prompt.
+    """
+    if await handle_cancel(message, state):
+        return
+    msg = await message.answer(_("Please share your location using the button below."))
+    await state.update_data(last_bot_msg_id=msg.message_id)
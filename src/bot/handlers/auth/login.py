@@ -4,8 +4,11 @@ import logging
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, ReplyKeyboardRemove
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
+from beanie.operators import Set
 from src.bot.callbacks import MenuCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction, text_actions
 from src.bot.keyboards.reply import (
     get_cancel_keyboard,
     get_login_password_keyboard,
@@ -64,7 +67,7 @@ async def process_email(message: Message, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(LoginSG.InputPassword, F.text == __("Back"))
+@router.message(LoginSG.InputPassword, ActionFilter(TextAction.BACK))
 async def back_to_email(message: Message, state: FSMContext):
     """
     Handles the 'Back' button, returning to email input.
@@ -78,7 +81,7 @@ async def back_to_email(message: Message, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(LoginSG.InputPassword, F.text == __("Forgot Password?"))
+@router.message(LoginSG.InputPassword, ActionFilter(TextAction.FORGOT_PASSWORD))
 async def on_forgot_password_btn(message: Message, state: FSMContext):
     """
     Handles the 'Forgot Password' button, switching to the reset flow.
@@ -100,7 +103,10 @@ async def process_password(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text in [_("Back"), _("Forgot Password?")]:
+    if text_actions.resolve(message.text) in (
+        TextAction.BACK,
+        TextAction.FORGOT_PASSWORD,
+    ):
         return
 
     await cleanup_last_step(state, message)
@@ -117,11 +123,14 @@ async def process_password(message: Message, state: FSMContext):
     try:
         response = await api.auth.login(email=email, password=password)
 
-        user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
-        if user:
-            user.api_access_token = response["access_token"]
-            user.api_refresh_token = response["refresh_token"]
-            await user.save()
+        await BotUser.find_one(BotUser.telegram_id == message.from_user.id).update(
+            Set(
+                {
+                    BotUser.api_access_token: response["access_token"],
+                    BotUser.api_refresh_token: response["refresh_token"],
+                }
+            )
+        )
 
         await wait_msg.delete()
         await message.answer(
@@ -5,9 +5,12 @@ import logging
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery, ReplyKeyboardRemove
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
+from beanie.operators import Set
 
 from src.bot.callbacks import MenuCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction, text_actions
 from src.bot.keyboards.inline import get_start_keyboard, get_main_menu_keyboard
 from src.bot.keyboards.reply import (
     get_contact_keyboard,
@@ -37,7 +40,7 @@ async def start_reg(query: CallbackQuery, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(RegistrationSG.InputFirstName, F.text == __("Back"))
+@router.message(RegistrationSG.InputFirstName, ActionFilter(TextAction.BACK))
 async def back_to_start(message: Message, state: FSMContext):
     """Back from Step 1 -> Menu."""
     logger.info("User %s went back to start menu", message.from_user.id)
@@ -45,7 +48,7 @@ async def back_to_start(message: Message, state: FSMContext):
     await message.answer(_("Registration canceled."), reply_markup=get_start_keyboard())
 
 
-@router.message(RegistrationSG.InputLastName, F.text == __("Back"))
+@router.message(RegistrationSG.InputLastName, ActionFilter(TextAction.BACK))
 async def back_to_firstname(message: Message, state: FSMContext):
     """Back from Step 2 -> Step 1."""
     await cleanup_last_step(state, message)
@@ -56,7 +59,7 @@ async def back_to_firstname(message: Message, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(RegistrationSG.InputEmail, F.text == __("Back"))
+@router.message(RegistrationSG.InputEmail, ActionFilter(TextAction.BACK))
 async def back_to_lastname(message: Message, state: FSMContext):
     """Back from Step 3 -> Step 2."""
     await cleanup_last_step(state, message)
@@ -67,7 +70,7 @@ async def back_to_lastname(message: Message, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(RegistrationSG.InputPassword, F.text == __("Back"))
+@router.message(RegistrationSG.InputPassword, ActionFilter(TextAction.BACK))
 async def back_to_phone_reply(message: Message, state: FSMContext):
     """Back from Step 5 -> Step 4."""
     await cleanup_last_step(state, message)
@@ -150,7 +153,7 @@ async def input_email(message: Message, state: FSMContext):
     await state.update_data(last_bot_msg_id=msg.message_id)
 
 
-@router.message(RegistrationSG.InputPhone, F.text == __("Back"))
+@router.message(RegistrationSG.InputPhone, ActionFilter(TextAction.BACK))
 async def back_to_email_reply(message: Message, state: FSMContext):
     """
     Returns to Email input step (Step 4 -> Step 3).
@@ -174,7 +177,7 @@ async def input_phone(message: Message, state: FSMContext):
     if await handle_cancel(message, state):
         return
 
-    if message.text == _("Back"):
+    if text_actions.resolve(message.text) is TextAction.BACK:
         await back_to_email_reply(message, state)
         return
 
@@ -284,11 +287,14 @@ async def input_code(message: Message, state: FSMContext):
             email=data["email"], password=data["password"]
         )
 
-        user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
-        if user:
-            user.api_access_token = login_resp["access_token"]
-            user.api_refresh_token = login_resp["refresh_token"]
-            await user.save()
+        await BotUser.find_one(BotUser.telegram_id == message.from_user.id).update(
+            Set(
+                {
+                    BotUser.api_access_token: login_resp["access_token"],
+                    BotUser.api_refresh_token: login_resp["refresh_token"],
+                }
+            )
+        )
 
         await cleanup_last_step(state, message)
         await remove_reply_keyboard(message)
@@ -5,8 +5,11 @@ from aiogram import Router, F
 from aiogram.filters import CommandStart, Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
+from beanie.operators import Set
 from src.bot.callbacks import MenuCallback, LanguageCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction
 from src.bot.keyboards.inline import (
     get_start_keyboard,
     get_language_keyboard,
@@ -35,6 +38,10 @@ async def cmd_start(message: Message):
             language_code=message.from_user.language_code or "en",
         )
         await user.create()
+    elif not user.is_active:
+        logger.info("User %s is back, reactivating", user.telegram_id)
+        user.is_active = True
+        await user.save()
 
     if user.api_access_token:
         logger.info("User %s is logged in, showing main menu", user.telegram_id)
@@ -96,7 +103,7 @@ async def set_language(query: CallbackQuery, callback_data: LanguageCallback, i1
     await query.message.edit_text(text=_("Select an action:"), reply_markup=keyboard)
 
 
-@router.message(F.text == __("Cancel"))
+@router.message(ActionFilter(TextAction.CANCEL))
 async def cancel_action_reply(message: Message, state: FSMContext):
     """
     Handles the 'Cancel' text button (Global).
@@ -109,12 +116,10 @@ async def logout_user(query: CallbackQuery, state: FSMContext):
     """
     Logs out the user by clearing tokens from MongoDB.
     """
-    user = await BotUser.find_one(BotUser.telegram_id == query.from_user.id)
-    if user:
-        logger.info("User %s logged out", user.telegram_id)
-        user.api_access_token = None
-        user.api_refresh_token = None
-        await user.save()
+    await BotUser.find_one(BotUser.telegram_id == query.from_user.id).update(
+        Set({BotUser.api_access_token: None, BotUser.api_refresh_token: None})
+    )
+    logger.info("User %s logged out", query.from_user.id)
 
     await state.clear()
 
@@ -132,6 +137,7 @@ async def cmd_help(message: Message):
         text=_(
             "**Swipe Bot Help**\n\n"
             "/start - Main Menu\n"
+            "/search - Search Listings\n"
             "/profile - My Profile\n\n"
             "If you found a bug, please contact support."
         )
@@ -5,8 +5,10 @@ from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery, ReplyKeyboardRemove
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.utils.i18n import gettext as _, lazy_gettext as __
+from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import MenuCallback
+from src.bot.filters import ActionFilter
+from src.bot.i18n import TextAction
 from src.bot.keyboards.inline import (
     get_start_keyboard,
     get_profile_keyboard,
@@ -14,14 +16,16 @@ from src.bot.keyboards.inline import (
 )
 from src.bot.keyboards.reply import get_back_to_menu_keyboard
 from src.bot.states import ProfileSG
-from src.database import BotUser
+from src.database import BotUser, UserAuth
 from src.infrastructure.api import SwipeApiClient, SwipeAPIError
 
 router = Router()
 logger = logging.getLogger(__name__)
 
 
-async def _show_profile_logic(message: Message, user: BotUser, state: FSMContext):
+async def _show_profile_logic(
+    message: Message, user: UserAuth | None, state: FSMContext
+):
     """
     Reusable logic for fetching and showing profile with navigation.
     """
@@ -73,10 +77,13 @@ async def _show_profile_logic(message: Message, user: BotUser, state: FSMContext
 
 
 @router.callback_query(MenuCallback.filter(F.action == "profile"))
-async def show_profile_callback(query: CallbackQuery, user: BotUser, state: FSMContext):
+async def show_profile_callback(query: CallbackQuery, state: FSMContext):
     """
     Handles 'My Profile' button click from Main Menu.
     """
+    user = await BotUser.find_one(
+        BotUser.telegram_id == query.from_user.id, projection_model=UserAuth
+    )
     await query.message.delete()
     await _show_profile_logic(query.message, user, state)
     await query.answer()
@@ -87,11 +94,13 @@ async def show_profile_command(message: Message, state: FSMContext):
     """
     Handles /profile command.
     """
-    user = await BotUser.find_one(BotUser.telegram_id == message.from_user.id)
+    user = await BotUser.find_one(
+        BotUser.telegram_id == message.from_user.id, projection_model=UserAuth
+    )
     await _show_profile_logic(message, user, state)
 
 
-@router.message(ProfileSG.Viewing, F.text == __("Back to Menu"))
+@router.message(ProfileSG.Viewing, ActionFilter(TextAction.BACK_TO_MENU))
 async def back_from_profile(message: Message, state: FSMContext):
     """
     Returns from Profile to Main Menu.
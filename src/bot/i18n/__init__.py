@@ -0,0 +1,23 @@
+"""src/bot/i18n/__init__.py."""
+
+from .actions import TextAction, TextActionIndex, text_actions
+from .catalogs import (
+    CatalogValidationError,
+    add_reload_hook,
+    compile_catalogs,
+    load_i18n,
+    reload_catalogs,
+    validate_catalogs,
+)
+
+__all__ = [
+    "TextAction",
+    "TextActionIndex",
+    "text_actions",
+    "CatalogValidationError",
+    "add_reload_hook",
+    "compile_catalogs",
+    "load_i18n",
+    "reload_catalogs",
+    "validate_catalogs",
+]
@@ -0,0 +1,39 @@
+"""src/bot/i18n/__main__.py."""
+
+import argparse
+import logging
+import sys
+from src.bot.i18n.catalogs import (
+    CatalogValidationError,
+    compile_catalogs,
+    validate_catalogs,
+)
+
+
+def main() -> int:
+    """
+    Compiles the gettext catalogs and checks them against the source msgids.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.bot.i18n")
+    parser.add_argument("--path", default="src/locales")
+    parser.add_argument("--source", default="src/bot")
+    parser.add_argument("--domain", default="messages")
+    parser.add_argument(
+        "--force", action="store_true", help="recompile up-to-date catalogs"
+    )
+    parser.add_argument("--strict", action="store_true", help="fail on missing msgids")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    compile_catalogs(args.path, args.domain, force=args.force)
+    try:
+        validate_catalogs(args.path, args.source, args.domain, strict=args.strict)
+    except CatalogValidationError as e:
+        logging.error("%s", e)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
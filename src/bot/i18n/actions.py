@@ -0,0 +1,85 @@
+"""src/bot/i18n/actions.py."""
+
+import logging
+from enum import StrEnum
+from typing import Dict, Optional
+from aiogram.utils.i18n import I18n
+
+logger = logging.getLogger(__name__)
+
+
+class TextAction(StrEnum):
+    """
+    Canonical actions behind the reply keyboard buttons.
+    """
+
+    BACK = "back"
+    CANCEL = "cancel"
+    CANCEL_REGISTRATION = "cancel_registration"
+    DONE = "done"
+    BACK_TO_MENU = "back_to_menu"
+    FORGOT_PASSWORD = "forgot_password"
+    PAGE_PREV = "page_prev"
+    PAGE_NEXT = "page_next"
+    SKIP = "skip"
+    SAVE_SEARCH = "save_search"
+    SHOW_MAP = "show_map"
+
+
+# Source msgids of the button labels (translated per locale when indexing).
+ACTION_LABELS: Dict[TextAction, str] = {
+    TextAction.BACK: "Back",
+    TextAction.CANCEL: "Cancel",
+    TextAction.CANCEL_REGISTRATION: "Cancel Registration",
+    TextAction.DONE: "Done",
+    TextAction.BACK_TO_MENU: "Back to Menu",
+    TextAction.FORGOT_PASSWORD: "Forgot Password?",
+    TextAction.PAGE_PREV: "⬅️",
+    TextAction.PAGE_NEXT: "➡️",
+    TextAction.SKIP: "Skip",
+    TextAction.SAVE_SEARCH: "Save Search",
+    TextAction.SHOW_MAP: "Map",
+}
+
+
+class TextActionIndex:
+    """
+    Reverse index from every localized button label to its canonical action.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, TextAction] = {}
+
+    def build(self, i18n: I18n) -> None:
+        """
+        Rebuilds the index from the default labels and all loaded locales.
+        """
+        index: Dict[str, TextAction] = {}
+        for action, msgid in ACTION_LABELS.items():
+            labels = {msgid}
+            labels.update(
+                i18n.gettext(msgid, locale=locale) for locale in i18n.available_locales
+            )
+            for label in labels:
+                if index.get(label, action) is not action:
+                    logger.warning(
+                        "Label %r is shared by actions %s and %s",
+                        label,
+                        index[label],
+                        action,
+                    )
+                index[label] = action
+
+        self._index = index
+        logger.info("Built text action index with %d labels", len(index))
+
+    def resolve(self, text: Optional[str]) -> Optional[TextAction]:
+        """
+        Returns the action for a button label, or None for free text.
+        """
+        if not text:
+            return None
+        return self._index.get(text)
+
+
+text_actions = TextActionIndex()
@@ -0,0 +1,180 @@
+"""src/bot/i18n/catalogs.py."""
+
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+from aiogram.utils.i18n import I18n
+
+# Babel is imported inside the functions: it is only needed when a catalog
+# has to be (re)compiled or validated, not on every boot.
+# pylint: disable=import-outside-toplevel
+
+logger = logging.getLogger(__name__)
+
+_reload_hooks: Dict[str, Callable[[], None]] = {}
+
+
+class CatalogValidationError(Exception):
+    """
+    Raised when source msgids are missing from a compiled catalog.
+    """
+
+    def __init__(self, missing: Dict[str, List[str]]):
+        self.missing = missing
+        details = "; ".join(
+            f"{locale}: {', '.join(repr(m) for m in msgids)}"
+            for locale, msgids in missing.items()
+        )
+        super().__init__(f"Missing translations: {details}")
+
+
+def _po_files(path: Path, domain: str) -> Dict[str, Path]:
+    """
+    Maps each locale directory to its .po file.
+    """
+    return {
+        po.parent.parent.name: po
+        for po in sorted(path.glob(f"*/LC_MESSAGES/{domain}.po"))
+    }
+
+
+def compile_catalogs(
+    path: str | Path, domain: str = "messages", force: bool = False
+) -> List[str]:
+    """
+    Compiles .po catalogs into .mo files when missing or outdated.
+    Returns the list of locales that were (re)compiled.
+    """
+    compiled = []
+    for locale, po_path in _po_files(Path(path), domain).items():
+        mo_path = po_path.with_suffix(".mo")
+        if (
+            not force
+            and mo_path.exists()
+            and mo_path.stat().st_mtime >= po_path.stat().st_mtime
+        ):
+            continue
+
+        from babel.messages.mofile import write_mo
+        from babel.messages.pofile import read_po
+
+        with po_path.open("rb") as po_file:
+            catalog = read_po(po_file, locale=locale, domain=domain)
+        with mo_path.open("wb") as mo_file:
+            write_mo(mo_file, catalog)
+
+        logger.info("Compiled %s catalog for locale '%s'", domain, locale)
+        compiled.append(locale)
+
+    return compiled
+
+
+def extract_msgids(source_dir: str | Path) -> Dict[str, List[str]]:
+    """
+    Collects every gettext msgid used in the source tree with its locations.
+    """
+    from babel.messages.extract import DEFAULT_KEYWORDS, extract_from_dir
+
+    # `__` is aiogram's lazy_gettext alias.
+    keywords = {**DEFAULT_KEYWORDS, "__": None}
+
+    msgids: Dict[str, List[str]] = {}
+    for filename, lineno, message, _comments, _context in extract_from_dir(
+        str(source_dir), keywords=keywords
+    ):
+        msgid = message[0] if isinstance(message, tuple) else message
+        msgids.setdefault(msgid, []).append(f"{filename}:{lineno}")
+    return msgids
+
+
+def find_missing_msgids(
+    path: str | Path, source_dir: str | Path, domain: str = "messages"
+) -> Dict[str, List[str]]:
+    """
+    Returns msgids used in the source that are absent from each locale catalog.
+    Untranslated (empty) entries are only logged, since they fall back to the msgid.
+    """
+    from babel.messages.pofile import read_po
+
+    used = extract_msgids(source_dir)
+    missing: Dict[str, List[str]] = {}
+
+    for locale, po_path in _po_files(Path(path), domain).items():
+        with po_path.open("rb") as po_file:
+            catalog = read_po(po_file, locale=locale, domain=domain)
+
+        known: Set[str] = set()
+        for message in catalog:
+            if not message.id:
+                continue
+            msgid = message.id[0] if isinstance(message.id, tuple) else message.id
+            known.add(msgid)
+            if msgid in used and (not message.string or message.fuzzy):
+                logger.warning(
+                    "Untranslated msgid %r in locale '%s' (%s)",
+                    msgid,
+                    locale,
+                    used[msgid][0],
+                )
+
+        absent = sorted(msgid for msgid in used if msgid not in known)
+        if absent:
+            missing[locale] = absent
+
+    return missing
+
+
+def validate_catalogs(
+    path: str | Path,
+    source_dir: str | Path,
+    domain: str = "messages",
+    strict: bool = False,
+) -> None:
+    """
+    Verifies that every msgid used in the source exists in all catalogs.
+    Raises CatalogValidationError in strict mode, otherwise logs the gaps.
+    """
+    missing = find_missing_msgids(path, source_dir, domain)
+    if not missing:
+        logger.info("All msgids from %s are present in the catalogs", source_dir)
+        return
+
+    if strict:
+        raise CatalogValidationError(missing)
+
+    for locale, msgids in missing.items():
+        logger.warning(
+            "Locale '%s' is missing %d msgids: %s", locale, len(msgids), msgids
+        )
+
+
+def load_i18n(
+    path: str | Path, default_locale: str = "en", domain: str = "messages"
+) -> I18n:
+    """
+    Compiles outdated catalogs and eagerly loads all locales into memory.
+    """
+    compile_catalogs(path, domain)
+    i18n = I18n(path=path, default_locale=default_locale, domain=domain)
+    logger.info("Loaded locales: %s", ", ".join(i18n.available_locales) or "-")
+    return i18n
+
+
+def add_reload_hook(name: str, callback: Callable[[], None]) -> None:
+    """
+    Registers a callback invoked after the catalogs were reloaded. A callback
+    registered again under the same name replaces the previous one.
+    """
+    _reload_hooks[name] = callback
+
+
+def reload_catalogs(i18n: I18n) -> None:
+    """
+    Recompiles changed catalogs, reloads them and notifies the reload hooks.
+    """
+    compile_catalogs(i18n.path, i18n.domain)
+    i18n.reload()
+    logger.info("Reloaded locales: %s", ", ".join(i18n.available_locales) or "-")
+
+    for callback in _reload_hooks.values():
+        callback()
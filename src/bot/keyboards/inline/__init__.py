@@ -3,13 +3,17 @@
 from .language import get_language_keyboard
 from .start import get_start_keyboard
 from .main_menu import get_main_menu_keyboard
-from .announcement import get_item_keyboard
+from .announcement import get_card_keyboard, get_item_keyboard, set_saved_button
 from .profile import get_profile_keyboard
+from .saved_searches import get_saved_searches_keyboard
 
 __all__ = [
     "get_start_keyboard",
     "get_language_keyboard",
     "get_main_menu_keyboard",
+    "get_card_keyboard",
     "get_item_keyboard",
     "get_profile_keyboard",
+    "get_saved_searches_keyboard",
+    "set_saved_button",
 ]
@@ -1,19 +1,101 @@
 """src/bot/keyboards/inline/announcement.py."""
 
+from typing import Optional
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import ListingCallback
 
 
-def get_item_keyboard(announcement_id: int) -> InlineKeyboardMarkup:
+def get_item_keyboard(
+    announcement_id: int, saved: bool = False
+) -> InlineKeyboardMarkup:
     """
-    Keyboard attached to each listing item (Location button).
+    Keyboard attached to each listing item (Location and Save toggle buttons).
     """
     builder = InlineKeyboardBuilder()
     builder.button(
         text=_("Location"),
         callback_data=ListingCallback(action="geo", id=announcement_id),
     )
+    builder.button(
+        text=_("★ Saved") if saved else _("☆ Save"),
+        callback_data=ListingCallback(action="fav", id=announcement_id),
+    )
+
+    return builder.as_markup()
+
+
+def get_card_keyboard(
+    announcement_id: int,
+    photo_count: int,
+    saved: bool = False,
+    index: Optional[int] = None,
+    details: bool = False,
+) -> InlineKeyboardMarkup:
+    """
+    Keyboard of a compact listing card: gallery arrows while a photo `index`
+    is shown, a "Photos" button otherwise, a Details toggle, and the item
+    buttons.
+    """
+    builder = InlineKeyboardBuilder()
+    if index is not None and photo_count > 1:
+        builder.button(
+            text="‹",
+            callback_data=ListingCallback(
+                action="photos", id=announcement_id, index=(index - 1) % photo_count
+            ),
+        )
+        builder.button(
+            text="›",
+            callback_data=ListingCallback(
+                action="photos", id=announcement_id, index=(index + 1) % photo_count
+            ),
+        )
+    elif photo_count > 1:
+        builder.button(
+            text=_("Photos ({count})").format(count=photo_count),
+            callback_data=ListingCallback(action="photos", id=announcement_id, index=0),
+        )
+    builder.button(
+        text=_("Less") if details else _("Details"),
+        callback_data=ListingCallback(
+            action="card" if details else "details", id=announcement_id
+        ),
+    )
+    top_row = len(list(builder.buttons))
+    builder.button(
+        text=_("Location"),
+        callback_data=ListingCallback(action="geo", id=announcement_id),
+    )
+    builder.button(
+        text=_("★ Saved") if saved else _("☆ Save"),
+        callback_data=ListingCallback(action="fav", id=announcement_id),
+    )
+    builder.adjust(top_row, 2)
 
     return builder.as_markup()
+
+
+def set_saved_button(
+    markup: InlineKeyboardMarkup, announcement_id: int, saved: bool
+) -> InlineKeyboardMarkup:
+    """
+    Returns a listing keyboard with its Save toggle flipped and the other
+    buttons (e.g. of a card's current view) kept.
+    """
+    toggle = ListingCallback(action="fav", id=announcement_id).pack()
+    text = _("★ Saved") if saved else _("☆ Save")
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                (
+                    button.model_copy(update={"text": text})
+                    if button.callback_data == toggle
+                    else button
+                )
+                for button in row
+            ]
+            for row in markup.inline_keyboard
+        ]
+    )
@@ -6,10 +6,12 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import LanguageCallback
 from src.bot.callbacks import MenuCallback
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_language_keyboard() -> InlineKeyboardMarkup:
     """
     Creates an inline keyboard for interface language selection.
@@ -5,19 +5,24 @@ from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import MenuCallback
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_main_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Creates the main menu keyboard for authorized users.
-    Includes: Listings, Create Listing, Profile.
+    Includes: Listings, Search, Near Me, Saved, Create Listing, Profile.
     """
     logger.debug("Generating main menu keyboard")
     builder = InlineKeyboardBuilder()
 
     builder.button(text=_("Listings"), callback_data=MenuCallback(action="listings"))
+    builder.button(text=_("Search"), callback_data=MenuCallback(action="search"))
+    builder.button(text=_("Near Me"), callback_data=MenuCallback(action="nearby"))
+    builder.button(text=_("Saved"), callback_data=MenuCallback(action="favorites"))
     builder.button(
         text=_("Create Listing"), callback_data=MenuCallback(action="create_listing")
     )
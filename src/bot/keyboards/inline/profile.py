@@ -5,10 +5,12 @@ from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import MenuCallback
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_profile_keyboard() -> InlineKeyboardMarkup:
     """
     Creates inline keyboard for Profile view.
@@ -19,6 +21,7 @@ def get_profile_keyboard() -> InlineKeyboardMarkup:
     builder.button(
         text=_("My Listings"), callback_data=MenuCallback(action="my_listings")
     )
+    builder.button(text=_("Search Alerts"), callback_data=MenuCallback(action="alerts"))
 
     builder.adjust(1)
     return builder.as_markup()
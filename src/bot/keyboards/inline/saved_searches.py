@@ -0,0 +1,25 @@
+"""src/bot/keyboards/inline/saved_searches.py."""
+
+import logging
+from typing import List
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.utils.i18n import gettext as _
+from src.bot.callbacks import SavedSearchCallback
+
+logger = logging.getLogger(__name__)
+
+
+def get_saved_searches_keyboard(search_ids: List[str]) -> InlineKeyboardMarkup:
+    """
+    One delete button per saved search, numbered as in the list text.
+    """
+    logger.debug("Generating saved searches keyboard")
+    builder = InlineKeyboardBuilder()
+    for number, search_id in enumerate(search_ids, start=1):
+        builder.button(
+            text=_("Delete #{number}").format(number=number),
+            callback_data=SavedSearchCallback(action="delete", id=search_id),
+        )
+    builder.adjust(2)
+    return builder.as_markup()
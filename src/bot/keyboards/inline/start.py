@@ -5,10 +5,12 @@ from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
 from src.bot.callbacks import MenuCallback
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_start_keyboard() -> InlineKeyboardMarkup:
     """
     Creates the main menu inline keyboard.
@@ -0,0 +1,136 @@
+"""src/bot/keyboards/registry.py."""
+
+import functools
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from pydantic import BaseModel, ConfigDict
+from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup
+from aiogram.utils.i18n import I18n
+
+logger = logging.getLogger(__name__)
+
+MarkupT = TypeVar("MarkupT", InlineKeyboardMarkup, ReplyKeyboardMarkup)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _FrozenList(list):
+    """
+    A list that refuses changes. Still a list, so markups serialize as
+    before.
+    """
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> NoReturn:
+        raise TypeError("Cached keyboards are shared and cannot be changed.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        # Copies are built from the items, not by appending them.
+        return type(self), (list(self),)
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_type(model_type: Type[ModelT]) -> Type[ModelT]:
+    """
+    Returns a read-only subclass of the given markup or button type.
+    """
+    return type(
+        f"Frozen{model_type.__name__}",
+        (model_type,),
+        {"model_config": ConfigDict(frozen=True), "__module__": __name__},
+    )
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        frozen_type = _frozen_type(type(value))
+        return frozen_type.model_construct(
+            _fields_set=value.model_fields_set,
+            **{
+                field: _freeze_value(getattr(value, field))
+                for field in value.model_fields_set
+            },
+        )
+    if isinstance(value, list):
+        return _FrozenList(_freeze_value(item) for item in value)
+    return value
+
+
+def _freeze(markup: MarkupT) -> MarkupT:
+    """
+    Converts a freshly built markup into an immutable instance, down to its
+    rows and buttons.
+    """
+    return _freeze_value(markup)
+
+
+def _current_locale() -> Optional[str]:
+    """
+    Returns the locale of the active i18n context, if any.
+    """
+    i18n = I18n.get_current(no_error=True)
+    return i18n.current_locale if i18n else None
+
+
+class KeyboardRegistry:
+    """
+    Process-wide cache of keyboard markups.
+    Each markup is built once per (locale, keyboard, variant) and shared afterwards.
+    """
+
+    def __init__(self):
+        self._markups: Dict[Tuple[Optional[str], str, Hashable], Any] = {}
+
+    def get(
+        self, name: str, variant: Hashable, factory: Callable[[], MarkupT]
+    ) -> MarkupT:
+        """
+        Returns the cached markup, building it with the factory on first access.
+        """
+        key = (_current_locale(), name, variant)
+        markup = self._markups.get(key)
+        if markup is None:
+            markup = _freeze(factory())
+            self._markups[key] = markup
+        return markup
+
+    def clear(self) -> None:
+        """
+        Drops all cached markups (e.g. after the gettext catalogs were reloaded).
+        """
+        logger.info("Clearing %d cached keyboards", len(self._markups))
+        self._markups.clear()
+
+    def __len__(self) -> int:
+        return len(self._markups)
+
+
+keyboard_registry = KeyboardRegistry()
+
+
+def cached_keyboard(func: Callable[..., MarkupT]) -> Callable[..., MarkupT]:
+    """
+    Decorator for keyboard factories whose output depends only on the active
+    locale and their (hashable) arguments.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args: Hashable, **kwargs: Hashable) -> MarkupT:
+        variant = (args, tuple(sorted(kwargs.items())))
+        return keyboard_registry.get(name, variant, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -6,6 +6,7 @@ from .navigation import (
     get_cancel_keyboard,
     get_back_keyboard,
     get_back_to_menu_keyboard,
+    get_skip_keyboard,
 )
 from .announcement import (
     get_location_keyboard,
@@ -22,4 +23,5 @@ __all__ = [
     "get_listings_reply_keyboard",
     "get_done_keyboard",
     "get_back_to_menu_keyboard",
+    "get_skip_keyboard",
 ]
@@ -4,10 +4,12 @@ import logging
 from aiogram.types import ReplyKeyboardMarkup
 from aiogram.utils.keyboard import ReplyKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_location_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard with a button to share geolocation.
@@ -20,6 +22,7 @@ def get_location_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True, one_time_keyboard=True)
 
 
+@cached_keyboard
 def get_done_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard with a 'Done' button for image upload step.
@@ -32,9 +35,14 @@ def get_done_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
-def get_listings_reply_keyboard(has_prev: bool, has_next: bool) -> ReplyKeyboardMarkup:
+@cached_keyboard
+def get_listings_reply_keyboard(
+    has_prev: bool, has_next: bool, can_save: bool = False, can_map: bool = False
+) -> ReplyKeyboardMarkup:
     """
-    Returns the reply keyboard for the listings mode with pagination.
+    Returns the reply keyboard for the listings mode with pagination, a
+    'Save Search' button for search results and a 'Map' button for pages
+    with located listings.
     """
     builder = ReplyKeyboardBuilder()
 
@@ -43,6 +51,10 @@ def get_listings_reply_keyboard(has_prev: bool, has_next: bool) -> ReplyKeyboard
     if has_next:
         builder.button(text="➡️")
 
+    if can_save:
+        builder.button(text=_("Save Search"))
+    if can_map:
+        builder.button(text=_("Map"))
     builder.button(text=_("Back to Menu"))
 
     if has_prev and has_next:
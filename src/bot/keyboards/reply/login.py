@@ -4,10 +4,12 @@ import logging
 from aiogram.types import ReplyKeyboardMarkup
 from aiogram.utils.keyboard import ReplyKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_login_password_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard for the password input stage.
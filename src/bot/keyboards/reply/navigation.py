@@ -4,10 +4,12 @@ import logging
 from aiogram.types import ReplyKeyboardMarkup
 from aiogram.utils.keyboard import ReplyKeyboardBuilder
 from aiogram.utils.i18n import gettext as _
+from src.bot.keyboards.registry import cached_keyboard
 
 logger = logging.getLogger(__name__)
 
 
+@cached_keyboard
 def get_cancel_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard with a single 'Cancel' button.
@@ -18,6 +20,7 @@ def get_cancel_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@cached_keyboard
 def get_back_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard with 'Back' and 'Cancel' buttons.
@@ -30,6 +33,7 @@ def get_back_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@cached_keyboard
 def get_back_to_menu_keyboard() -> ReplyKeyboardMarkup:
     """
     Creates a reply keyboard with a single 'Back to Menu' button.
@@ -39,3 +43,18 @@ def get_back_to_menu_keyboard() -> ReplyKeyboardMarkup:
     builder.button(text=_("Back to Menu"))
     builder.adjust(1)
     return builder.as_markup(resize_keyboard=True)
+
+
+@cached_keyboard
+def get_skip_keyboard(with_back: bool = True) -> ReplyKeyboardMarkup:
+    """
+    Creates a reply keyboard for optional steps: 'Skip', 'Back' and 'Cancel'.
+    """
+    logger.debug("Generating skip keyboard")
+    builder = ReplyKeyboardBuilder()
+    builder.button(text=_("Skip"))
+    if with_back:
+        builder.button(text=_("Back"))
+    builder.button(text=_("Cancel"))
+    builder.adjust(1)
+    return builder.as_markup(resize_keyboard=True)
@@ -1,5 +1,21 @@
 """src/bot/middlewares/__init__.py."""
 
+from .attribution import TaskAttributionMiddleware
 from .i18n import LanguageMiddleware
+from .metrics import HandlerMetricsMiddleware, UpdateMetricsMiddleware
+from .request_metrics import RequestMetricsMiddleware
+from .shutdown import InFlightMiddleware
+from .text_action import TextActionMiddleware
+from .tracing import RequestTracingMiddleware, TracingMiddleware
 
-__all__ = ["LanguageMiddleware"]
+__all__ = [
+    "HandlerMetricsMiddleware",
+    "InFlightMiddleware",
+    "LanguageMiddleware",
+    "RequestMetricsMiddleware",
+    "RequestTracingMiddleware",
+    "TaskAttributionMiddleware",
+    "TextActionMiddleware",
+    "TracingMiddleware",
+    "UpdateMetricsMiddleware",
+]
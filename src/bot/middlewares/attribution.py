@@ -0,0 +1,41 @@
+"""src/bot/middlewares/attribution.py."""
+
+import asyncio
+from typing import Any, Dict, Awaitable, Callable
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+
+class TaskAttributionMiddleware(BaseMiddleware):
+    """
+    Names the asyncio task processing an update after the update and, once
+    matched, the handler, so stall reports and asyncio's slow-callback log
+    point at the code responsible. Registered as an outer update middleware
+    and as an inner middleware on the event observers.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Renames the current task for the duration of the call.
+        """
+        task = asyncio.current_task()
+        if task is None:
+            return await handler(event, data)
+
+        previous = task.get_name()
+        if isinstance(event, Update):
+            task.set_name(f"update {event.update_id} {event.event_type}")
+        else:
+            callback = getattr(data.get("handler"), "callback", None)
+            name = f"{callback.__module__}.{callback.__name__}" if callback else "?"
+            task.set_name(f"{previous} -> {name}")
+        try:
+            return await handler(event, data)
+        finally:
+            task.set_name(previous)
@@ -5,7 +5,8 @@ from typing import Any, Dict, Awaitable, Callable
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject, User
 from aiogram.utils.i18n import I18n
-from src.database import BotUser
+from src.database import BotUser, UserLocale
+from src.infrastructure.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 class LanguageMiddleware(BaseMiddleware):
     """
     Middleware for determining and setting the user's language.
-    Also injects the 'user' (BotUser) into the handler arguments.
+    Reads only the stored language code (UserLocale projection).
     """
 
     # pylint: disable=too-few-public-methods
@@ -34,17 +35,17 @@ class LanguageMiddleware(BaseMiddleware):
         Determines locale based on DB -> Telegram -> Default priority.
         """
         tg_user: User | None = data.get("event_from_user")
-        user: BotUser | None = data.get("user")
+        stored: UserLocale | None = None
 
-        if not user and tg_user:
-            user = await BotUser.find_one(BotUser.telegram_id == tg_user.id)
-
-        if user:
-            data["user"] = user
+        if tg_user:
+            with tracer.span("LanguageMiddleware.user_lookup"):
+                stored = await BotUser.find_one(
+                    BotUser.telegram_id == tg_user.id, projection_model=UserLocale
+                )
 
         locale = "en"
-        if user and user.language_code:
-            locale = user.language_code
+        if stored and stored.language_code:
+            locale = stored.language_code
         elif tg_user and tg_user.language_code:
             if tg_user.language_code in ["en", "ru"]:
                 locale = tg_user.language_code
@@ -54,7 +55,7 @@ class LanguageMiddleware(BaseMiddleware):
                 "Selected locale '%s' for user %s (DB found: %s)",
                 locale,
                 tg_user.id,
-                bool(user),
+                bool(stored),
             )
 
         data["i18n"] = self.i18n
@@ -0,0 +1,72 @@
+"""src/bot/middlewares/metrics.py."""
+
+import time
+from typing import Any, Dict, Awaitable, Callable
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import TelegramObject, Update
+from src.infrastructure.metrics import (
+    HANDLER_CALLS_TOTAL,
+    HANDLER_DURATION,
+    UPDATE_DURATION,
+    UPDATES_TOTAL,
+)
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """
+    Outer update middleware counting updates and measuring their total latency.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Times the whole update pipeline.
+        """
+        update_type = event.event_type if isinstance(event, Update) else "unknown"
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = await handler(event, data)
+            status = "unhandled" if result is UNHANDLED else "handled"
+            return result
+        finally:
+            UPDATE_DURATION.labels(update_type).observe(time.perf_counter() - started)
+            UPDATES_TOTAL.labels(update_type, status).inc()
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """
+    Inner middleware measuring each matched handler, labelled by its router
+    module and function name.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Times the handler call.
+        """
+        handler_object = data.get("handler")
+        callback = getattr(handler_object, "callback", None)
+        router = getattr(callback, "__module__", "unknown")
+        name = getattr(callback, "__name__", "unknown")
+
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = await handler(event, data)
+            status = "ok"
+            return result
+        finally:
+            HANDLER_DURATION.labels(router, name).observe(time.perf_counter() - started)
+            HANDLER_CALLS_TOTAL.labels(router, name, status).inc()
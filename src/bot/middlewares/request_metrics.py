@@ -0,0 +1,50 @@
+"""src/bot/middlewares/request_metrics.py."""
+
+import time
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from src.infrastructure.metrics import (
+    TELEGRAM_REQUEST_DURATION,
+    TELEGRAM_RETRY_AFTER_TOTAL,
+)
+
+
+class RequestMetricsMiddleware(BaseRequestMiddleware):
+    """
+    Bot session middleware measuring outgoing Bot API calls and 429 responses.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        """
+        Times the request and classifies its outcome.
+        """
+        api_method = method.__api_method__
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await make_request(bot, method)
+            status = "ok"
+            return response
+        except TelegramRetryAfter:
+            status = "retry_after"
+            TELEGRAM_RETRY_AFTER_TOTAL.labels(api_method).inc()
+            raise
+        except TelegramAPIError:
+            status = "api_error"
+            raise
+        finally:
+            TELEGRAM_REQUEST_DURATION.labels(api_method, status).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,36 @@
+"""src/bot/middlewares/shutdown.py."""
+
+import asyncio
+from typing import Any, Dict, Awaitable, Callable
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from src.infrastructure.shutdown import ShutdownCoordinator
+
+
+class InFlightMiddleware(BaseMiddleware):
+    """
+    Outer update middleware registering every update being handled with the
+    shutdown coordinator, so shutdown waits for it before closing the pools.
+    """
+
+    def __init__(self, coordinator: ShutdownCoordinator):
+        self.coordinator = coordinator
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Tracks the current task for the duration of the update.
+        """
+        task = asyncio.current_task()
+        if task is None:
+            return await handler(event, data)
+        self.coordinator.track_update(task)
+        try:
+            return await handler(event, data)
+        finally:
+            self.coordinator.release_update(task)
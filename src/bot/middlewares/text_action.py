@@ -0,0 +1,28 @@
+"""src/bot/middlewares/text_action.py."""
+
+from typing import Any, Dict, Awaitable, Callable
+from aiogram import BaseMiddleware
+from aiogram.types import Message, TelegramObject
+from src.bot.i18n import text_actions
+
+
+class TextActionMiddleware(BaseMiddleware):
+    """
+    Resolves the message text to a canonical action once per message,
+    so router filters only compare the injected 'text_action'.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Injects the resolved action into the handler data.
+        """
+        if isinstance(event, Message):
+            data["text_action"] = text_actions.resolve(event.text)
+
+        return await handler(event, data)
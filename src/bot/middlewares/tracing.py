@@ -0,0 +1,61 @@
+"""src/bot/middlewares/tracing.py."""
+
+from typing import Any, Dict, Awaitable, Callable
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject, Update
+from src.infrastructure.tracing import tracer
+
+
+class TracingMiddleware(BaseMiddleware):
+    """
+    Outer update middleware opening the root span of an update's trace.
+    Registered ahead of aiogram's built-in outer middlewares.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Wraps the whole update pipeline in a span.
+        """
+        update_type = event.event_type if isinstance(event, Update) else "unknown"
+        with tracer.span(f"update {update_type}") as span:
+            try:
+                return await handler(event, data)
+            finally:
+                if span is not None:
+                    if isinstance(event, Update):
+                        span.set_attribute("update.id", event.update_id)
+                    # Resolved by UserContextMiddleware further down the chain.
+                    tg_user = data.get("event_from_user")
+                    if tg_user:
+                        span.set_attribute("user.id", tg_user.id)
+
+
+class RequestTracingMiddleware(BaseRequestMiddleware):
+    """
+    Bot session middleware adding a span for every outgoing Bot API call.
+    """
+
+    # pylint: disable=too-few-public-methods
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        """
+        Wraps the request in a span.
+        """
+        with tracer.span(f"telegram {method.__api_method__}"):
+            return await make_request(bot, method)
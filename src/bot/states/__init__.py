@@ -4,6 +4,7 @@ from .auth import LoginSG, RegistrationSG, ResetPasswordSG
 from .announcement import CreateAnnouncementSG
 from .listings import ListingsSG
 from .profile import ProfileSG
+from .search import SearchSG
 
 __all__ = [
     "LoginSG",
@@ -12,4 +13,5 @@ __all__ = [
     "CreateAnnouncementSG",
     "ListingsSG",
     "ProfileSG",
+    "SearchSG",
 ]
@@ -0,0 +1,18 @@
+"""src/bot/states/search.py."""
+
+from aiogram.fsm.state import State, StatesGroup
+
+# pylint: disable=too-few-public-methods
+
+
+class SearchSG(StatesGroup):
+    """
+    FSM states for the listing search filter wizard and the "Near me"
+    location prompt.
+    """
+
+    InputPrice = State()
+    InputArea = State()
+    InputRooms = State()
+    InputKeywords = State()
+    InputLocation = State()
@@ -1,36 +1,127 @@
 """src/bot/ui_commands.py."""
 
+import asyncio
+import hashlib
+import json
 import logging
+from typing import Dict, List, Optional
 from aiogram import Bot
 from aiogram.types import BotCommand, BotCommandScopeAllPrivateChats
+from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANGUAGE = "default"
 
-async def set_ui_commands(bot: Bot):
-    """
-    Sets bot commands (Menu button) for different languages.
-    """
-    logger.info("Setting up UI commands...")
-
-    commands_en = [
+UI_COMMANDS: Dict[str, List[BotCommand]] = {
+    DEFAULT_LANGUAGE: [
         BotCommand(command="start", description="Main Menu"),
+        BotCommand(command="search", description="Search Listings"),
         BotCommand(command="profile", description="My Profile"),
         BotCommand(command="help", description="Help"),
-    ]
-
-    await bot.set_my_commands(
-        commands=commands_en, scope=BotCommandScopeAllPrivateChats()
-    )
-    logger.debug("Default (English) commands set.")
-
-    commands_ru = [
+    ],
+    "ru": [
         BotCommand(command="start", description="Главное меню"),
+        BotCommand(command="search", description="Поиск объявлений"),
         BotCommand(command="profile", description="Мой профиль"),
         BotCommand(command="help", description="Помощь"),
-    ]
+    ],
+}
+
+
+def startup_state_key(bot: Bot) -> str:
+    """
+    Redis hash holding fingerprints of the startup calls already applied.
+    """
+    return f"bot:{bot.id}:startup"
+
+
+def _language_code(language: str) -> Optional[str]:
+    return None if language == DEFAULT_LANGUAGE else language
+
+
+def commands_fingerprint(commands: List[BotCommand]) -> str:
+    """
+    Stable hash of a command set.
+    """
+    payload = json.dumps(
+        [[c.command, c.description] for c in commands], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
+async def _push_commands(bot: Bot, language: str, commands: List[BotCommand]):
     await bot.set_my_commands(
-        commands=commands_ru, scope=BotCommandScopeAllPrivateChats(), language_code="ru"
+        commands=commands,
+        scope=BotCommandScopeAllPrivateChats(),
+        language_code=_language_code(language),
     )
-    logger.debug("Russian commands set.")
+    logger.debug("Commands for language '%s' set.", language)
+
+
+async def _sync_language(
+    bot: Bot, language: str, commands: List[BotCommand], known: Optional[str]
+) -> Optional[str]:
+    """
+    Pushes one command set if it differs from what Telegram has.
+    Returns the new fingerprint, or None when nothing changed.
+    """
+    fingerprint = commands_fingerprint(commands)
+    if known == fingerprint:
+        return None
+
+    if known is None:
+        current = await bot.get_my_commands(
+            scope=BotCommandScopeAllPrivateChats(),
+            language_code=_language_code(language),
+        )
+        if commands_fingerprint(current) == fingerprint:
+            logger.debug("Commands for language '%s' already up to date.", language)
+            return fingerprint
+
+    await _push_commands(bot, language, commands)
+    return fingerprint
+
+
+async def sync_ui_commands(bot: Bot, redis: Redis):
+    """
+    Pushes only the command sets whose fingerprint changed since the last sync.
+    """
+    key = startup_state_key(bot)
+    state = await redis.hgetall(key)
+
+    languages = list(UI_COMMANDS)
+    results = await asyncio.gather(
+        *(
+            _sync_language(
+                bot, language, UI_COMMANDS[language], state.get(f"commands:{language}")
+            )
+            for language in languages
+        )
+    )
+
+    updated = {
+        f"commands:{language}": fingerprint
+        for language, fingerprint in zip(languages, results)
+        if fingerprint
+    }
+    if updated:
+        await redis.hset(key, mapping=updated)
+        logger.info("UI commands synced for: %s", ", ".join(updated))
+    else:
+        logger.info("UI commands are up to date.")
+
+
+async def ensure_polling_mode(bot: Bot):
+    """
+    Removes the webhook (dropping pending updates) if one is set. Checked on
+    every boot, since a webhook can be set again at any time and polling
+    fails with a conflict while it exists.
+    """
+    webhook = await bot.get_webhook_info()
+    if not webhook.url:
+        logger.debug("No webhook set, skipping delete_webhook.")
+        return
+
+    await bot.delete_webhook(drop_pending_updates=True)
+    logger.info("Webhook removed, bot switched to polling mode.")
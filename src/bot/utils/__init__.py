@@ -1,11 +1,46 @@
 """src/bot/utils/__init__.py."""
 
-from .ui import handle_cancel, remove_reply_keyboard, cleanup_last_step
+from .ui import (
+    handle_cancel,
+    remove_reply_keyboard,
+    cleanup_last_step,
+    format_price,
+    require_login,
+)
 from .images import encode_image_to_base64
+from .photo_cache import PLACEHOLDER_PHOTO_URL, PhotoFileCache
+from .send_queue import ChatThrottle, OutgoingMessage, SendQueue, TokenBucket
+from .alerts import SavedSearchAlerts
+from .inline_cache import (
+    InlinePage,
+    InlineResultCache,
+    QueryDebouncer,
+    normalize_query,
+)
+from .map_snapshot import MapSnapshot, MapSnapshots
+from .broadcast import Broadcaster, mark_user_inactive, parse_variants
 
 __all__ = [
     "handle_cancel",
     "remove_reply_keyboard",
     "cleanup_last_step",
+    "format_price",
+    "require_login",
     "encode_image_to_base64",
+    "PLACEHOLDER_PHOTO_URL",
+    "PhotoFileCache",
+    "ChatThrottle",
+    "OutgoingMessage",
+    "SendQueue",
+    "TokenBucket",
+    "SavedSearchAlerts",
+    "InlinePage",
+    "InlineResultCache",
+    "QueryDebouncer",
+    "normalize_query",
+    "MapSnapshot",
+    "MapSnapshots",
+    "Broadcaster",
+    "mark_user_inactive",
+    "parse_variants",
 ]
@@ -0,0 +1,119 @@
+"""src/bot/utils/alerts.py."""
+
+import asyncio
+import html
+import logging
+from typing import Any, Dict, Iterable, List
+from aiogram.utils.i18n import I18n, gettext as _
+from src.database import BotUser, SavedSearch
+from src.infrastructure.metrics import SAVED_SEARCH_ALERTS_TOTAL
+from src.infrastructure.search import SearchFilters, SubscriptionIndex
+from src.infrastructure.sync import ListingChanges
+from .send_queue import OutgoingMessage, SendQueue
+from .ui import format_price
+
+logger = logging.getLogger(__name__)
+
+
+class SavedSearchAlerts:
+    """
+    Listing sync listener that matches newly synced listings against the
+    saved searches and queues one message per user with the listings that
+    matched. Stays quiet until the mirror has been fully synced once, so the
+    initial import does not alert anybody.
+    """
+
+    def __init__(
+        self,
+        index: SubscriptionIndex,
+        send_queue: SendQueue,
+        i18n: I18n,
+        max_listings: int = 5,
+    ):
+        self.index = index
+        self.send_queue = send_queue
+        self.i18n = i18n
+        self.max_listings = max_listings
+        self.ready = False
+
+    async def load(self) -> None:
+        """
+        Rebuilds the subscription index from MongoDB.
+        """
+        self.index.clear()
+        async for saved in SavedSearch.find_all():
+            self.index.add(
+                str(saved.id), saved.telegram_id, SearchFilters(**saved.filters)
+            )
+        logger.info("Loaded %d saved searches.", len(self.index))
+
+    async def apply(self, changes: ListingChanges) -> None:
+        """
+        Listing sync listener.
+        """
+        if self.ready and changes.added:
+            await self.notify(
+                [item for item in changes.changed if int(item["id"]) in changes.added]
+            )
+        if changes.full_sync_done:
+            self.ready = True
+
+    async def notify(self, listings: List[Dict[str, Any]]) -> None:
+        """
+        Queues alerts for the saved searches the listings match.
+        """
+        matches: Dict[int, List[Dict[str, Any]]] = {}
+        for item in listings:
+            for telegram_id in self.index.match(item):
+                matches.setdefault(telegram_id, []).append(item)
+            # A listing may match tens of thousands of searches.
+            await asyncio.sleep(0)
+        if not matches:
+            return
+
+        locales = await _user_locales(matches)
+        for telegram_id, matched in matches.items():
+            text = self._render(matched, locales.get(telegram_id, "en"))
+            self.send_queue.put(OutgoingMessage(telegram_id, text))
+        SAVED_SEARCH_ALERTS_TOTAL.inc(len(matches))
+        logger.info(
+            "Queued saved-search alerts for %d user(s) about %d listing(s).",
+            len(matches),
+            len(listings),
+        )
+
+    def _render(self, listings: List[Dict[str, Any]], locale: str) -> str:
+        with self.i18n.context(), self.i18n.use_locale(locale):
+            lines = [_("<b>New listings match your saved search:</b>")]
+            for item in listings[: self.max_listings]:
+                lines.append(
+                    f"<b>{format_price(item.get('price'))}</b> | "
+                    f"{item.get('area', 0)} м²\n"
+                    f"{html.escape(item.get('address', ''))}"
+                )
+            if len(listings) > self.max_listings:
+                lines.append(
+                    _("…and {count} more.").format(
+                        count=len(listings) - self.max_listings
+                    )
+                )
+        return "\n\n".join(lines)
+
+    async def forget_user(self, telegram_id: int) -> None:
+        """
+        Deletes the saved searches of a user (e.g. one who blocked the bot).
+        """
+        async for saved in SavedSearch.find(SavedSearch.telegram_id == telegram_id):
+            self.index.remove(str(saved.id))
+            await saved.delete()
+
+
+async def _user_locales(telegram_ids: Iterable[int]) -> Dict[int, str]:
+    collection = BotUser.get_pymongo_collection()
+    return {
+        doc["telegram_id"]: doc.get("language_code") or "en"
+        async for doc in collection.find(
+            {"telegram_id": {"$in": list(telegram_ids)}},
+            {"_id": 0, "telegram_id": 1, "language_code": 1},
+        )
+    }
@@ -0,0 +1,363 @@
+"""src/bot/utils/broadcast.py."""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from aiogram.utils.i18n import I18n, gettext as _
+from beanie.operators import Set
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.database import BotUser
+from src.infrastructure.metrics import BROADCAST_MESSAGES_TOTAL
+from .send_queue import ChatThrottle, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs keep their counters this long, for the progress message.
+JOB_TTL = 7 * 24 * 3600
+# Seconds to wait before retrying after a Redis or MongoDB error.
+RETRY_DELAY = 5.0
+
+_VARIANT_TAG = re.compile(r"^\[([a-z]{2})\]\s*(.*)$")
+
+
+def parse_variants(text: str) -> Dict[str, str]:
+    """
+    Splits a broadcast text into per-locale variants. A line starting with
+    a tag like "[ru]" begins the Russian text; text before the first tag is
+    the default variant, stored under "".
+    """
+    variants: Dict[str, List[str]] = {"": []}
+    lines = variants[""]
+    for line in text.splitlines():
+        tag = _VARIANT_TAG.match(line.strip())
+        if tag:
+            lines = variants.setdefault(tag[1], [])
+            line = tag[2]
+        lines.append(line)
+    return {
+        locale: "\n".join(body).strip()
+        for locale, body in variants.items()
+        if "\n".join(body).strip()
+    }
+
+
+async def mark_user_inactive(telegram_id: int) -> None:
+    """
+    Flags a user who blocked the bot, so broadcasts skip them; /start
+    reactivates them.
+    """
+    await BotUser.find_one(BotUser.telegram_id == telegram_id).update(
+        Set({BotUser.is_active: False})
+    )
+    logger.info("Marked user %s inactive.", telegram_id)
+
+
+class Broadcaster:
+    """
+    Delivers admin broadcasts to every active user, one job at a time.
+
+    A job lives in Redis: its texts rendered per locale, its counters and a
+    queue of "chat_id:locale" recipients filled by streaming BotUser from
+    MongoDB in telegram_id order. Each batch is queued together with the
+    last telegram_id in it, and a recipient leaves the queue only once its
+    message was sent, so after a restart the job resumes where it stopped
+    (re-sending at most the message that was in flight). Sends share the
+    token bucket and chat throttle of the send queue, so alerts and
+    broadcasts together stay below Telegram's limits.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        bot: Bot,
+        redis: Redis,
+        i18n: I18n,
+        bucket: TokenBucket,
+        throttle: ChatThrottle,
+        batch_size: int = 500,
+        report_interval: float = 5.0,
+    ):
+        self.bot = bot
+        self.redis = redis
+        self.i18n = i18n
+        self.bucket = bucket
+        self.throttle = throttle
+        self.batch_size = batch_size
+        self.report_interval = report_interval
+        self._prefix = f"bot:{bot.id}:broadcast"
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+
+    @property
+    def _jobs_key(self) -> str:
+        return f"{self._prefix}:jobs"
+
+    def _job_key(self, job_id: str, part: Optional[str] = None) -> str:
+        key = f"{self._prefix}:{job_id}"
+        return f"{key}:{part}" if part else key
+
+    async def _meta(self, job_id: str) -> Dict[str, str]:
+        return await self.redis.hgetall(self._job_key(job_id))
+
+    def _render(self, variants: Dict[str, str], locale: str) -> str:
+        body = (
+            variants.get(locale)
+            or variants.get("")
+            or variants.get(self.i18n.default_locale)
+            or next(iter(variants.values()))
+        )
+        with self.i18n.context(), self.i18n.use_locale(locale):
+            header = _("<b>Announcement from Swipe</b>")
+        return f"{header}\n\n{body}"
+
+    async def create(self, text: str, admin_chat_id: int, locale: str) -> Optional[str]:
+        """
+        Renders a new broadcast for every locale, posts its progress message
+        to the admin and queues the job. Returns the job id, or None if the
+        text is empty.
+        """
+        variants = parse_variants(text)
+        if not variants:
+            return None
+
+        job_id = str(await self.redis.incr(f"{self._prefix}:seq"))
+        texts = {
+            available: self._render(variants, available)
+            for available in {self.i18n.default_locale, *self.i18n.available_locales}
+        }
+        meta = {
+            "status": "enqueuing",
+            "admin_chat_id": admin_chat_id,
+            "locale": locale,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "cursor": 0,
+            "enqueued": 0,
+            "sent": 0,
+            "blocked": 0,
+            "failed": 0,
+        }
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job_id, "texts"), mapping=texts)
+            pipe.hset(self._job_key(job_id), mapping=meta)
+            await pipe.execute()
+
+        progress = await self.bot.send_message(
+            admin_chat_id, self._progress_text(job_id, meta)
+        )
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job_id), "progress_message_id", progress.message_id)
+            pipe.rpush(self._jobs_key, job_id)
+            await pipe.execute()
+        self._wakeup.set()
+        logger.info("Broadcast %s queued by %s.", job_id, admin_chat_id)
+        return job_id
+
+    async def cancel(self, job_id: str) -> bool:
+        """
+        Cancels a broadcast that has not finished. Returns False otherwise.
+        """
+        status = await self.redis.hget(self._job_key(job_id), "status")
+        if status not in ("enqueuing", "sending"):
+            return False
+        await self.redis.hset(self._job_key(job_id), "status", "cancelled")
+        logger.info("Broadcast %s cancelled.", job_id)
+        return True
+
+    async def _enqueue(self, job_id: str, after: int) -> bool:
+        """
+        Streams the active users past the checkpoint into the job's queue.
+        Returns False if stopped or cancelled first.
+        """
+        cursor = BotUser.get_pymongo_collection().find(
+            {"telegram_id": {"$gt": after}, "is_active": {"$ne": False}},
+            {"_id": 0, "telegram_id": 1, "language_code": 1},
+            sort=[("telegram_id", 1)],
+            batch_size=self.batch_size,
+        )
+        try:
+            batch: List[str] = []
+            last_id = after
+            async for doc in cursor:
+                last_id = doc["telegram_id"]
+                batch.append(f"{last_id}:{doc.get('language_code') or ''}")
+                if len(batch) >= self.batch_size:
+                    if not await self._push(job_id, batch, last_id):
+                        return False
+                    batch = []
+            return not batch or await self._push(job_id, batch, last_id)
+        finally:
+            await cursor.close()
+
+    async def _push(self, job_id: str, batch: List[str], last_id: int) -> bool:
+        if self._stopping.is_set():
+            return False
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(self._job_key(job_id, "queue"), *batch)
+            pipe.hset(self._job_key(job_id), "cursor", last_id)
+            pipe.hincrby(self._job_key(job_id), "enqueued", len(batch))
+            pipe.hget(self._job_key(job_id), "status")
+            *_, status = await pipe.execute()
+        return status != "cancelled"
+
+    async def _send(self, chat_id: int, text: str) -> str:
+        try:
+            await self.bot.send_message(chat_id, text)
+            result = "sent"
+        except TelegramRetryAfter as e:
+            logger.warning(
+                "Flood control hit, pausing broadcast for %ss.", e.retry_after
+            )
+            self.bucket.pause(e.retry_after)
+            result = "retried"
+        except TelegramForbiddenError:
+            result = "blocked"
+            try:
+                await mark_user_inactive(chat_id)
+            except PyMongoError:
+                logger.exception("Could not mark user %s inactive.", chat_id)
+        except TelegramAPIError as e:
+            logger.warning("Broadcast to chat %s failed: %s", chat_id, e)
+            result = "failed"
+        BROADCAST_MESSAGES_TOTAL.labels(result).inc()
+        return result
+
+    async def _deliver(self, job_id: str) -> bool:
+        """
+        Sends to the queued recipients. Returns False if stopped or
+        cancelled before the queue ran out.
+        """
+        texts = await self.redis.hgetall(self._job_key(job_id, "texts"))
+        fallback = texts[self.i18n.default_locale]
+        queue_key = self._job_key(job_id, "queue")
+        next_report = 0.0
+        while not self._stopping.is_set():
+            if time.monotonic() >= next_report:
+                if (
+                    await self.redis.hget(self._job_key(job_id), "status")
+                    == "cancelled"
+                ):
+                    return False
+                await self._report(job_id)
+                next_report = time.monotonic() + self.report_interval
+
+            entry = await self.redis.lindex(queue_key, 0)
+            if entry is None:
+                return True
+            chat, _sep, locale = entry.partition(":")
+            chat_id = int(chat)
+            await self.bucket.acquire()
+            await self.throttle.wait(chat_id)
+            result = await self._send(chat_id, texts.get(locale, fallback))
+            if result == "retried":
+                continue
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lpop(queue_key)
+                pipe.hincrby(self._job_key(job_id), result, 1)
+                await pipe.execute()
+        return False
+
+    def _progress_text(self, job_id: str, meta: Dict[str, object]) -> str:
+        status = meta.get("status")
+        with self.i18n.context(), self.i18n.use_locale(str(meta.get("locale"))):
+            if status == "done":
+                title = _("Broadcast #{id} finished.")
+            elif status == "cancelled":
+                title = _("Broadcast #{id} cancelled.")
+            elif status == "enqueuing":
+                title = _("Broadcast #{id}: collecting recipients…")
+            else:
+                title = _("Broadcast #{id}: sending…")
+            counts = _(
+                "Sent: {sent} of {total}\nBlocked the bot: {blocked}\nFailed: {failed}"
+            ).format(
+                sent=meta.get("sent", 0),
+                total=meta.get("enqueued", 0),
+                blocked=meta.get("blocked", 0),
+                failed=meta.get("failed", 0),
+            )
+        return f"<b>{title.format(id=job_id)}</b>\n{counts}"
+
+    async def _report(self, job_id: str) -> None:
+        """
+        Updates the admin's progress message.
+        """
+        meta = await self._meta(job_id)
+        if "progress_message_id" not in meta:
+            return
+        try:
+            await self.bot.edit_message_text(
+                self._progress_text(job_id, meta),
+                chat_id=int(meta["admin_chat_id"]),
+                message_id=int(meta["progress_message_id"]),
+            )
+        except TelegramAPIError as e:
+            # Includes "message is not modified" when nothing changed.
+            logger.debug("Broadcast %s progress not updated: %s", job_id, e)
+
+    async def _finish(self, job_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._job_key(job_id, "queue"), self._job_key(job_id, "texts"))
+            pipe.lrem(self._jobs_key, 1, job_id)
+            pipe.expire(self._job_key(job_id), JOB_TTL)
+            await pipe.execute()
+        await self._report(job_id)
+        meta = await self._meta(job_id)
+        logger.info(
+            "Broadcast %s %s: %s sent, %s blocked, %s failed of %s.",
+            job_id,
+            meta.get("status"),
+            meta.get("sent"),
+            meta.get("blocked"),
+            meta.get("failed"),
+            meta.get("enqueued"),
+        )
+
+    async def _process(self, job_id: str) -> None:
+        meta = await self._meta(job_id)
+        status = meta.get("status")
+        if status == "enqueuing" and await self._enqueue(job_id, int(meta["cursor"])):
+            status = "sending"
+            await self.redis.hset(self._job_key(job_id), "status", status)
+        if status == "sending" and await self._deliver(job_id):
+            await self.redis.hset(self._job_key(job_id), "status", "done")
+        if not self._stopping.is_set():
+            await self._finish(job_id)
+
+    async def run(self) -> None:
+        """
+        Works through the queued broadcasts until stopped, starting with the
+        one left unfinished by the previous run.
+        """
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            try:
+                job_id = await self.redis.lindex(self._jobs_key, 0)
+                if job_id is None:
+                    await self._wakeup.wait()
+                    continue
+                await self._process(job_id)
+            except (RedisError, PyMongoError) as e:
+                logger.error("Broadcast failed, retrying: %s", e)
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), RETRY_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        """
+        Makes `run` return after the message being sent; the job resumes on
+        the next start.
+        """
+        self._stopping.set()
+        self._wakeup.set()
@@ -0,0 +1,91 @@
+"""src/bot/utils/inline_cache.py."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional
+from redis.asyncio import Redis
+from src.infrastructure.search import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Reduces an inline query to the tokens the search matches on, so
+    "Khreshchatyk " and "khreshchatyk" share one cache entry.
+    """
+    return " ".join(tokenize(query))
+
+
+class InlinePage(NamedTuple):
+    """
+    One page of inline results: rendered listings and the offset of the
+    next page ("" for the last one).
+    """
+
+    entries: List[Dict[str, Any]]
+    next_offset: str
+
+
+class InlineResultCache:
+    """
+    Redis cache of rendered inline query pages per normalized query, offset
+    and locale. Telegram caches answers per query string too (`cache_time`),
+    but only for the exact text; this one also absorbs the variants that
+    normalize the same and the identical queries of other users.
+    """
+
+    def __init__(self, redis: Redis, bot_id: int, ttl: int):
+        self.redis = redis
+        self.bot_id = bot_id
+        self.ttl = ttl
+
+    def _key(self, query: str, offset: int, locale: str) -> str:
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        return f"bot:{self.bot_id}:inline:{locale}:{digest}:{offset}"
+
+    async def get(self, query: str, offset: int, locale: str) -> Optional[InlinePage]:
+        """
+        Returns the cached page, if any.
+        """
+        stored = await self.redis.get(self._key(query, offset, locale))
+        if stored is None:
+            return None
+        return InlinePage(**json.loads(stored))
+
+    async def store(
+        self, query: str, offset: int, locale: str, page: InlinePage
+    ) -> None:
+        """
+        Caches a page for `ttl` seconds.
+        """
+        await self.redis.set(
+            self._key(query, offset, locale),
+            json.dumps(page._asdict()),
+            ex=self.ttl,
+        )
+
+
+class QueryDebouncer:
+    """
+    Lets through only the last of a user's inline queries typed in quick
+    succession: each query waits `delay` seconds and is dropped if a newer
+    one from the same user arrived meanwhile. Telegram discards answers to
+    superseded queries anyway.
+    """
+
+    def __init__(self):
+        self._latest: Dict[int, str] = {}
+
+    async def settle(self, user_id: int, query_id: str, delay: float) -> bool:
+        """
+        Waits out the delay; returns False if the query was superseded.
+        """
+        self._latest[user_id] = query_id
+        await asyncio.sleep(delay)
+        if self._latest.get(user_id) != query_id:
+            return False
+        del self._latest[user_id]
+        return True
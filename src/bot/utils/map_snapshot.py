@@ -0,0 +1,97 @@
+"""src/bot/utils/map_snapshot.py."""
+
+import hashlib
+import json
+import logging
+from typing import List, NamedTuple, Sequence, Tuple, Union
+from aiogram.types import BufferedInputFile, Message
+from redis.asyncio import Redis
+from src.infrastructure.executors import executors
+from src.infrastructure.maps import TileStore, fit_zoom, render_map, tiles_for
+from src.infrastructure.metrics import MAP_SNAPSHOT_TOTAL
+from .photo_cache import FILE_ID_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class MapSnapshot(NamedTuple):
+    """
+    A map image ready to send: a cached file_id or a freshly rendered PNG.
+    `order` lists the indexes of the given points in marker order (marker
+    1 is the point at order[0]).
+    """
+
+    key: str
+    photo: Union[str, BufferedInputFile]
+    order: List[int]
+
+
+class MapSnapshots:
+    """
+    Static map images with numbered markers for a page of listings. Images
+    are rendered from the tile store on the process pool and their Telegram
+    file_ids cached in Redis by (sorted coordinates, zoom), so the same page
+    is rendered and uploaded only once per bot. Markers are numbered in
+    sorted order, which keeps the numbers of a cached image right whatever
+    order the points come in.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        redis: Redis,
+        bot_id: int,
+        tile_store: TileStore,
+        width: int = 640,
+        height: int = 480,
+        max_zoom: int = 16,
+        ttl: int = FILE_ID_TTL,
+    ):
+        self.redis = redis
+        self.bot_id = bot_id
+        self.tile_store = tile_store
+        self.width = width
+        self.height = height
+        self.max_zoom = max_zoom
+        self.ttl = ttl
+
+    def _key(self, points: Sequence[Tuple[float, float]], zoom: int) -> str:
+        payload = json.dumps([[[round(c, 6) for c in p] for p in points], zoom])
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return f"bot:{self.bot_id}:map:{self.width}x{self.height}:{digest}"
+
+    async def resolve(self, points: Sequence[Tuple[float, float]]) -> MapSnapshot:
+        """
+        Returns the map of the (lat, lon) points, rendering it on a cache miss.
+        """
+        order = sorted(range(len(points)), key=lambda index: points[index])
+        ordered = [points[index] for index in order]
+        zoom = fit_zoom(ordered, self.width, self.height, self.max_zoom)
+        key = self._key(ordered, zoom)
+
+        file_id = await self.redis.get(key)
+        if file_id:
+            MAP_SNAPSHOT_TOTAL.labels("hit").inc()
+            return MapSnapshot(key, file_id, order)
+
+        MAP_SNAPSHOT_TOTAL.labels("render").inc()
+        tiles = await self.tile_store.get_many(
+            zoom, tiles_for(ordered, zoom, self.width, self.height)
+        )
+        png = await executors.processes.run(
+            render_map, ordered, zoom, tiles, self.width, self.height
+        )
+        return MapSnapshot(key, BufferedInputFile(png, filename="map.png"), order)
+
+    async def store(self, key: str, message: Message) -> None:
+        """
+        Remembers the file_id Telegram assigned to a rendered map.
+        """
+        if message.photo:
+            await self.redis.set(key, message.photo[-1].file_id, ex=self.ttl)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Drops a cached map (e.g. one whose file_id Telegram rejected).
+        """
+        await self.redis.delete(key)
@@ -0,0 +1,121 @@
+"""src/bot/utils/photo_cache.py."""
+
+import hashlib
+import json
+import logging
+from typing import List, Optional, Sequence
+from aiogram.types import Message
+from redis.asyncio import Redis
+from src.infrastructure.metrics import PHOTO_FILE_ID_CACHE_TOTAL
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_PHOTO_URL = "https://via.placeholder.com/600x400?text=No+Photo"
+
+# Telegram file_ids do not expire, the TTL only bounds the cache size.
+FILE_ID_TTL = 30 * 24 * 3600
+
+
+class PhotoFileCache:
+    """
+    Redis cache of Telegram file_ids for photos sent by URL, so Telegram
+    downloads each image from the backend only once per bot. Each listing
+    remembers which URLs (and version) its cached photos came from; when that
+    changes, the old entries are dropped.
+    """
+
+    def __init__(self, redis: Redis, bot_id: int, ttl: int = FILE_ID_TTL):
+        self.redis = redis
+        self.bot_id = bot_id
+        self.ttl = ttl
+
+    def _photo_key(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return f"bot:{self.bot_id}:photo:{digest}"
+
+    def _listing_key(self, listing_id: object) -> str:
+        return f"bot:{self.bot_id}:listing_photos:{listing_id}"
+
+    async def resolve(
+        self, listing_id: object, urls: Sequence[str], version: Optional[str] = None
+    ) -> List[str]:
+        """
+        Returns the media to send for `urls`: the cached file_id where there
+        is one, the URL otherwise.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._listing_key(listing_id))
+            pipe.mget([self._photo_key(url) for url in urls])
+            stored, file_ids = await pipe.execute()
+
+        if stored is not None:
+            previous = json.loads(stored)
+            if previous != {"urls": list(urls), "version": version}:
+                await self.invalidate(listing_id, previous["urls"])
+                file_ids = [None] * len(urls)
+
+        hits = sum(1 for file_id in file_ids if file_id)
+        PHOTO_FILE_ID_CACHE_TOTAL.labels("hit").inc(hits)
+        PHOTO_FILE_ID_CACHE_TOTAL.labels("miss").inc(len(urls) - hits)
+        return [file_id or url for file_id, url in zip(file_ids, urls)]
+
+    async def store(
+        self,
+        listing_id: object,
+        urls: Sequence[str],
+        messages: Sequence[Message],
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Remembers the file_ids Telegram assigned to the photos of a sent album.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for url, message in zip(urls, messages):
+                if message.photo:
+                    pipe.set(
+                        self._photo_key(url), message.photo[-1].file_id, ex=self.ttl
+                    )
+            pipe.set(
+                self._listing_key(listing_id),
+                json.dumps({"urls": list(urls), "version": version}),
+                ex=self.ttl,
+            )
+            await pipe.execute()
+
+    async def store_photo(
+        self,
+        listing_id: object,
+        urls: Sequence[str],
+        index: int,
+        message: Message,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Remembers the file_id of one photo of a listing sent on its own, such
+        as a card or a gallery page.
+        """
+        if not message.photo:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(
+                self._photo_key(urls[index]), message.photo[-1].file_id, ex=self.ttl
+            )
+            pipe.set(
+                self._listing_key(listing_id),
+                json.dumps({"urls": list(urls), "version": version}),
+                ex=self.ttl,
+            )
+            await pipe.execute()
+
+    async def invalidate(
+        self, listing_id: object, urls: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Drops the cached file_ids of a listing. The shared placeholder is kept.
+        """
+        if urls is None:
+            stored = await self.redis.get(self._listing_key(listing_id))
+            urls = json.loads(stored)["urls"] if stored else []
+        keys = [self._photo_key(url) for url in urls if url != PLACEHOLDER_PHOTO_URL]
+        await self.redis.delete(self._listing_key(listing_id), *keys)
+        logger.debug("Photo file_ids of listing %s invalidated.", listing_id)
@@ -0,0 +1,187 @@
+"""src/bot/utils/send_queue.py."""
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from aiogram.types import InlineKeyboardMarkup
+from src.infrastructure.metrics import SEND_QUEUE_MESSAGES_TOTAL, SEND_QUEUE_PENDING
+
+logger = logging.getLogger(__name__)
+
+BlockedHook = Callable[[int], Awaitable[None]]
+
+
+class TokenBucket:
+    """
+    Allows `rate` acquisitions per second, with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Waits for a token and takes it.
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hands out no tokens for the next `seconds` (e.g. after a 429).
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class ChatThrottle:
+    """
+    Spaces messages to the same chat at least `interval` seconds apart;
+    Telegram allows about one message per second in a chat.
+    """
+
+    def __init__(self, interval: float = 1.0, max_chats: int = 10_000):
+        self.interval = interval
+        self.max_chats = max_chats
+        self._last: Dict[int, float] = {}
+
+    async def wait(self, chat_id: int) -> None:
+        """
+        Waits until the chat may receive another message and books the slot.
+        """
+        last = self._last.get(chat_id)
+        if last is not None:
+            delay = last + self.interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        now = time.monotonic()
+        self._last[chat_id] = now
+        if len(self._last) > self.max_chats:
+            self._last = {
+                chat: sent
+                for chat, sent in self._last.items()
+                if now - sent < self.interval
+            }
+
+
+class OutgoingMessage(NamedTuple):
+    """
+    A message queued for background delivery.
+    """
+
+    chat_id: int
+    text: str
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+
+
+class SendQueue:
+    """
+    Delivers bot-initiated messages (e.g. saved-search alerts) in the
+    background. Sends go through a token bucket set below Telegram's global
+    limit of about 30 messages per second (and a per-chat throttle), so a
+    large fan-out neither gets the bot flood-limited nor delays replies to
+    users. A 429 pauses the
+    bucket for its `retry_after` and the message is retried; chats that
+    blocked the bot are reported to the `on_blocked` hooks.
+    """
+
+    def __init__(
+        self, bot: Bot, bucket: TokenBucket, throttle: Optional[ChatThrottle] = None
+    ):
+        self.bot = bot
+        self.bucket = bucket
+        self.throttle = throttle or ChatThrottle()
+        self._pending: Deque[OutgoingMessage] = collections.deque()
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._blocked_hooks: List[BlockedHook] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, message: OutgoingMessage) -> None:
+        """
+        Queues a message; never blocks.
+        """
+        self._pending.append(message)
+        SEND_QUEUE_PENDING.set(len(self._pending))
+        self._wakeup.set()
+
+    def on_blocked(self, hook: BlockedHook) -> None:
+        """
+        Registers a coroutine called with the id of a chat that blocked the bot.
+        """
+        self._blocked_hooks.append(hook)
+
+    async def _send(self, message: OutgoingMessage) -> None:
+        try:
+            await self.bot.send_message(
+                message.chat_id, message.text, reply_markup=message.reply_markup
+            )
+            SEND_QUEUE_MESSAGES_TOTAL.labels("sent").inc()
+        except TelegramRetryAfter as e:
+            SEND_QUEUE_MESSAGES_TOTAL.labels("retried").inc()
+            logger.warning("Flood control hit, pausing sends for %ss.", e.retry_after)
+            self.bucket.pause(e.retry_after)
+            self._pending.appendleft(message)
+        except TelegramForbiddenError:
+            SEND_QUEUE_MESSAGES_TOTAL.labels("blocked").inc()
+            logger.info("Chat %s blocked the bot.", message.chat_id)
+            for hook in self._blocked_hooks:
+                try:
+                    await hook(message.chat_id)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Blocked-chat hook failed.")
+        except TelegramAPIError as e:
+            SEND_QUEUE_MESSAGES_TOTAL.labels("failed").inc()
+            logger.warning("Failed to send to chat %s: %s", message.chat_id, e)
+
+    async def run(self) -> None:
+        """
+        Sends queued messages until stopped.
+        """
+        while not self._stopping.is_set():
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self.bucket.acquire()
+            message = self._pending.popleft()
+            await self.throttle.wait(message.chat_id)
+            await self._send(message)
+            SEND_QUEUE_PENDING.set(len(self._pending))
+
+        if self._pending:
+            logger.warning(
+                "Send queue stopped with %d message(s) unsent.", len(self._pending)
+            )
+
+    def stop(self) -> None:
+        """
+        Makes `run` return after the message being sent.
+        """
+        self._stopping.set()
+        self._wakeup.set()
@@ -1,14 +1,28 @@
 """src/bot/utils/ui.py."""
 
 import logging
+from typing import Any, Optional
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, ReplyKeyboardRemove
 from aiogram.utils.i18n import gettext as _
+from src.bot.i18n import TextAction, text_actions
 from src.bot.keyboards.inline import get_start_keyboard
+from src.database import BotUser, UserAuth
 
 logger = logging.getLogger(__name__)
 
 
+def format_price(value: Any) -> str:
+    """
+    Formats a listing price as "$120 000", or returns it as is if it is not
+    a number.
+    """
+    try:
+        return f"${float(value):,.0f}".replace(",", " ")
+    except (ValueError, TypeError):
+        return str(value if value is not None else "N/A")
+
+
 async def remove_reply_keyboard(message: Message):
     """
     Silently removes the ReplyKeyboard by sending a temporary message and deleting it.
@@ -20,11 +34,32 @@ async def remove_reply_keyboard(message: Message):
         logger.debug("Failed to remove reply keyboard: %s", e)
 
 
+async def require_login(message: Message, telegram_id: int) -> Optional[UserAuth]:
+    """
+    Returns the user if they are logged in; otherwise asks them to log in
+    first and returns None.
+    """
+    user = await BotUser.find_one(
+        BotUser.telegram_id == telegram_id, projection_model=UserAuth
+    )
+    if user and user.api_access_token:
+        return user
+    logger.info("User %s is not logged in", telegram_id)
+    await message.answer(
+        _("You are not logged in. Please login first."),
+        reply_markup=get_start_keyboard(),
+    )
+    return None
+
+
 async def handle_cancel(message: Message, state: FSMContext) -> bool:
     """
     Checks if the message is a 'Cancel' command.
     """
-    if message.text == _("Cancel") or message.text == _("Cancel Registration"):
+    if text_actions.resolve(message.text) in (
+        TextAction.CANCEL,
+        TextAction.CANCEL_REGISTRATION,
+    ):
         logger.info("User %s canceled action via UI", message.from_user.id)
         await state.clear()
         await remove_reply_keyboard(message)
@@ -1,5 +1,7 @@
 """src/config.py."""
 
+from functools import lru_cache
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
 
@@ -13,16 +15,132 @@ class Settings(BaseSettings):
 
     MONGO_URL: str
     MONGO_DB_NAME: str
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: Optional[int] = 300_000
+    MONGO_CONNECT_TIMEOUT_MS: int = 5_000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5_000
+    MONGO_SOCKET_TIMEOUT_MS: Optional[int] = None
+    # How long a command waits for a free pooled connection before failing.
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = 2_000
 
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    # Seconds a command waits for a free pooled connection before failing.
+    REDIS_POOL_TIMEOUT: float = 2.0
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
+    REDIS_SOCKET_KEEPALIVE: bool = True
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
 
     SWIPE_API_BASE_URL: str
+    # Bearer token for background jobs that read the feed without a user.
+    SWIPE_API_SERVICE_TOKEN: Optional[SecretStr] = None
+
+    SEARCH_SYNC_ENABLED: bool = True
+    SEARCH_SYNC_INTERVAL: int = 60
+    SEARCH_FULL_SYNC_INTERVAL: int = 3600
+    SEARCH_SYNC_PAGE_SIZE: int = 100
+    # Pages fetched at once during a full listing sync.
+    SEARCH_SYNC_CONCURRENCY: int = 4
+    # Radius of the "Near me" search.
+    NEARBY_RADIUS_KM: float = 10.0
+    # Listing modes ("all", "search", "nearby", "favorites", "my") shown as
+    # compact cards: one photo with "Photos" and "Details" buttons instead of
+    # the whole album.
+    LISTING_CARD_MODES: List[str] = ["all", "search", "nearby"]
+
+    # "Map" button rendering the listings of a page on one static map from
+    # the tiles in MAP_TILES_PATH ({z}/{x}/{y}.png). With MAP_TILE_URL set,
+    # missing tiles are downloaded into it.
+    MAP_SNAPSHOT_ENABLED: bool = False
+    MAP_TILES_PATH: str = "map_tiles"
+    MAP_TILE_URL: Optional[str] = None
+    MAP_MAX_ZOOM: int = 16
+
+    INLINE_PAGE_SIZE: int = 20
+    # Seconds Telegram caches an inline answer (per query text) and we cache
+    # a rendered page (per normalized query) in Redis.
+    INLINE_CACHE_TIME: int = 300
+    INLINE_CACHE_TTL: int = 120
+    # Inline queries wait this long for the user to stop typing.
+    INLINE_DEBOUNCE_MS: int = 400
+
+    SAVED_SEARCHES_LIMIT: int = 10
+    # Saved listings kept per user; older ones drop off.
+    FAVORITES_LIMIT: int = 1000
+    # Listings shown in one saved-search alert.
+    SAVED_SEARCH_ALERT_LISTINGS: int = 5
+    # Messages per second for bot-initiated sends (alerts); Telegram allows
+    # about 30 in total, the rest is left for replies.
+    SEND_RATE_LIMIT: float = 20.0
+
+    # Telegram ids allowed to run admin commands such as /broadcast,
+    # e.g. [123456789].
+    ADMIN_IDS: List[int] = []
+    # Seconds between updates of a broadcast's progress message.
+    BROADCAST_REPORT_INTERVAL: float = 5.0
 
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" or "json"
+    # Fraction of records below WARNING kept per logger (and its children),
+    # e.g. {"aiogram.event": 0.1}.
+    LOG_SAMPLING: Dict[str, float] = {}
+    LOG_MAX_MESSAGE_LENGTH: int = 2000
+
+    READINESS_FILE: Optional[str] = None
+    # Seconds shutdown waits for in-flight updates and background tasks;
+    # keep it below the container's stop grace period.
+    SHUTDOWN_TIMEOUT: float = 20.0
+
+    STARTUP_PROFILE: bool = False
+    STARTUP_PROFILE_FILE: Optional[str] = None
+
+    LOCALES_PATH: str = "src/locales"
+    I18N_STRICT: bool = False
+    # The Docker build validates the catalogs (`python -m src.bot.i18n --strict`).
+    I18N_VALIDATE_ON_STARTUP: bool = False
+
+    METRICS_ENABLED: bool = True
+    # The endpoint has no authentication: keep it off public interfaces.
+    # docker-compose binds it to the container network for the scraper.
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = 9100
+
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_STALL_THRESHOLD_MS: int = 250
+    # asyncio debug mode: logs callbacks slower than LOOP_SLOW_CALLBACK_MS.
+    LOOP_DEBUG: bool = False
+    LOOP_SLOW_CALLBACK_MS: int = 100
+
+    EXECUTOR_THREADS: int = 4
+    EXECUTOR_PROCESSES: int = 2
+    EXECUTOR_MAX_QUEUE: int = 64
+
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "file"  # "file" or "otlp"
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_SERVICE_NAME: str = "swipe-bot"
 
     model_config = SettingsConfigDict(
         env_file=".env", env_ignore_empty=True, extra="ignore"
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, loading them on first use.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """
+    Resolves `settings` lazily so importing this module does not read the environment.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
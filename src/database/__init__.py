@@ -1,6 +1,60 @@
 """src/database/__init__.py."""
 
-from .models import BotUser
-from .redis import get_redis_client
+from .favorites import (
+    favorite_ids,
+    remove_favorites,
+    saved_listing_ids,
+    toggle_favorite,
+)
+from .indexes import IndexVerificationError, verify_indexes
+from .listings import (
+    get_listings,
+    iter_listings,
+    latest_listings,
+    listing_watermark,
+    nearby_listings,
+    purge_listings,
+    upsert_listings,
+)
+from .models import (
+    DOCUMENT_MODELS,
+    Announcement,
+    AnnouncementData,
+    BotUser,
+    SavedSearch,
+    SyncCheckpoint,
+    UserAuth,
+    UserFavorites,
+    UserLocale,
+)
+from .mongo import close_mongo_client, get_mongo_client
+from .redis import close_redis_client, get_redis_client
 
-__all__ = ["BotUser", "get_redis_client"]
+__all__ = [
+    "DOCUMENT_MODELS",
+    "Announcement",
+    "AnnouncementData",
+    "BotUser",
+    "IndexVerificationError",
+    "SavedSearch",
+    "SyncCheckpoint",
+    "UserAuth",
+    "UserFavorites",
+    "UserLocale",
+    "close_mongo_client",
+    "close_redis_client",
+    "favorite_ids",
+    "get_listings",
+    "get_mongo_client",
+    "get_redis_client",
+    "iter_listings",
+    "latest_listings",
+    "listing_watermark",
+    "nearby_listings",
+    "purge_listings",
+    "remove_favorites",
+    "saved_listing_ids",
+    "toggle_favorite",
+    "upsert_listings",
+    "verify_indexes",
+]
@@ -0,0 +1,69 @@
+"""src/database/favorites.py."""
+
+import logging
+from typing import Iterable, List, Set
+from .models import BotUser, UserFavorites
+
+logger = logging.getLogger(__name__)
+
+
+async def toggle_favorite(telegram_id: int, listing_id: int, limit: int) -> bool:
+    """
+    Saves the listing for the user, or unsaves it if it was saved. Returns
+    whether it is saved now. Beyond `limit` saves the oldest ones drop off.
+    """
+    collection = BotUser.get_pymongo_collection()
+    added = await collection.update_one(
+        {"telegram_id": telegram_id, "favorites": {"$ne": listing_id}},
+        {
+            "$push": {
+                "favorites": {"$each": [listing_id], "$position": 0, "$slice": limit}
+            }
+        },
+    )
+    if added.modified_count:
+        return True
+    await collection.update_one(
+        {"telegram_id": telegram_id}, {"$pull": {"favorites": listing_id}}
+    )
+    return False
+
+
+async def favorite_ids(telegram_id: int, offset: int, limit: int) -> List[int]:
+    """
+    Returns a page of the user's saved listing ids, most recent first.
+    Only that slice of the array is read.
+    """
+    doc = await BotUser.get_pymongo_collection().find_one(
+        {"telegram_id": telegram_id},
+        {"_id": 0, "favorites": {"$slice": [offset, limit]}},
+    )
+    return doc.get("favorites", []) if doc else []
+
+
+async def saved_listing_ids(telegram_id: int) -> Set[int]:
+    """
+    Returns all the listing ids the user saved.
+    """
+    user = await BotUser.find_one(
+        BotUser.telegram_id == telegram_id, projection_model=UserFavorites
+    )
+    return set(user.favorites) if user else set()
+
+
+async def remove_favorites(listing_ids: Iterable[int]) -> None:
+    """
+    Unsaves listings for every user, e.g. ones purged from the feed.
+    """
+    listing_ids = list(listing_ids)
+    if not listing_ids:
+        return
+    result = await BotUser.get_pymongo_collection().update_many(
+        {"favorites": {"$in": listing_ids}},
+        {"$pull": {"favorites": {"$in": listing_ids}}},
+    )
+    logger.info(
+        "Dropped %d purged listing(s) from the favorites of %d user(s).",
+        len(listing_ids),
+        result.modified_count,
+    )
@@ -0,0 +1,38 @@
+"""src/database/indexes.py."""
+
+import logging
+from typing import Iterable, List, Type
+from beanie import Document
+from beanie.odm.fields import IndexModelField
+
+logger = logging.getLogger(__name__)
+
+
+class IndexVerificationError(RuntimeError):
+    """
+    Raised when a declared index is missing from the database.
+    """
+
+    def __init__(self, missing: List[str]):
+        self.missing = missing
+        super().__init__(f"Missing MongoDB indexes: {', '.join(missing)}")
+
+
+async def verify_indexes(models: Iterable[Type[Document]]) -> None:
+    """
+    Checks that every index declared in the models' Settings exists with the
+    same keys and options. Run after init_beanie; raises IndexVerificationError.
+    """
+    missing = []
+    for model in models:
+        collection = model.get_pymongo_collection()
+        actual = IndexModelField.from_pymongo_index_information(
+            await collection.index_information()
+        )
+        expected = model.get_settings().indexes or []
+        for index in IndexModelField.list_difference(expected, actual):
+            missing.append(f"{collection.name}.{index.name}")
+        logger.debug("Indexes verified for %s", collection.name)
+
+    if missing:
+        raise IndexVerificationError(missing)
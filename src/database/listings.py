@@ -0,0 +1,196 @@
+"""src/database/listings.py."""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+from beanie.operators import In
+from pymongo import UpdateOne
+from .models import Announcement, AnnouncementData
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored document shape changes: every listing then counts as
+# changed and is rewritten by the next sync pass.
+MIRROR_VERSION = 2
+
+
+def listing_fingerprint(item: Dict[str, Any]) -> str:
+    """
+    Content hash of a listing as returned by the API; changes whenever any
+    field does.
+    """
+    return hashlib.sha1(
+        json.dumps([MIRROR_VERSION, item], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def listing_location(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    GeoJSON point of a listing, None if its coordinates are missing or out
+    of range (a 2dsphere index rejects those).
+    """
+    try:
+        latitude = float(item["latitude"])
+        longitude = float(item["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    return {"type": "Point", "coordinates": [longitude, latitude]}
+
+
+async def get_listings(ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    Returns the stored listings with the given ids, in the order given.
+    Ids that are not (or no longer) stored are skipped.
+    """
+    if not ids:
+        return []
+    docs = await Announcement.find(In(Announcement.listing_id, list(ids))).to_list()
+    by_id = {doc.listing_id: doc.data for doc in docs}
+    return [by_id[listing_id] for listing_id in ids if listing_id in by_id]
+
+
+async def latest_listings(
+    limit: int, offset: int = 0, max_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Returns a page of stored listings, newest (highest id) first. Passing the
+    `listing_watermark()` taken on the first page as `max_id` keeps later
+    pages stable while new listings arrive.
+    """
+    bounds = [Announcement.listing_id <= max_id] if max_id is not None else []
+    query = Announcement.find(*bounds, projection_model=AnnouncementData)
+    docs = (
+        await query.sort(-Announcement.listing_id).skip(offset).limit(limit).to_list()
+    )
+    return [doc.data for doc in docs]
+
+
+def nearby_pipeline(
+    latitude: float,
+    longitude: float,
+    limit: int,
+    offset: int = 0,
+    max_distance: Optional[float] = None,
+    max_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Aggregation pipeline behind `nearby_listings`.
+    """
+    geo_near = {
+        "near": {"type": "Point", "coordinates": [longitude, latitude]},
+        "key": "location",
+        "distanceField": "distance",
+        "spherical": True,
+        "query": {"listing_id": {"$lte": max_id}} if max_id is not None else {},
+    }
+    if max_distance is not None:
+        geo_near["maxDistance"] = max_distance
+    return [
+        {"$geoNear": geo_near},
+        {"$skip": offset},
+        {"$limit": limit},
+        {"$project": {"_id": 0, "data": 1, "distance": 1}},
+    ]
+
+
+async def nearby_listings(
+    latitude: float,
+    longitude: float,
+    limit: int,
+    offset: int = 0,
+    max_distance: Optional[float] = None,
+    max_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Returns a page of stored listings nearest to a point, closest first,
+    each with its `distance` in metres. Served by the 2dsphere index on
+    `location`; `max_distance` (metres) bounds the search radius and
+    `max_id` works as in `latest_listings`.
+    """
+    pipeline = nearby_pipeline(
+        latitude, longitude, limit, offset, max_distance=max_distance, max_id=max_id
+    )
+    docs = await Announcement.aggregate(pipeline).to_list()
+    return [{**doc["data"], "distance": doc["distance"]} for doc in docs]
+
+
+async def listing_watermark() -> int:
+    """
+    Highest stored listing id, 0 if there are none.
+    """
+    newest = (
+        await Announcement.find_all().sort(-Announcement.listing_id).first_or_none()
+    )
+    return newest.listing_id if newest else 0
+
+
+async def iter_listings(batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yields every stored listing, e.g. to rebuild an in-memory index.
+    """
+    async for doc in Announcement.find_all(
+        projection_model=AnnouncementData, batch_size=batch_size
+    ):
+        yield doc.data
+
+
+async def upsert_listings(
+    items: Sequence[Dict[str, Any]], seen_at: datetime
+) -> Tuple[List[Dict[str, Any]], Set[int]]:
+    """
+    Stores a page of the feed in one bulk write and marks every listing as
+    seen at `seen_at`. Returns the items that were new or changed, and the
+    ids of the new ones.
+    """
+    if not items:
+        return [], set()
+    collection = Announcement.get_pymongo_collection()
+    ids = [int(item["id"]) for item in items]
+    known = {
+        doc["listing_id"]: doc["fingerprint"]
+        async for doc in collection.find(
+            {"listing_id": {"$in": ids}}, {"_id": 0, "listing_id": 1, "fingerprint": 1}
+        )
+    }
+
+    operations = []
+    changed = []
+    for listing_id, item in zip(ids, items):
+        fingerprint = listing_fingerprint(item)
+        if known.get(listing_id) == fingerprint:
+            update = {"$set": {"seen_at": seen_at}}
+        else:
+            changed.append(item)
+            update = {
+                "$set": {
+                    "data": item,
+                    "location": listing_location(item),
+                    "fingerprint": fingerprint,
+                    "seen_at": seen_at,
+                }
+            }
+        operations.append(UpdateOne({"listing_id": listing_id}, update, upsert=True))
+    await collection.bulk_write(operations, ordered=False)
+    return changed, set(ids) - set(known)
+
+
+async def purge_listings(seen_before: datetime) -> List[int]:
+    """
+    Deletes listings not seen in the feed since `seen_before`; returns their
+    ids.
+    """
+    collection = Announcement.get_pymongo_collection()
+    ids = [
+        doc["listing_id"]
+        async for doc in collection.find(
+            {"seen_at": {"$lt": seen_before}}, {"_id": 0, "listing_id": 1}
+        )
+    ]
+    if ids:
+        await collection.delete_many({"listing_id": {"$in": ids}})
+        logger.info("Purged %d listing(s) gone from the feed.", len(ids))
+    return ids
@@ -1,8 +1,10 @@
 """src/database/models.py."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, IndexModel
 
 
 # pylint: disable=too-many-ancestors
@@ -11,15 +13,20 @@ class BotUser(Document):
     MongoDB document model representing a Telegram bot user.
     """
 
-    telegram_id: int = Field(index=True, unique=True)
+    telegram_id: int
     username: Optional[str] = None
     full_name: str
     language_code: str = "en"
+    # False once the user blocked the bot; broadcasts skip inactive users.
+    is_active: bool = True
 
     api_access_token: Optional[str] = None
     api_refresh_token: Optional[str] = None
     api_user_id: Optional[int] = None
 
+    # Ids of the listings the user saved, most recent first.
+    favorites: List[int] = []
+
     class Settings:
         """
         Beanie ODM settings for the BotUser document.
@@ -27,3 +34,117 @@ class BotUser(Document):
 
         # pylint: disable=too-few-public-methods
         name = "users"
+        # Declared here (not via Field extras, which Beanie ignores) so that
+        # init_beanie builds it and verify_indexes can check it.
+        indexes = [IndexModel([("telegram_id", ASCENDING)], unique=True)]
+
+
+class UserLocale(BaseModel):
+    """
+    Projection of BotUser for locale resolution.
+    """
+
+    language_code: str = "en"
+
+
+class UserAuth(BaseModel):
+    """
+    Projection of BotUser for API calls: identity and tokens only.
+    """
+
+    telegram_id: int
+    api_access_token: Optional[str] = None
+    api_refresh_token: Optional[str] = None
+
+
+class UserFavorites(BaseModel):
+    """
+    Projection of BotUser with the saved listing ids only.
+    """
+
+    favorites: List[int] = []
+
+
+class Announcement(Document):
+    """
+    Local mirror of one listing of the Swipe announcements feed, kept up to
+    date by the listing sync. `data` is the listing as the API returned it.
+    """
+
+    listing_id: int
+    data: Dict[str, Any]
+    # GeoJSON point built from the listing's latitude/longitude, if valid.
+    location: Optional[Dict[str, Any]] = None
+    fingerprint: str
+    seen_at: datetime
+
+    class Settings:
+        """
+        Beanie ODM settings for the Announcement document.
+        """
+
+        # pylint: disable=too-few-public-methods
+        name = "announcements"
+        indexes = [
+            IndexModel([("listing_id", DESCENDING)], unique=True),
+            IndexModel([("seen_at", ASCENDING)]),
+            IndexModel([("location", GEOSPHERE)]),
+        ]
+
+
+class AnnouncementData(BaseModel):
+    """
+    Projection of Announcement for handlers: the listing payload only.
+    """
+
+    data: Dict[str, Any]
+
+
+class SyncCheckpoint(Document):
+    """
+    Progress of a sync job, saved after every batch so that a restarted
+    process resumes where it stopped.
+    """
+
+    name: str
+    # Highest listing id stored so far.
+    watermark: int = 0
+    # Set while a full pass is running.
+    full_pass_started_at: Optional[datetime] = None
+    # Start of the last completed full pass; listings not seen since then
+    # were missed by two passes in a row and are stale.
+    previous_full_pass_started_at: Optional[datetime] = None
+    full_pass_offset: int = 0
+    full_synced_at: Optional[datetime] = None
+
+    class Settings:
+        """
+        Beanie ODM settings for the SyncCheckpoint document.
+        """
+
+        # pylint: disable=too-few-public-methods
+        name = "sync_checkpoints"
+        indexes = [IndexModel([("name", ASCENDING)], unique=True)]
+
+
+class SavedSearch(Document):
+    """
+    A user's saved listing search; new listings matching `filters` (search
+    filter fields) are sent to the user.
+    """
+
+    telegram_id: int
+    filters: Dict[str, Any]
+    created_at: datetime
+
+    class Settings:
+        """
+        Beanie ODM settings for the SavedSearch document.
+        """
+
+        # pylint: disable=too-few-public-methods
+        name = "saved_searches"
+        indexes = [IndexModel([("telegram_id", ASCENDING)])]
+
+
+DOCUMENT_MODELS = [BotUser, Announcement, SyncCheckpoint, SavedSearch]
@@ -0,0 +1,52 @@
+"""src/database/mongo.py."""
+
+import logging
+from typing import Optional
+from pymongo import AsyncMongoClient
+from src.config import get_settings
+from src.database.monitoring import MongoCommandMetrics, MongoPoolMetrics
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[AsyncMongoClient] = None
+
+
+def get_mongo_client() -> AsyncMongoClient:
+    """
+    Returns the process-wide MongoDB client, creating it on first use with the
+    pool settings from the configuration. The driver always enables TCP
+    keepalive on its sockets, so there is no separate setting for it.
+    """
+    global _client  # pylint: disable=global-statement
+
+    if _client is None:
+        settings = get_settings()
+        listeners = (
+            [MongoCommandMetrics(), MongoPoolMetrics()]
+            if settings.METRICS_ENABLED
+            else []
+        )
+        _client = AsyncMongoClient(
+            settings.MONGO_URL,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+            waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            event_listeners=listeners,
+        )
+    return _client
+
+
+async def close_mongo_client() -> None:
+    """
+    Closes the shared MongoDB client and its connection pool, if it was created.
+    """
+    global _client  # pylint: disable=global-statement
+
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("MongoDB client closed.")
@@ -0,0 +1,81 @@
+"""src/database/monitoring.py."""
+
+from pymongo import monitoring
+from src.infrastructure.metrics import (
+    MONGO_COMMAND_DURATION,
+    MONGO_POOL_CONNECTIONS,
+    MONGO_POOL_WAIT_DURATION,
+)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    PyMongo command listener exporting per-command latency.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Latency is taken from the completion events."""
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Records a successful command."""
+        MONGO_COMMAND_DURATION.labels(event.command_name, "ok").observe(
+            event.duration_micros / 1_000_000
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Records a failed command."""
+        MONGO_COMMAND_DURATION.labels(event.command_name, "error").observe(
+            event.duration_micros / 1_000_000
+        )
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    PyMongo connection pool listener exporting checkout wait time and the
+    number of open and checked-out connections.
+    """
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        """Pool lifecycle events carry no latency."""
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        """Pool lifecycle events carry no latency."""
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        """Pool lifecycle events carry no latency."""
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        """Pool lifecycle events carry no latency."""
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        """Counts a newly opened connection."""
+        MONGO_POOL_CONNECTIONS.labels("open").inc()
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        """Handshake completion is already part of the checkout wait."""
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        """Counts a closed connection."""
+        MONGO_POOL_CONNECTIONS.labels("open").dec()
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        """Wait time is taken from the completion events."""
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        """Records a checkout that timed out or failed to connect."""
+        MONGO_POOL_WAIT_DURATION.labels(event.reason).observe(event.duration)
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        """Records the time spent waiting for a connection."""
+        MONGO_POOL_WAIT_DURATION.labels("ok").observe(event.duration)
+        MONGO_POOL_CONNECTIONS.labels("in_use").inc()
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        """Counts a connection returned to the pool."""
+        MONGO_POOL_CONNECTIONS.labels("in_use").dec()
@@ -1,15 +1,77 @@
 """src/database/redis.py."""
 
-from redis.asyncio import Redis
-from src.config import settings
+import logging
+import time
+from typing import Optional
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.config import get_settings
+from src.infrastructure.metrics import (
+    REDIS_POOL_CONNECTIONS,
+    REDIS_POOL_WAIT_DURATION,
+)
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[Redis] = None
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Bounded Redis connection pool that records how long commands wait for a
+    connection and how many connections are checked out. When the pool is
+    exhausted, callers wait up to `timeout` seconds instead of failing at once.
+    """
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except RedisConnectionError:
+            REDIS_POOL_WAIT_DURATION.labels("error").observe(
+                time.perf_counter() - started
+            )
+            raise
+        REDIS_POOL_WAIT_DURATION.labels("ok").observe(time.perf_counter() - started)
+        REDIS_POOL_CONNECTIONS.set(len(self._in_use_connections))
+        return connection
+
+    async def release(self, connection) -> None:
+        await super().release(connection)
+        REDIS_POOL_CONNECTIONS.set(len(self._in_use_connections))
 
 
 def get_redis_client() -> Redis:
     """
-    Creates and returns an asynchronous Redis client instance.
+    Returns the process-wide asynchronous Redis client, creating it and its
+    bounded connection pool on first use.
     """
-    return Redis.from_url(
-        settings.REDIS_URL,
-        encoding="utf-8",
-        decode_responses=True,
-    )
+    global _client  # pylint: disable=global-statement
+
+    if _client is None:
+        settings = get_settings()
+        pool = InstrumentedConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_keepalive=settings.REDIS_SOCKET_KEEPALIVE,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        _client = Redis(connection_pool=pool)
+    return _client
+
+
+async def close_redis_client() -> None:
+    """
+    Closes the shared Redis client and disconnects its pool, if it was created.
+    """
+    global _client  # pylint: disable=global-statement
+
+    if _client is not None:
+        await _client.aclose(close_connection_pool=True)
+        _client = None
+        logger.info("Redis client closed.")
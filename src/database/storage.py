@@ -0,0 +1,51 @@
+"""src/database/storage.py."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+from src.infrastructure.metrics import FSM_STORAGE_DURATION
+from src.infrastructure.tracing import tracer
+
+
+@contextmanager
+def _observe(operation: str) -> Iterator[None]:
+    started = time.perf_counter()
+    with tracer.span(f"fsm.{operation}"):
+        try:
+            yield
+        finally:
+            FSM_STORAGE_DURATION.labels(operation).observe(
+                time.perf_counter() - started
+            )
+
+
+class InstrumentedRedisStorage(RedisStorage):
+    """
+    RedisStorage that records latency and a tracing span for every FSM
+    storage operation.
+    """
+
+    async def set_state(self, key: StorageKey, state: str | State | None = None):
+        with _observe("set_state"):
+            await super().set_state(key, state)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        with _observe("get_state"):
+            return await super().get_state(key)
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        with _observe("set_data"):
+            await super().set_data(key, data)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        with _observe("get_data"):
+            return await super().get_data(key)
+
+    async def update_data(
+        self, key: StorageKey, data: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        with _observe("update_data"):
+            return await super().update_data(key, data)
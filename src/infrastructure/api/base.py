@@ -1,13 +1,36 @@
 """src/infrastructure/api/base.py."""
 
 import logging
-from typing import Any, Dict, Optional
+import re
+import time
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
 import httpx
-from src.config import settings
-from src.database.models import BotUser
+from beanie.operators import Set
+from src.config import get_settings
+from src.database.models import BotUser, UserAuth
+from src.infrastructure.metrics import (
+    SWIPE_API_DURATION,
+    SWIPE_API_REQUESTS_TOTAL,
+    TOKEN_REFRESH_TOTAL,
+)
+from src.infrastructure.log_config import truncate
+from src.infrastructure.tracing import inject_headers, tracer
 
 logger = logging.getLogger(__name__)
 
+MAX_LOGGED_BODY = 500
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_label(url: str) -> str:
+    """
+    Normalizes a request URL into a low-cardinality endpoint label
+    (no host, no query string, numeric ids replaced).
+    """
+    return _ID_SEGMENT.sub("/{id}", urlsplit(url).path) or "/"
+
 
 class SwipeAPIError(Exception):
     """
@@ -25,10 +48,15 @@ class BaseAPIClient:
     Base client handling HTTP transport, error parsing, and token management.
     """
 
-    def __init__(self, user: Optional[BotUser] = None):
-        self.base_url = settings.SWIPE_API_BASE_URL
+    def __init__(
+        self,
+        user: Optional[Union[BotUser, UserAuth]] = None,
+        token: Optional[str] = None,
+    ):
+        self.base_url = get_settings().SWIPE_API_BASE_URL
         self.timeout = httpx.Timeout(10.0, connect=5.0)
         self.user = user
+        self.token = token
 
     async def _perform_request(
         self,
@@ -38,10 +66,18 @@ class BaseAPIClient:
         json: Optional[Dict] = None,
         data: Optional[Dict] = None,
         files: Optional[Dict] = None,
+        raw_json: Optional[bytes] = None,
     ) -> Any:
         """
         Internal method to execute the raw HTTP request using httpx.
+        `raw_json` is an already encoded JSON body (see encode_json).
         """
+        endpoint = endpoint_label(url)
+        headers = inject_headers(dict(headers))
+        if raw_json is not None:
+            headers["Content-Type"] = "application/json"
+        status = "error"
+        started = time.perf_counter()
         # verify=False is used for IP-based access without SSL certificate
         async with httpx.AsyncClient(timeout=self.timeout, verify=False) as client:
             try:
@@ -53,7 +89,9 @@ class BaseAPIClient:
                     json=json,
                     data=data,
                     files=files,
+                    content=raw_json,
                 )
+                status = str(response.status_code)
 
                 if response.is_error:
                     logger.error(
@@ -61,7 +99,7 @@ class BaseAPIClient:
                         method,
                         url,
                         response.status_code,
-                        response.text,
+                        truncate(response.text, MAX_LOGGED_BODY),
                     )
                     try:
                         error_data = response.json()
@@ -77,6 +115,12 @@ class BaseAPIClient:
                 logger.critical("Failed to connect to Swipe API: %s", e)
                 raise SwipeAPIError(503, "Service temporarily unavailable") from e
 
+            finally:
+                SWIPE_API_DURATION.labels(method, endpoint).observe(
+                    time.perf_counter() - started
+                )
+                SWIPE_API_REQUESTS_TOTAL.labels(method, endpoint, status).inc()
+
     async def make_request(
         self,
         method: str,
@@ -85,6 +129,7 @@ class BaseAPIClient:
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        raw_json: Optional[bytes] = None,
         is_retry: bool = False,
     ) -> Any:
         """
@@ -95,58 +140,81 @@ class BaseAPIClient:
         current_token = token
         if not current_token and self.user:
             current_token = self.user.api_access_token
+        if not current_token:
+            current_token = self.token
 
         if current_token:
             headers["Authorization"] = f"Bearer {current_token}"
 
         url = f"{self.base_url}{endpoint}"
 
-        try:
-            return await self._perform_request(method, url, headers, json, data, files)
-
-        except SwipeAPIError as e:
-            if (
-                e.status_code == 401
-                and not is_retry
-                and self.user
-                and self.user.api_refresh_token
-            ):
-                logger.info(
-                    "Token expired for user %s. Refreshing...", self.user.telegram_id
+        span_name = f"swipe_api {method} {endpoint_label(endpoint)}"
+        with tracer.span(span_name, retry=is_retry):
+            try:
+                return await self._perform_request(
+                    method, url, headers, json, data, files, raw_json
                 )
 
-                try:
-                    refresh_url = f"{self.base_url}/auth/refresh"
-                    refresh_response = await self._perform_request(
-                        "POST",
-                        refresh_url,
-                        headers={},
-                        json={"refresh_token": self.user.api_refresh_token},
+            except SwipeAPIError as e:
+                if (
+                    e.status_code == 401
+                    and not is_retry
+                    and self.user
+                    and self.user.api_refresh_token
+                ):
+                    logger.info(
+                        "Token expired for user %s. Refreshing...",
+                        self.user.telegram_id,
                     )
 
-                    new_access = refresh_response["access_token"]
-                    new_refresh = refresh_response["refresh_token"]
-
-                    self.user.api_access_token = new_access
-                    self.user.api_refresh_token = new_refresh
-                    await self.user.save()
-
-                    logger.info("Token refreshed successfully. Retrying request...")
-
-                    return await self.make_request(
-                        method,
-                        endpoint,
-                        token=None,
-                        json=json,
-                        data=data,
-                        files=files,
-                        is_retry=True,
-                    )
-
-                except Exception as refresh_error:
-                    logger.error("Token refresh failed: %s", refresh_error)
-                    raise SwipeAPIError(
-                        401, "Session expired. Please login again."
-                    ) from refresh_error
-
-            raise e
+                    refreshed = False
+                    try:
+                        with tracer.span("swipe_api.refresh"):
+                            refresh_url = f"{self.base_url}/auth/refresh"
+                            refresh_response = await self._perform_request(
+                                "POST",
+                                refresh_url,
+                                headers={},
+                                json={"refresh_token": self.user.api_refresh_token},
+                            )
+
+                            new_access = refresh_response["access_token"]
+                            new_refresh = refresh_response["refresh_token"]
+
+                            self.user.api_access_token = new_access
+                            self.user.api_refresh_token = new_refresh
+                            await BotUser.find_one(
+                                BotUser.telegram_id == self.user.telegram_id
+                            ).update(
+                                Set(
+                                    {
+                                        BotUser.api_access_token: new_access,
+                                        BotUser.api_refresh_token: new_refresh,
+                                    }
+                                )
+                            )
+
+                        refreshed = True
+                        TOKEN_REFRESH_TOTAL.labels("success").inc()
+                        logger.info("Token refreshed successfully. Retrying request...")
+
+                        return await self.make_request(
+                            method,
+                            endpoint,
+                            token=None,
+                            json=json,
+                            data=data,
+                            files=files,
+                            raw_json=raw_json,
+                            is_retry=True,
+                        )
+
+                    except Exception as refresh_error:
+                        if not refreshed:
+                            TOKEN_REFRESH_TOTAL.labels("failure").inc()
+                        logger.error("Token refresh failed: %s", refresh_error)
+                        raise SwipeAPIError(
+                            401, "Session expired. Please login again."
+                        ) from refresh_error
+
+                raise e
@@ -1,7 +1,7 @@
 """src/infrastructure/api/client.py."""
 
-from typing import Optional
-from src.database.models import BotUser
+from typing import Optional, Union
+from src.database.models import BotUser, UserAuth
 from src.infrastructure.api.base import BaseAPIClient
 from src.infrastructure.api.resources import (
     AuthResource,
@@ -15,11 +15,16 @@ class SwipeApiClient(BaseAPIClient):
     Main entry point for Swipe API interactions.
     Aggregates specific resources (auth, users, announcements) and
     inherits base logic (http, token refresh) from BaseAPIClient.
+    Background jobs without a user may pass a fixed service `token`.
     """
 
     # pylint: disable=too-few-public-methods
-    def __init__(self, user: Optional[BotUser] = None):
-        super().__init__(user)
+    def __init__(
+        self,
+        user: Optional[Union[BotUser, UserAuth]] = None,
+        token: Optional[str] = None,
+    ):
+        super().__init__(user, token)
         self.auth = AuthResource(self)
         self.users = UsersResource(self)
         self.announcements = AnnouncementsResource(self)
@@ -1,6 +1,7 @@
 """src/infrastructure/api/resources/announcement.py."""
 
 from typing import Dict, Any, List
+from src.infrastructure.executors import encode_json, executors
 
 
 class AnnouncementsResource:
@@ -30,5 +31,9 @@ class AnnouncementsResource:
         return await self.client.make_request("GET", f"/announcements/my{params}")
 
     async def create_announcement(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Creates a new announcement."""
-        return await self.client.make_request("POST", "/announcements/", json=data)
+        """
+        Creates a new announcement.
+        The payload carries base64 images, so it is encoded off the event loop.
+        """
+        body = await executors.threads.run(encode_json, data)
+        return await self.client.make_request("POST", "/announcements/", raw_json=body)
@@ -0,0 +1,160 @@
+"""src/infrastructure/executors.py."""
+
+import asyncio
+import base64
+import functools
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+from src.config import get_settings
+from src.infrastructure.metrics import (
+    EXECUTOR_PENDING,
+    EXECUTOR_RUN_DURATION,
+    EXECUTOR_WAIT_DURATION,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Multiple of 3, so chunks encode without padding and can be concatenated.
+B64_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def _timed(
+    func: Callable[..., T], submitted: float, *args: Any
+) -> Tuple[T, float, float]:
+    # Runs in the worker; time.monotonic() is system-wide, so the queue wait
+    # is also correct for process workers.
+    started = time.monotonic()
+    result = func(*args)
+    return result, started - submitted, time.monotonic() - started
+
+
+class WorkerPool:
+    """
+    Executor with a bounded backlog: at most `max_queue` tasks are handed to
+    the executor at once, further submitters wait on the event loop.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Executor], max_queue: int):
+        self.name = name
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(max_queue)
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The underlying executor, created on first use.
+        """
+        if self._executor is None:
+            self._executor = self._factory()
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs `func(*args)` on a worker and returns its result.
+        """
+        loop = asyncio.get_running_loop()
+        pending = EXECUTOR_PENDING.labels(self.name)
+        pending.inc()
+        try:
+            async with self._slots:
+                result, waited, ran = await loop.run_in_executor(
+                    self.executor, _timed, func, time.monotonic(), *args
+                )
+        finally:
+            pending.dec()
+        EXECUTOR_WAIT_DURATION.labels(self.name).observe(waited)
+        EXECUTOR_RUN_DURATION.labels(self.name).observe(ran)
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Stops the workers (without waiting for queued tasks).
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class Executors:
+    """
+    Worker pools for CPU work that must not run on the event loop:
+    `threads` for short or GIL-releasing work, `processes` for heavy
+    pure-Python work such as image transforms.
+    """
+
+    def __init__(self):
+        self._threads: Optional[WorkerPool] = None
+        self._processes: Optional[WorkerPool] = None
+
+    @property
+    def threads(self) -> WorkerPool:
+        """
+        Thread pool.
+        """
+        if self._threads is None:
+            settings = get_settings()
+            self._threads = WorkerPool(
+                "threads",
+                functools.partial(
+                    ThreadPoolExecutor,
+                    max_workers=settings.EXECUTOR_THREADS,
+                    thread_name_prefix="cpu-worker",
+                ),
+                settings.EXECUTOR_MAX_QUEUE,
+            )
+        return self._threads
+
+    @property
+    def processes(self) -> WorkerPool:
+        """
+        Process pool, started on first use.
+        """
+        if self._processes is None:
+            settings = get_settings()
+            self._processes = WorkerPool(
+                "processes",
+                functools.partial(
+                    ProcessPoolExecutor, max_workers=settings.EXECUTOR_PROCESSES
+                ),
+                settings.EXECUTOR_MAX_QUEUE,
+            )
+        return self._processes
+
+    def shutdown(self) -> None:
+        """
+        Stops all pools.
+        """
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown()
+        self._threads = self._processes = None
+
+
+executors = Executors()
+
+
+def b64encode_chunked(data: bytes) -> str:
+    """
+    Base64-encodes in chunks, so a worker thread hands the GIL back to the
+    event loop between chunks instead of holding it for a multi-MB photo.
+    """
+    view = memoryview(data)
+    return "".join(
+        base64.b64encode(view[i : i + B64_CHUNK_SIZE]).decode("ascii")
+        for i in range(0, len(view), B64_CHUNK_SIZE)
+    )
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Serializes a request payload to UTF-8 JSON bytes.
+    """
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
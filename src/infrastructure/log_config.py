@@ -0,0 +1,143 @@
+"""src/infrastructure/log_config.py."""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Mapping, Optional
+from src.infrastructure.tracing import current_span
+
+TEXT_FORMAT = (
+    "%(asctime)s - [%(levelname)s] - %(name)s - (%(filename)s)"
+    ".%(funcName)s(%(lineno)d) - %(message)s"
+)
+
+DEFAULT_MAX_LENGTH = 2000
+
+# Attributes every LogRecord has; anything else was passed via `extra=`.
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()
+) | {"message", "asctime", "trace_id", "span_id"}
+
+
+def truncate(text: str, limit: int = DEFAULT_MAX_LENGTH) -> str:
+    """
+    Cuts a long string (e.g. an HTTP response body) for logging.
+    """
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text) - limit} chars truncated]"
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of records below WARNING for the configured loggers.
+    Rates apply to a logger and its children, the most specific name wins.
+    """
+
+    def __init__(self, rates: Mapping[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+        self._resolved: Dict[str, Optional[float]] = {}
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        if name not in self._resolved:
+            rate = None
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        return rate is None or random.random() < rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that only renders the message in the calling thread
+    (so later mutation of the arguments cannot change it) and leaves
+    formatting and I/O to the listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, max_length: int):
+        super().__init__(log_queue)
+        self.max_length = max_length
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = truncate(record.getMessage(), self.max_length)
+        record.args = None
+        span = current_span()
+        if span is not None:
+            record.trace_id = span.trace_id
+            record.span_id = span.span_id
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Renders each record as a single JSON object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.module}.{record.funcName}:{record.lineno}",
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            payload["trace_id"] = trace_id
+            payload["span_id"] = record.span_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def configure_logging(
+    level: str = "INFO",
+    fmt: str = "text",
+    sampling: Optional[Mapping[str, float]] = None,
+    max_length: int = DEFAULT_MAX_LENGTH,
+) -> QueueListener:
+    """
+    Routes all logging through a queue drained by a background thread, so the
+    event loop never blocks on stream I/O. The listener is flushed and stopped
+    at interpreter exit; the started listener is returned.
+    """
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if fmt == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = NonBlockingQueueHandler(log_queue, max_length)
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,101 @@
+"""src/infrastructure/loop_monitor.py."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+from src.infrastructure.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+
+class LoopWatchdog:
+    """
+    Measures event-loop lag with a heartbeat task and, from a separate
+    thread, detects stalls: when the heartbeat is late by more than the
+    threshold, the stack of the loop thread and the running task are logged.
+    Tasks are named after the update and handler they serve (see
+    TaskAttributionMiddleware), so the task name identifies the culprit.
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.25):
+        self.interval = interval
+        self.threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._reported_beat = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            EVENT_LOOP_LAG.observe(max(lag, 0.0))
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            last_beat = self._last_beat
+            blocked = time.monotonic() - last_beat - self.interval
+            if blocked > self.threshold and self._reported_beat != last_beat:
+                self._reported_beat = last_beat
+                self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        EVENT_LOOP_STALLS_TOTAL.inc()
+        # pylint: disable=protected-access
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>"
+        task = asyncio.current_task(self._loop)
+        logger.warning(
+            "Event loop blocked for %.0f ms in task %r\n%s",
+            blocked * 1000,
+            task.get_name() if task else None,
+            stack,
+        )
+
+    def start(self) -> None:
+        """
+        Starts the heartbeat and the watchdog thread; call from the loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-heartbeat")
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """
+        Stops monitoring.
+        """
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+
+def enable_debug_mode(slow_callback: float) -> None:
+    """
+    Turns on asyncio debug mode for the running loop, so callbacks slower
+    than `slow_callback` seconds are logged (with the task name).
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = slow_callback
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    logger.warning("asyncio debug mode on (slow callback > %.3fs)", slow_callback)
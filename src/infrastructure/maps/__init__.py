@@ -0,0 +1,16 @@
+"""src/infrastructure/maps/__init__.py."""
+
+from .png import Raster, decode_png, encode_png
+from .render import fit_zoom, project, render_map, tiles_for
+from .tiles import TileStore
+
+__all__ = [
+    "Raster",
+    "TileStore",
+    "decode_png",
+    "encode_png",
+    "fit_zoom",
+    "project",
+    "render_map",
+    "tiles_for",
+]
@@ -0,0 +1,164 @@
+"""src/infrastructure/maps/png.py."""
+
+import struct
+import zlib
+from typing import List, NamedTuple
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Channels per color type: grayscale, RGB, palette, grayscale+alpha, RGBA.
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+class Raster(NamedTuple):
+    """
+    An 8-bit RGB image, rows top to bottom.
+    """
+
+    width: int
+    height: int
+    pixels: bytearray
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(data: bytes, height: int, stride: int, bpp: int) -> bytearray:
+    out = bytearray(height * stride)
+    previous = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        kind = data[pos]
+        row = bytearray(data[pos + 1 : pos + 1 + stride])
+        pos += 1 + stride
+        if kind == 1:
+            for i in range(bpp, stride):
+                row[i] = (row[i] + row[i - bpp]) & 0xFF
+        elif kind == 2:
+            row = bytearray((x + p) & 0xFF for x, p in zip(row, previous))
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                if i >= bpp:
+                    row[i] = (
+                        row[i] + _paeth(row[i - bpp], previous[i], previous[i - bpp])
+                    ) & 0xFF
+                else:
+                    row[i] = (row[i] + previous[i]) & 0xFF
+        elif kind != 0:
+            raise ValueError(f"Unknown PNG filter type {kind}")
+        out[y * stride : (y + 1) * stride] = row
+        previous = row
+    return out
+
+
+def _unpack(row: bytes, width: int, depth: int) -> List[int]:
+    """
+    Splits a row of 1-, 2- or 4-bit samples into one value per pixel.
+    """
+    mask = (1 << depth) - 1
+    values = []
+    for byte in row:
+        for shift in range(8 - depth, -1, -depth):
+            values.append((byte >> shift) & mask)
+    return values[:width]
+
+
+def decode_png(data: bytes) -> Raster:
+    """
+    Decodes a non-interlaced PNG (any color type; bit depth 8, or below 8
+    for grayscale and palette images) into RGB. Alpha is dropped.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG image")
+    pos = len(PNG_SIGNATURE)
+    idat = []
+    palette = b""
+    width = height = depth = color = 0
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        kind = data[pos + 4 : pos + 8]
+        chunk = data[pos + 8 : pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(
+                ">IIBBBBB", chunk
+            )
+            if interlace:
+                raise ValueError("Interlaced PNGs are not supported")
+            if color not in _CHANNELS or (depth != 8 and color not in (0, 3)):
+                raise ValueError(f"Unsupported PNG format {color}/{depth}")
+        elif kind == b"PLTE":
+            palette = chunk
+        elif kind == b"IDAT":
+            idat.append(chunk)
+        elif kind == b"IEND":
+            break
+
+    channels = _CHANNELS[color]
+    stride = (width * channels * depth + 7) // 8
+    raw = _unfilter(
+        zlib.decompress(b"".join(idat)), height, stride, max(1, channels * depth // 8)
+    )
+
+    if color == 2:
+        return Raster(width, height, raw)
+    pixels = bytearray(width * height * 3)
+    if color == 6:
+        for c in range(3):
+            pixels[c::3] = raw[c::4]
+    elif color == 4:
+        for c in range(3):
+            pixels[c::3] = raw[0::2]
+    elif depth == 8:
+        if color == 0:
+            for c in range(3):
+                pixels[c::3] = raw
+        else:
+            pixels = bytearray(b"".join(palette[i * 3 : i * 3 + 3] for i in raw))
+    else:
+        scale = 255 // ((1 << depth) - 1)
+        out = bytearray()
+        for y in range(height):
+            for value in _unpack(raw[y * stride : (y + 1) * stride], width, depth):
+                if color == 0:
+                    out += bytes((value * scale,) * 3)
+                else:
+                    out += palette[value * 3 : value * 3 + 3]
+        pixels = out
+    return Raster(width, height, pixels)
+
+
+def _chunk(kind: bytes, body: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(body))
+        + kind
+        + body
+        + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(raster: Raster) -> bytes:
+    """
+    Encodes an RGB raster as PNG.
+    """
+    stride = raster.width * 3
+    rows = b"".join(
+        b"\x00" + bytes(raster.pixels[y * stride : (y + 1) * stride])
+        for y in range(raster.height)
+    )
+    header = struct.pack(">IIBBBBB", raster.width, raster.height, 8, 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(rows, 6))
+        + _chunk(b"IEND", b"")
+    )
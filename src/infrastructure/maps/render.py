@@ -0,0 +1,178 @@
+"""src/infrastructure/maps/render.py."""
+
+import logging
+import math
+import struct
+import zlib
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .png import Raster, decode_png, encode_png
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+# Drawn where a tile is missing from the store.
+BACKGROUND = (0xEE, 0xEE, 0xEE)
+MARKER_FILL = (0xD3, 0x2F, 0x2F)
+MARKER_EDGE = (0xFF, 0xFF, 0xFF)
+MARKER_RADIUS = 13
+
+# 3x5 digit glyphs, drawn at 2x.
+_DIGITS = {
+    "0": ("111", "101", "101", "101", "111"),
+    "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"),
+    "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"),
+    "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"),
+    "7": ("111", "001", "001", "001", "001"),
+    "8": ("111", "101", "111", "101", "111"),
+    "9": ("111", "101", "111", "001", "111"),
+}
+_GLYPH_SCALE = 2
+
+Point = Tuple[float, float]
+TileKey = Tuple[int, int]
+
+
+def project(lat: float, lon: float, zoom: int) -> Tuple[float, float]:
+    """
+    Web Mercator pixel coordinates of a point at a zoom level.
+    """
+    scale = TILE_SIZE * 2**zoom
+    lat = max(min(lat, 85.0511), -85.0511)
+    sin = math.sin(math.radians(lat))
+    x = (lon + 180.0) / 360.0 * scale
+    y = (0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)) * scale
+    return x, y
+
+
+def fit_zoom(
+    points: Sequence[Point], width: int, height: int, max_zoom: int, margin: int = 40
+) -> int:
+    """
+    The highest zoom (up to `max_zoom`) at which all points fit in the image.
+    """
+    for zoom in range(max_zoom, -1, -1):
+        xs, ys = zip(*(project(lat, lon, zoom) for lat, lon in points))
+        if (
+            max(xs) - min(xs) <= width - 2 * margin
+            and max(ys) - min(ys) <= height - 2 * margin
+        ):
+            return zoom
+    return 0
+
+
+def _viewport(
+    points: Sequence[Point], zoom: int, width: int, height: int
+) -> Tuple[int, int]:
+    """
+    Pixel coordinates of the top-left corner of an image centered on the points.
+    """
+    xs, ys = zip(*(project(lat, lon, zoom) for lat, lon in points))
+    return (
+        int((min(xs) + max(xs)) / 2 - width / 2),
+        int((min(ys) + max(ys)) / 2 - height / 2),
+    )
+
+
+def tiles_for(
+    points: Sequence[Point], zoom: int, width: int, height: int
+) -> List[TileKey]:
+    """
+    The tiles (x, y) the image of the points at this zoom covers. Near the
+    antimeridian x can fall outside [0, 2**zoom); the store wraps it.
+    """
+    left, top = _viewport(points, zoom, width, height)
+    limit = 2**zoom
+    return [
+        (tx, ty)
+        for ty in range(top // TILE_SIZE, (top + height - 1) // TILE_SIZE + 1)
+        for tx in range(left // TILE_SIZE, (left + width - 1) // TILE_SIZE + 1)
+        if 0 <= ty < limit
+    ]
+
+
+def _blit(canvas: Raster, tile: Raster, left: int, top: int) -> None:
+    for row in range(tile.height):
+        y = top + row
+        if not 0 <= y < canvas.height:
+            continue
+        start, end = max(0, left), min(canvas.width, left + tile.width)
+        if start >= end:
+            continue
+        src = (row * tile.width + start - left) * 3
+        dst = (y * canvas.width + start) * 3
+        canvas.pixels[dst : dst + (end - start) * 3] = tile.pixels[
+            src : src + (end - start) * 3
+        ]
+
+
+def _put(canvas: Raster, x: int, y: int, color: Tuple[int, int, int]) -> None:
+    if 0 <= x < canvas.width and 0 <= y < canvas.height:
+        pos = (y * canvas.width + x) * 3
+        canvas.pixels[pos : pos + 3] = bytes(color)
+
+
+def _glyph_pixels(label: str) -> Iterator[Tuple[int, int]]:
+    """
+    Offsets of the lit pixels of a label, centered on (0, 0).
+    """
+    width = (len(label) * 4 - 1) * _GLYPH_SCALE
+    height = 5 * _GLYPH_SCALE
+    for index, char in enumerate(label):
+        for row, bits in enumerate(_DIGITS[char]):
+            for col, bit in enumerate(bits):
+                if bit != "1":
+                    continue
+                for dy in range(_GLYPH_SCALE):
+                    for dx in range(_GLYPH_SCALE):
+                        yield (
+                            (index * 4 + col) * _GLYPH_SCALE + dx - width // 2,
+                            row * _GLYPH_SCALE + dy - height // 2,
+                        )
+
+
+def _marker(canvas: Raster, x: int, y: int, number: int) -> None:
+    radius = MARKER_RADIUS
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            distance = dx * dx + dy * dy
+            if distance <= (radius - 2) ** 2:
+                _put(canvas, x + dx, y + dy, MARKER_FILL)
+            elif distance <= radius * radius:
+                _put(canvas, x + dx, y + dy, MARKER_EDGE)
+    for dx, dy in _glyph_pixels(str(number)):
+        _put(canvas, x + dx, y + dy, MARKER_EDGE)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def render_map(
+    points: Sequence[Point],
+    zoom: int,
+    tiles: Dict[TileKey, Optional[bytes]],
+    width: int,
+    height: int,
+) -> bytes:
+    """
+    Draws the points as markers numbered 1..n over the map tiles and returns
+    a PNG. Tiles are PNG bytes keyed by (x, y) as listed by `tiles_for`;
+    missing or unreadable ones are left blank. CPU-bound: meant for the
+    process pool.
+    """
+    canvas = Raster(width, height, bytearray(bytes(BACKGROUND) * (width * height)))
+    left, top = _viewport(points, zoom, width, height)
+    for (tx, ty), data in tiles.items():
+        if data is None:
+            continue
+        try:
+            tile = decode_png(data)
+        except (ValueError, IndexError, struct.error, zlib.error) as e:
+            logger.warning("Skipping unreadable tile %s/%s/%s: %s", zoom, tx, ty, e)
+            continue
+        _blit(canvas, tile, tx * TILE_SIZE - left, ty * TILE_SIZE - top)
+
+    for number, (lat, lon) in enumerate(points, start=1):
+        x, y = project(lat, lon, zoom)
+        _marker(canvas, int(x) - left, int(y) - top, number)
+    return encode_png(canvas)
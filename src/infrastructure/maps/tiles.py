@@ -0,0 +1,83 @@
+"""src/infrastructure/maps/tiles.py."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import httpx
+from src.infrastructure.executors import executors
+from .render import TileKey
+
+logger = logging.getLogger(__name__)
+
+
+class TileStore:
+    """
+    Map tiles on disk in the usual slippy-map layout, {root}/{z}/{x}/{y}.png
+    (as exported by tile downloaders). With `url_template` set (e.g.
+    "https://tile.example.org/{z}/{x}/{y}.png"), tiles missing on disk are
+    downloaded once and kept, so the directory doubles as a tile cache;
+    without it only the local tiles are used.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        url_template: Optional[str] = None,
+        user_agent: str = "swipe-bot",
+        timeout: float = 10.0,
+    ):
+        self.root = Path(root)
+        self.url_template = url_template
+        self.user_agent = user_agent
+        self.timeout = timeout
+
+    def _path(self, zoom: int, x: int, y: int) -> Path:
+        return self.root / str(zoom) / str(x) / f"{y}.png"
+
+    def _read(self, zoom: int, keys: List[TileKey]) -> Dict[TileKey, Optional[bytes]]:
+        limit = 2**zoom
+        tiles: Dict[TileKey, Optional[bytes]] = {}
+        for x, y in keys:
+            path = self._path(zoom, x % limit, y)
+            tiles[(x, y)] = path.read_bytes() if path.is_file() else None
+        return tiles
+
+    def _write(self, zoom: int, x: int, y: int, data: bytes) -> None:
+        path = self._path(zoom, x, y)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".tmp")
+        partial.write_bytes(data)
+        partial.replace(path)
+
+    async def _download(
+        self, client: httpx.AsyncClient, zoom: int, x: int, y: int
+    ) -> Optional[bytes]:
+        url = self.url_template.format(z=zoom, x=x, y=y)
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("Could not download map tile %s: %s", url, e)
+            return None
+        await executors.threads.run(self._write, zoom, x, y, response.content)
+        return response.content
+
+    async def get_many(
+        self, zoom: int, keys: Iterable[TileKey]
+    ) -> Dict[TileKey, Optional[bytes]]:
+        """
+        Returns the PNG bytes of the tiles, None for the ones unavailable.
+        """
+        tiles = await executors.threads.run(self._read, zoom, list(keys))
+        missing = [key for key, data in tiles.items() if data is None]
+        if missing and self.url_template:
+            limit = 2**zoom
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers={"User-Agent": self.user_agent}
+            ) as client:
+                downloaded = await asyncio.gather(
+                    *(self._download(client, zoom, x % limit, y) for x, y in missing)
+                )
+            tiles.update(zip(missing, downloaded))
+        return tiles
@@ -0,0 +1,73 @@
+"""src/infrastructure/metrics/__init__.py."""
+
+from .collectors import (
+    BROADCAST_MESSAGES_TOTAL,
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_STALLS_TOTAL,
+    EXECUTOR_PENDING,
+    EXECUTOR_RUN_DURATION,
+    EXECUTOR_WAIT_DURATION,
+    FSM_STORAGE_DURATION,
+    HANDLER_CALLS_TOTAL,
+    HANDLER_DURATION,
+    INLINE_QUERIES_TOTAL,
+    LISTING_SYNC_CHANGES_TOTAL,
+    LISTING_SYNC_DURATION,
+    MAP_SNAPSHOT_TOTAL,
+    MONGO_COMMAND_DURATION,
+    MONGO_POOL_CONNECTIONS,
+    MONGO_POOL_WAIT_DURATION,
+    PHOTO_FILE_ID_CACHE_TOTAL,
+    REDIS_POOL_CONNECTIONS,
+    REDIS_POOL_WAIT_DURATION,
+    SAVED_SEARCH_ALERTS_TOTAL,
+    SEND_QUEUE_MESSAGES_TOTAL,
+    SEND_QUEUE_PENDING,
+    SWIPE_API_DURATION,
+    SWIPE_API_REQUESTS_TOTAL,
+    TELEGRAM_REQUEST_DURATION,
+    TELEGRAM_RETRY_AFTER_TOTAL,
+    TOKEN_REFRESH_TOTAL,
+    UPDATE_DURATION,
+    UPDATES_TOTAL,
+)
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, registry
+from .server import MetricsServer
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "registry",
+    "BROADCAST_MESSAGES_TOTAL",
+    "EVENT_LOOP_LAG",
+    "EVENT_LOOP_STALLS_TOTAL",
+    "EXECUTOR_PENDING",
+    "EXECUTOR_RUN_DURATION",
+    "EXECUTOR_WAIT_DURATION",
+    "FSM_STORAGE_DURATION",
+    "HANDLER_CALLS_TOTAL",
+    "HANDLER_DURATION",
+    "INLINE_QUERIES_TOTAL",
+    "LISTING_SYNC_CHANGES_TOTAL",
+    "LISTING_SYNC_DURATION",
+    "MAP_SNAPSHOT_TOTAL",
+    "MONGO_COMMAND_DURATION",
+    "MONGO_POOL_CONNECTIONS",
+    "MONGO_POOL_WAIT_DURATION",
+    "PHOTO_FILE_ID_CACHE_TOTAL",
+    "REDIS_POOL_CONNECTIONS",
+    "REDIS_POOL_WAIT_DURATION",
+    "SAVED_SEARCH_ALERTS_TOTAL",
+    "SEND_QUEUE_MESSAGES_TOTAL",
+    "SEND_QUEUE_PENDING",
+    "SWIPE_API_DURATION",
+    "SWIPE_API_REQUESTS_TOTAL",
+    "TELEGRAM_REQUEST_DURATION",
+    "TELEGRAM_RETRY_AFTER_TOTAL",
+    "TOKEN_REFRESH_TOTAL",
+    "UPDATE_DURATION",
+    "UPDATES_TOTAL",
+]
@@ -0,0 +1,164 @@
+"""src/infrastructure/metrics/collectors.py."""
+
+from .registry import registry
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+UPDATES_TOTAL = registry.counter(
+    "bot_updates",
+    "Incoming updates by type and outcome.",
+    ("update_type", "status"),
+)
+UPDATE_DURATION = registry.histogram(
+    "bot_update_duration_seconds",
+    "Total processing time of an update, middlewares included.",
+    ("update_type",),
+)
+HANDLER_CALLS_TOTAL = registry.counter(
+    "bot_handler_calls",
+    "Handler invocations by router and handler.",
+    ("router", "handler", "status"),
+)
+HANDLER_DURATION = registry.histogram(
+    "bot_handler_duration_seconds",
+    "Handler execution time by router and handler.",
+    ("router", "handler"),
+)
+
+SWIPE_API_REQUESTS_TOTAL = registry.counter(
+    "swipe_api_requests",
+    "Swipe API requests by endpoint and response status.",
+    ("method", "endpoint", "status"),
+)
+SWIPE_API_DURATION = registry.histogram(
+    "swipe_api_request_duration_seconds",
+    "Swipe API request latency by endpoint.",
+    ("method", "endpoint"),
+)
+TOKEN_REFRESH_TOTAL = registry.counter(
+    "swipe_api_token_refresh",
+    "Access token refresh attempts by result.",
+    ("result",),
+)
+
+FSM_STORAGE_DURATION = registry.histogram(
+    "fsm_storage_operation_duration_seconds",
+    "FSM storage operation latency.",
+    ("operation",),
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_COMMAND_DURATION = registry.histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency by command and outcome.",
+    ("command", "status"),
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_POOL_WAIT_DURATION = registry.histogram(
+    "mongo_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled MongoDB connection, by outcome.",
+    ("status",),
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_POOL_CONNECTIONS = registry.gauge(
+    "mongo_pool_connections",
+    "MongoDB connections by state (open or in_use).",
+    ("state",),
+)
+REDIS_POOL_WAIT_DURATION = registry.histogram(
+    "redis_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled Redis connection, by outcome.",
+    ("status",),
+    buckets=LATENCY_BUCKETS,
+)
+REDIS_POOL_CONNECTIONS = registry.gauge(
+    "redis_pool_connections_in_use",
+    "Redis connections currently checked out of the pool.",
+)
+
+PHOTO_FILE_ID_CACHE_TOTAL = registry.counter(
+    "photo_file_id_cache",
+    "Listing photos sent by cached file_id (hit) or by URL (miss).",
+    ("result",),
+)
+
+MAP_SNAPSHOT_TOTAL = registry.counter(
+    "map_snapshots",
+    "Page maps sent by cached file_id (hit) or rendered (render).",
+    ("result",),
+)
+
+INLINE_QUERIES_TOTAL = registry.counter(
+    "inline_queries",
+    "Inline queries by outcome (hit, miss, debounced, not_ready, anonymous).",
+    ("result",),
+)
+
+LISTING_SYNC_DURATION = registry.histogram(
+    "listing_sync_duration_seconds",
+    "Duration of listing sync passes by kind (full or incremental).",
+    ("kind",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+LISTING_SYNC_CHANGES_TOTAL = registry.counter(
+    "listing_sync_changes",
+    "Listings stored (upserted) or purged by the listing sync.",
+    ("change",),
+)
+
+SEND_QUEUE_PENDING = registry.gauge(
+    "send_queue_pending",
+    "Bot-initiated messages waiting in the send queue.",
+)
+SEND_QUEUE_MESSAGES_TOTAL = registry.counter(
+    "send_queue_messages",
+    "Bot-initiated messages by outcome (sent, retried, blocked, failed).",
+    ("result",),
+)
+SAVED_SEARCH_ALERTS_TOTAL = registry.counter(
+    "saved_search_alerts",
+    "Saved-search alert messages queued.",
+)
+BROADCAST_MESSAGES_TOTAL = registry.counter(
+    "broadcast_messages",
+    "Admin broadcast messages by outcome (sent, retried, blocked, failed).",
+    ("result",),
+)
+
+TELEGRAM_REQUEST_DURATION = registry.histogram(
+    "telegram_request_duration_seconds",
+    "Outgoing Bot API call latency by method and outcome.",
+    ("method", "status"),
+)
+TELEGRAM_RETRY_AFTER_TOTAL = registry.counter(
+    "telegram_retry_after",
+    "Bot API calls rejected with 429 (flood control) by method.",
+    ("method",),
+)
+
+EVENT_LOOP_LAG = registry.histogram(
+    "bot_event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wake-up and the actual one.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_STALLS_TOTAL = registry.counter(
+    "bot_event_loop_stalls",
+    "Times the event loop was blocked longer than the stall threshold.",
+)
+
+EXECUTOR_PENDING = registry.gauge(
+    "executor_pending_tasks",
+    "Tasks submitted to a worker pool and not finished yet (queued or running).",
+    ("pool",),
+)
+EXECUTOR_WAIT_DURATION = registry.histogram(
+    "executor_queue_wait_seconds",
+    "Time a task waited for a free worker.",
+    ("pool",),
+    buckets=LATENCY_BUCKETS,
+)
+EXECUTOR_RUN_DURATION = registry.histogram(
+    "executor_run_seconds",
+    "Time a task spent running on a worker.",
+    ("pool",),
+    buckets=LATENCY_BUCKETS,
+)
@@ -0,0 +1,286 @@
+"""src/infrastructure/metrics/registry.py."""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Some collectors (e.g. PyMongo listeners) report from driver threads.
+_lock = threading.Lock()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """
+    Base class for metrics with a fixed set of label names.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: object):
+        """
+        Returns the child metric for the given label values.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        Yields (suffix, formatted labels, value) triples.
+        """
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """
+        Renders the metric in the Prometheus text exposition format.
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing counter.
+    """
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increments the unlabelled counter.
+        """
+        self.labels().inc(amount)
+
+    def value(self, *values: object) -> float:
+        """
+        Returns the current value for the given labels.
+        """
+        return self.labels(*values).value
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            yield "_total", _format_labels(self.labelnames, key), child.value
+
+
+class _CounterChild(_Value):
+    def inc(self, amount: float = 1.0) -> None:
+        with _lock:
+            self.value += amount
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down.
+    """
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """
+        Sets the unlabelled gauge.
+        """
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increments the unlabelled gauge.
+        """
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrements the unlabelled gauge.
+        """
+        self.labels().dec(amount)
+
+    def value(self, *values: object) -> float:
+        """
+        Returns the current value for the given labels.
+        """
+        return self.labels(*values).value
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            yield "", _format_labels(self.labelnames, key), child.value
+
+
+class _GaugeChild(_Value):
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with _lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with _lock:
+            self.value -= amount
+
+
+class Histogram(Metric):
+    """
+    Cumulative histogram with fixed buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """
+        Observes a value for the unlabelled histogram.
+        """
+        self.labels().observe(value)
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, child.counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, child.sum
+            yield "_count", labels, child.count
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together on the /metrics endpoint.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Adds a metric; names must be unique.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        """
+        Looks a metric up by name.
+        """
+        return self._metrics.get(name)
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        """
+        Creates and registers a counter.
+        """
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        """
+        Creates and registers a gauge.
+        """
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        """
+        Creates and registers a histogram.
+        """
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
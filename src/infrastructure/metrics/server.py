@@ -0,0 +1,53 @@
+"""src/infrastructure/metrics/server.py."""
+
+import logging
+from typing import Optional
+from aiohttp import web
+from .registry import MetricsRegistry, registry as default_registry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """
+    Minimal aiohttp server exposing the registry on /metrics.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.registry = registry or default_registry
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle_metrics(self, _request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode("utf-8"),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    async def start(self) -> None:
+        """
+        Starts serving the metrics endpoint.
+        """
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info("Metrics available at http://%s:%s/metrics", self.host, self.port)
+
+    async def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
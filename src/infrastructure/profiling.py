@@ -0,0 +1,148 @@
+"""src/infrastructure/profiling.py."""
+
+import builtins
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROCESS_START = time.perf_counter()
+
+
+class ImportTimer:
+    """
+    Measures self and cumulative execution time of newly imported modules
+    by wrapping builtins.__import__ (the same numbers as `python -X importtime`).
+    """
+
+    def __init__(self):
+        self.modules: Dict[str, Tuple[float, float]] = {}
+        self._stack: List[float] = []
+        self._original: Optional[Callable[..., Any]] = None
+
+    def _import(self, name, globals_=None, locals_=None, fromlist=(), level=0):
+        if level and globals_:
+            package = (globals_.get("__package__") or "").rsplit(".", level - 1)[0]
+            full_name = f"{package}.{name}" if name else package
+        else:
+            full_name = name
+
+        if full_name in sys.modules:
+            return self._original(name, globals_, locals_, fromlist, level)
+
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals_, locals_, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.modules[full_name] = (elapsed - children, elapsed)
+
+    def start(self) -> None:
+        """
+        Installs the import hook.
+        """
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        """
+        Restores the original import function.
+        """
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def top(self, limit: int = 20) -> List[Tuple[str, float, float]]:
+        """
+        Returns the slowest modules by cumulative time (seconds).
+        """
+        ranked = sorted(self.modules.items(), key=lambda i: i[1][1], reverse=True)
+        return [(name, own, total) for name, (own, total) in ranked[:limit]]
+
+
+class StartupProfiler:
+    """
+    Startup profile mode: import-time breakdown, named startup phases and
+    time from process start to the first handled update.
+    """
+
+    def __init__(self, output_file: Optional[str] = None, top: int = 20):
+        self.output_file = output_file
+        self.top_limit = top
+        self.imports = ImportTimer()
+        self.phases: Dict[str, float] = {}
+        self.first_update: Optional[float] = None
+
+    def start(self) -> None:
+        """
+        Starts recording imports.
+        """
+        self.imports.start()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Times a named startup phase.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Update middleware recording when the first update has been handled.
+        """
+        result = await handler(event, data)
+        if self.first_update is None:
+            self.first_update = time.perf_counter() - PROCESS_START
+            self.report()
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Logs the collected profile and writes it to the output file if configured.
+        """
+        self.imports.stop()
+        profile = {
+            "since_process_start": round(time.perf_counter() - PROCESS_START, 4),
+            "first_update": (
+                round(self.first_update, 4) if self.first_update is not None else None
+            ),
+            "phases": {name: round(value, 4) for name, value in self.phases.items()},
+            "imports": [
+                {"module": name, "self": round(own, 4), "cumulative": round(total, 4)}
+                for name, own, total in self.imports.top(self.top_limit)
+            ],
+        }
+
+        logger.info("Startup profile: phases=%s", profile["phases"])
+        for entry in profile["imports"]:
+            logger.info(
+                "Import %-50s self=%.4fs cumulative=%.4fs",
+                entry["module"],
+                entry["self"],
+                entry["cumulative"],
+            )
+        if self.first_update is not None:
+            logger.info("First update handled %.3fs after start", self.first_update)
+
+        if self.output_file:
+            with open(self.output_file, "w", encoding="utf-8") as fp:
+                json.dump(profile, fp, indent=2)
+
+        return profile
@@ -0,0 +1,13 @@
+"""src/infrastructure/search/__init__.py."""
+
+from .index import ListingIndex, SearchFilters, listing_index, tokenize
+from .subscriptions import SubscriptionIndex, subscription_index
+
+__all__ = [
+    "ListingIndex",
+    "SearchFilters",
+    "SubscriptionIndex",
+    "listing_index",
+    "subscription_index",
+    "tokenize",
+]
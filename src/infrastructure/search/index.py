@@ -0,0 +1,332 @@
+"""src/infrastructure/search/index.py."""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from pydantic import BaseModel
+from src.infrastructure.sync import ListingChanges
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+MIN_TOKEN_LENGTH = 2
+# Listings indexed by `load` between yields to the event loop.
+LOAD_YIELD_EVERY = 1000
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Splits text into lower-case word tokens, dropping one-letter ones.
+    """
+    if not text:
+        return []
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SearchFilters(BaseModel):
+    """
+    Listing search criteria; unset fields do not constrain the result.
+    Stored in the FSM data between pages.
+    """
+
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_area: Optional[float] = None
+    max_area: Optional[float] = None
+    rooms: Optional[int] = None
+    keywords: List[str] = []
+
+    def keyword_tokens(self) -> List[str]:
+        """
+        The keywords split into the tokens matched against addresses.
+        """
+        return [token for keyword in self.keywords for token in tokenize(keyword)]
+
+
+class ListingEntry(NamedTuple):
+    """
+    The searchable fields of a listing.
+    """
+
+    price: Optional[float]
+    area: Optional[float]
+    rooms: Optional[int]
+    tokens: FrozenSet[str]
+
+
+def listing_entry(item: Dict[str, Any]) -> ListingEntry:
+    """
+    Extracts the searchable fields of a listing as returned by the API.
+    """
+    # The API returns the room count as a string, e.g. "2".
+    rooms = _number(item.get("number_of_rooms"))
+    return ListingEntry(
+        price=_number(item.get("price")),
+        area=_number(item.get("area")),
+        rooms=int(rooms) if rooms is not None else None,
+        tokens=frozenset(tokenize(item.get("address"))),
+    )
+
+
+def entry_matches(
+    entry: ListingEntry, filters: SearchFilters, keywords: List[str]
+) -> bool:
+    """
+    Checks a listing against filters; `keywords` are their keyword tokens.
+    """
+    for value, low, high in (
+        (entry.price, filters.min_price, filters.max_price),
+        (entry.area, filters.min_area, filters.max_area),
+    ):
+        if low is None and high is None:
+            continue
+        if value is None:
+            return False
+        if (low is not None and value < low) or (high is not None and value > high):
+            return False
+    if filters.rooms is not None and entry.rooms != filters.rooms:
+        return False
+    return all(
+        any(token.startswith(keyword) for token in entry.tokens) for keyword in keywords
+    )
+
+
+class ListingIndex:
+    """
+    In-process inverted index over the local listings mirror: sorted
+    (value, id) arrays for price and area ranges, posting sets for rooms and
+    address tokens (matched by prefix). A query starts from its most
+    selective constraint and checks the others per candidate, so its cost
+    follows the size of the smallest candidate set rather than the feed.
+    Only ids are kept; handlers load the listings from the mirror.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self._entries: Dict[int, ListingEntry] = {}
+        self._price: List[Tuple[float, int]] = []
+        self._area: List[Tuple[float, int]] = []
+        self._rooms: Dict[int, Set[int]] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._vocabulary: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ids(self) -> Set[int]:
+        """
+        Ids of all indexed listings.
+        """
+        return set(self._entries)
+
+    def upsert(self, item: Dict[str, Any]) -> bool:
+        """
+        Adds or replaces a listing. Returns False if its searchable fields
+        were already indexed unchanged.
+        """
+        listing_id = int(item["id"])
+        entry = listing_entry(item)
+        previous = self._entries.get(listing_id)
+        if previous is not None:
+            if previous == entry:
+                return False
+            self.remove(listing_id)
+
+        self._add_postings(listing_id, entry)
+        if entry.price is not None:
+            bisect.insort(self._price, (entry.price, listing_id))
+        if entry.area is not None:
+            bisect.insort(self._area, (entry.area, listing_id))
+        for token in entry.tokens:
+            if len(self._tokens[token]) == 1:
+                bisect.insort(self._vocabulary, token)
+        return True
+
+    def _add_postings(self, listing_id: int, entry: ListingEntry) -> None:
+        self._entries[listing_id] = entry
+        if entry.rooms is not None:
+            self._rooms.setdefault(entry.rooms, set()).add(listing_id)
+        for token in entry.tokens:
+            self._tokens.setdefault(token, set()).add(listing_id)
+
+    def remove(self, listing_id: int) -> bool:
+        """
+        Drops a listing from the index. Returns False if it was not indexed.
+        """
+        entry = self._entries.pop(listing_id, None)
+        if entry is None:
+            return False
+        if entry.price is not None:
+            _discard_sorted(self._price, (entry.price, listing_id))
+        if entry.area is not None:
+            _discard_sorted(self._area, (entry.area, listing_id))
+        if entry.rooms is not None:
+            self._rooms[entry.rooms].discard(listing_id)
+        for token in entry.tokens:
+            postings = self._tokens[token]
+            postings.discard(listing_id)
+            if not postings:
+                del self._tokens[token]
+                _discard_sorted(self._vocabulary, token)
+        return True
+
+    def _token_candidates(self, prefix: str) -> Set[int]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        result: Set[int] = set()
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            result |= self._tokens[token]
+        return result
+
+    def _candidates(self, filters: SearchFilters, keywords: List[str]) -> Set[int]:
+        sources: List[Tuple[int, Any]] = []
+        for values, low, high in (
+            (self._price, filters.min_price, filters.max_price),
+            (self._area, filters.min_area, filters.max_area),
+        ):
+            if low is not None or high is not None:
+                start, stop = _range_bounds(values, low, high)
+                sources.append((stop - start, (values, start, stop)))
+        if filters.rooms is not None:
+            postings = self._rooms.get(filters.rooms, set())
+            sources.append((len(postings), postings))
+        for keyword in keywords:
+            postings = self._token_candidates(keyword)
+            sources.append((len(postings), postings))
+
+        if not sources:
+            return set(self._entries)
+        _, smallest = min(sources, key=lambda source: source[0])
+        if isinstance(smallest, set):
+            return smallest
+        values, start, stop = smallest
+        return {listing_id for _, listing_id in values[start:stop]}
+
+    def search(
+        self,
+        filters: SearchFilters,
+        limit: int = 10,
+        offset: int = 0,
+        max_id: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Returns the ids of matching listings, newest (highest id) first,
+        leaving out ids above `max_id` so that pages stay stable.
+        """
+        keywords = filters.keyword_tokens()
+        candidates = self._candidates(filters, keywords)
+        constraints = len(keywords) + sum(
+            value is not None
+            for value in (
+                filters.rooms,
+                _either(filters.min_price, filters.max_price),
+                _either(filters.min_area, filters.max_area),
+            )
+        )
+        if constraints <= 1:
+            # The candidate set came from the only constraint: nothing to check.
+            matches = candidates
+        else:
+            matches = [
+                listing_id
+                for listing_id in candidates
+                if entry_matches(self._entries[listing_id], filters, keywords)
+            ]
+        if max_id is not None:
+            matches = [listing_id for listing_id in matches if listing_id <= max_id]
+        return heapq.nlargest(offset + limit, matches)[offset:]
+
+    async def load(self, listings: AsyncIterable[Dict[str, Any]]) -> None:
+        """
+        Rebuilds the index from stored listings (see `iter_listings`). The
+        sorted arrays are built once at the end rather than kept sorted per
+        listing, and the event loop gets a turn every LOAD_YIELD_EVERY items.
+        """
+        self.clear()
+        async for item in listings:
+            self._add_postings(int(item["id"]), listing_entry(item))
+            if len(self._entries) % LOAD_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+        entries = self._entries.items()
+        self._price[:] = sorted(
+            (entry.price, listing_id)
+            for listing_id, entry in entries
+            if entry.price is not None
+        )
+        self._area[:] = sorted(
+            (entry.area, listing_id)
+            for listing_id, entry in entries
+            if entry.area is not None
+        )
+        self._vocabulary[:] = sorted(self._tokens)
+        logger.info("Search index loaded with %d listings.", len(self))
+
+    async def apply(self, changes: ListingChanges) -> None:
+        """
+        Listing sync listener: mirrors its changes and becomes ready once a
+        full pass has completed.
+        """
+        for item in changes.changed:
+            self.upsert(item)
+        for listing_id in changes.removed:
+            self.remove(listing_id)
+        if changes.full_sync_done:
+            self.ready = True
+
+    def clear(self) -> None:
+        """
+        Empties the index.
+        """
+        self.ready = False
+        self._entries.clear()
+        self._price.clear()
+        self._area.clear()
+        self._rooms.clear()
+        self._tokens.clear()
+        self._vocabulary.clear()
+
+
+def _either(low: Optional[float], high: Optional[float]) -> Optional[float]:
+    return low if low is not None else high
+
+
+def _range_bounds(
+    values: List[Tuple[float, int]], low: Optional[float], high: Optional[float]
+) -> Tuple[int, int]:
+    start = 0 if low is None else bisect.bisect_left(values, (low, -1))
+    stop = (
+        len(values)
+        if high is None
+        else bisect.bisect_right(values, (high, float("inf")))
+    )
+    return start, max(start, stop)
+
+
+def _discard_sorted(values: List[Any], value: Any) -> None:
+    position = bisect.bisect_left(values, value)
+    if position < len(values) and values[position] == value:
+        del values[position]
+
+
+listing_index = ListingIndex()
@@ -0,0 +1,160 @@
+"""src/infrastructure/search/subscriptions.py."""
+
+import logging
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from .index import (
+    MIN_TOKEN_LENGTH,
+    SearchFilters,
+    entry_matches,
+    listing_entry,
+)
+
+logger = logging.getLogger(__name__)
+
+# Value cells grow geometrically, so a range costs the same number of cells
+# whatever its magnitude; values are clamped to [1, MAX_VALUE].
+CELL_RATIO = 1.25
+MAX_VALUE = 1e9
+_MAX_CELL = int(math.log(MAX_VALUE, CELL_RATIO))
+
+
+def value_cell(value: float) -> int:
+    """
+    The cell a price or area falls into.
+    """
+    if value <= 1:
+        return 0
+    return min(int(math.log(value, CELL_RATIO)), _MAX_CELL)
+
+
+def _cells(low: Optional[float], high: Optional[float]) -> range:
+    first = value_cell(low) if low is not None else 0
+    last = value_cell(high) if high is not None else _MAX_CELL
+    return range(first, last + 1)
+
+
+class _Subscription(NamedTuple):
+    telegram_id: int
+    filters: SearchFilters
+    keywords: List[str]
+    # Where the subscription is filed: ("keyword", token), ("price", cells),
+    # ("area", cells), ("rooms", n) or ("any", None).
+    anchor: Tuple[str, Any]
+
+
+class SubscriptionIndex:
+    """
+    The reverse of ListingIndex: finds the saved searches a new listing
+    matches without looping over all of them.
+
+    Each subscription is filed under one anchor, its most selective
+    criterion: an address keyword, else the value cells its price or area
+    range covers (the narrower one), else its room count. A listing then
+    checks only the subscriptions filed under its address token prefixes,
+    its price and area cells and its room count, plus the unconstrained
+    ones.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._keywords: Dict[str, Set[str]] = {}
+        self._cells: Dict[str, Dict[int, Set[str]]] = {"price": {}, "area": {}}
+        self._rooms: Dict[int, Set[str]] = {}
+        self._any: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    @staticmethod
+    def _anchor(filters: SearchFilters, keywords: List[str]) -> Tuple[str, Any]:
+        if keywords:
+            return "keyword", max(keywords, key=len)
+        ranges = [
+            (field, _cells(low, high))
+            for field, low, high in (
+                ("price", filters.min_price, filters.max_price),
+                ("area", filters.min_area, filters.max_area),
+            )
+            if low is not None or high is not None
+        ]
+        if ranges:
+            return min(ranges, key=lambda anchor: len(anchor[1]))
+        if filters.rooms is not None:
+            return "rooms", filters.rooms
+        return "any", None
+
+    def _postings(self, anchor: Tuple[str, Any]) -> Iterable[Set[str]]:
+        kind, key = anchor
+        if kind == "keyword":
+            yield self._keywords.setdefault(key, set())
+        elif kind in self._cells:
+            for cell in key:
+                yield self._cells[kind].setdefault(cell, set())
+        elif kind == "rooms":
+            yield self._rooms.setdefault(key, set())
+        else:
+            yield self._any
+
+    def add(self, subscription_id: str, telegram_id: int, filters: SearchFilters):
+        """
+        Adds or replaces a subscription.
+        """
+        self.remove(subscription_id)
+        keywords = filters.keyword_tokens()
+        anchor = self._anchor(filters, keywords)
+        self._subscriptions[subscription_id] = _Subscription(
+            telegram_id, filters, keywords, anchor
+        )
+        for postings in self._postings(anchor):
+            postings.add(subscription_id)
+
+    def remove(self, subscription_id: str) -> bool:
+        """
+        Drops a subscription. Returns False if it was not indexed.
+        """
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        for postings in self._postings(subscription.anchor):
+            postings.discard(subscription_id)
+        return True
+
+    def clear(self) -> None:
+        """
+        Empties the index.
+        """
+        self._subscriptions.clear()
+        self._keywords.clear()
+        for cells in self._cells.values():
+            cells.clear()
+        self._rooms.clear()
+        self._any.clear()
+
+    def match(self, item: Dict[str, Any]) -> Set[int]:
+        """
+        Returns the Telegram ids of the users with a subscription matching
+        the listing.
+        """
+        entry = listing_entry(item)
+        candidates: Set[str] = set(self._any)
+        for token in entry.tokens:
+            for end in range(MIN_TOKEN_LENGTH, len(token) + 1):
+                candidates |= self._keywords.get(token[:end], set())
+        for kind, value in (("price", entry.price), ("area", entry.area)):
+            if value is not None:
+                candidates |= self._cells[kind].get(value_cell(value), set())
+        if entry.rooms is not None:
+            candidates |= self._rooms.get(entry.rooms, set())
+
+        recipients: Set[int] = set()
+        for subscription_id in candidates:
+            subscription = self._subscriptions[subscription_id]
+            if subscription.telegram_id in recipients:
+                continue
+            if entry_matches(entry, subscription.filters, subscription.keywords):
+                recipients.add(subscription.telegram_id)
+        return recipients
+
+
+subscription_index = SubscriptionIndex()
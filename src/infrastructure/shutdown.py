@@ -0,0 +1,157 @@
+"""src/infrastructure/shutdown.py."""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[[], Optional[Awaitable[None]]]
+
+
+class ShutdownCoordinator:
+    """
+    Orders a graceful shutdown once polling has stopped: run the stop hooks
+    (long-running workers), wait up to a deadline for in-flight handlers and
+    background tasks, then run the flush hooks (buffered writes) and the
+    close hooks (connection pools), in that order.
+    """
+
+    def __init__(self):
+        self._closed = False
+        self._updates: Set[asyncio.Task] = set()
+        self._background: Dict[str, Set[asyncio.Task]] = defaultdict(set)
+        self._stop_hooks: List[Tuple[str, Hook]] = []
+        self._flush_hooks: List[Tuple[str, Hook]] = []
+        self._close_hooks: List[Tuple[str, Hook]] = []
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of updates currently being handled.
+        """
+        return len(self._updates)
+
+    def track_update(self, task: asyncio.Task) -> None:
+        """
+        Registers the task handling an update until it finishes.
+        """
+        self._updates.add(task)
+        task.add_done_callback(self._updates.discard)
+
+    def release_update(self, task: asyncio.Task) -> None:
+        """
+        Marks the update handled by `task` as finished.
+        """
+        self._updates.discard(task)
+
+    def spawn(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        group: str = "default",
+        name: Optional[str] = None,
+    ) -> asyncio.Task:
+        """
+        Starts background work that shutdown waits for. Handlers still
+        finishing during shutdown may spawn work; RuntimeError is raised once
+        the background tasks are being drained.
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("Shutdown in progress, not accepting new work")
+        task = asyncio.create_task(coro, name=name)
+        tasks = self._background[group]
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(_log_failure)
+        return task
+
+    def on_stop(self, name: str, hook: Hook) -> None:
+        """
+        Adds a hook run before draining, e.g. to end a worker loop.
+        """
+        self._stop_hooks.append((name, hook))
+
+    def on_flush(self, name: str, hook: Hook) -> None:
+        """
+        Adds a hook run after draining, before any pool is closed.
+        """
+        self._flush_hooks.append((name, hook))
+
+    def on_close(self, name: str, hook: Hook) -> None:
+        """
+        Adds a hook run last, e.g. to close a connection pool.
+        """
+        self._close_hooks.append((name, hook))
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Waits up to `timeout` seconds for in-flight updates, then for
+        background tasks, and cancels whatever is still running.
+        Returns True if everything finished in time.
+        """
+        deadline = time.monotonic() + timeout
+        clean = await self._wait("updates", self._updates, deadline)
+        # In-flight handlers may spawn background work until here.
+        self._closed = True
+        for group, tasks in list(self._background.items()):
+            clean = await self._wait(group, tasks, deadline) and clean
+        return clean
+
+    async def _wait(self, group: str, tasks: Set[asyncio.Task], deadline: float):
+        pending = {task for task in tasks if task is not asyncio.current_task()}
+        if not pending:
+            return True
+        logger.info("Waiting for %d %s task(s)...", len(pending), group)
+        _, pending = await asyncio.wait(
+            pending, timeout=max(deadline - time.monotonic(), 0)
+        )
+        if not pending:
+            return True
+        logger.warning(
+            "Cancelling %d %s task(s) still running at the shutdown deadline.",
+            len(pending),
+            group,
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return False
+
+    async def shutdown(self, timeout: float) -> None:
+        """
+        Runs the whole shutdown sequence. Hooks that fail are logged and do
+        not prevent the remaining ones from running.
+        """
+        started = time.monotonic()
+        await self._run_hooks(self._stop_hooks)
+        await self.drain(timeout)
+        await self._run_hooks(self._flush_hooks)
+        await self._run_hooks(self._close_hooks)
+        logger.info("Shutdown completed in %.3fs.", time.monotonic() - started)
+
+    @staticmethod
+    async def _run_hooks(hooks: List[Tuple[str, Hook]]) -> None:
+        for name, hook in hooks:
+            try:
+                result = hook()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Shutdown hook %s failed", name)
+        hooks.clear()
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Background task %s failed",
+            task.get_name(),
+            exc_info=task.exception(),
+        )
+
+
+shutdown_coordinator = ShutdownCoordinator()
@@ -0,0 +1,9 @@
+"""src/infrastructure/sync/__init__.py."""
+
+from .listings import ChangeListener, ListingChanges, ListingSync
+
+__all__ = [
+    "ChangeListener",
+    "ListingChanges",
+    "ListingSync",
+]
@@ -0,0 +1,251 @@
+"""src/infrastructure/sync/listings.py."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+)
+from pymongo.errors import PyMongoError
+from src.database import SyncCheckpoint, purge_listings, upsert_listings
+from src.infrastructure.api import SwipeApiClient, SwipeAPIError
+from src.infrastructure.metrics import LISTING_SYNC_CHANGES_TOTAL, LISTING_SYNC_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class ListingChanges(NamedTuple):
+    """
+    What one sync step changed in the local mirror: new or changed listings
+    (`added` holds the ids of the new ones) and removed ids. `full_sync_done`
+    is set on the last notification of a completed full pass.
+    """
+
+    changed: List[Dict[str, Any]]
+    removed: List[int]
+    added: FrozenSet[int] = frozenset()
+    full_sync_done: bool = False
+
+
+ChangeListener = Callable[[ListingChanges], Awaitable[None]]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _seconds_since(moment: datetime) -> float:
+    # Mongo hands datetimes back naive (in UTC).
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (_now() - moment).total_seconds()
+
+
+class ListingSync:
+    """
+    Mirrors the announcements feed into the `announcements` collection.
+
+    The API only pages by limit/offset, newest first, and has no "changed
+    since" filter, so changes are found by comparing content fingerprints.
+    An incremental pass reads from the top until it is past the watermark
+    (the highest id stored) and meets a page with nothing new or changed.
+    A full pass reads the whole feed, `concurrency` pages at a time, then
+    purges listings that neither it nor the previous pass saw; its offset
+    is checkpointed after every window so a restarted process resumes it
+    instead of starting over.
+
+    One pass is not enough to tell a listing is gone: the feed changes
+    while it is paged through, and a deletion shifts the items after it
+    across a page boundary, so a live listing can be skipped (more so in a
+    pass resumed much later). Purged listings that are still live would
+    come back as new on the next sync and trigger false alerts.
+    Listeners are told about every change, e.g. to keep an index in step.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        full_interval: float,
+        page_size: int,
+        concurrency: int = 4,
+        token: Optional[str] = None,
+        name: str = "listings",
+    ):
+        self.interval = interval
+        self.full_interval = full_interval
+        self.page_size = page_size
+        self.concurrency = max(1, concurrency)
+        self.token = token
+        self.name = name
+        self._listeners: List[ChangeListener] = []
+        self._stopping = asyncio.Event()
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """
+        Registers a coroutine called with every ListingChanges.
+        """
+        self._listeners.append(listener)
+
+    async def _emit(self, changes: ListingChanges) -> None:
+        if not (changes.changed or changes.removed or changes.full_sync_done):
+            return
+        for listener in self._listeners:
+            try:
+                await listener(changes)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Listing change listener failed.")
+
+    async def checkpoint(self) -> SyncCheckpoint:
+        """
+        Returns the stored progress of this sync, or a fresh one.
+        """
+        checkpoint = await SyncCheckpoint.find_one(SyncCheckpoint.name == self.name)
+        return checkpoint or SyncCheckpoint(name=self.name)
+
+    async def is_synced(self) -> bool:
+        """
+        True once a full pass has completed, in this process or an earlier one.
+        """
+        return (await self.checkpoint()).full_synced_at is not None
+
+    async def _fetch(self, api: SwipeApiClient, offset: int) -> List[Dict[str, Any]]:
+        return await api.announcements.get_announcements(
+            limit=self.page_size, offset=offset
+        )
+
+    async def _store(
+        self, checkpoint: SyncCheckpoint, page: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        changed, added = await upsert_listings(page, _now())
+        if page:
+            newest = max(int(item["id"]) for item in page)
+            checkpoint.watermark = max(checkpoint.watermark, newest)
+        LISTING_SYNC_CHANGES_TOTAL.labels("upserted").inc(len(changed))
+        await self._emit(
+            ListingChanges(changed=changed, removed=[], added=frozenset(added))
+        )
+        return changed
+
+    async def incremental_sync(self) -> int:
+        """
+        Stores new and changed listings from the top of the feed. Returns the
+        number of listings stored.
+        """
+        checkpoint = await self.checkpoint()
+        watermark = checkpoint.watermark
+        api = SwipeApiClient(token=self.token)
+        stored = 0
+        offset = 0
+        while not self._stopping.is_set():
+            page = await self._fetch(api, offset)
+            changed = await self._store(checkpoint, page)
+            stored += len(changed)
+            if len(page) < self.page_size:
+                break
+            if not changed and min(int(item["id"]) for item in page) <= watermark:
+                break
+            offset += self.page_size
+        await checkpoint.save()
+        return stored
+
+    async def full_sync(self) -> int:
+        """
+        Reads the whole feed (resuming an interrupted pass) and purges
+        listings missed by this pass and the previous one. Returns the number
+        of listings stored or purged.
+        """
+        checkpoint = await self.checkpoint()
+        if checkpoint.full_pass_started_at is None:
+            checkpoint.full_pass_started_at = _now()
+            checkpoint.full_pass_offset = 0
+        elif checkpoint.full_pass_offset:
+            logger.info(
+                "Resuming full listing sync at offset %d.", checkpoint.full_pass_offset
+            )
+
+        api = SwipeApiClient(token=self.token)
+        stored = 0
+        done = False
+        while not done and not self._stopping.is_set():
+            offsets = [
+                checkpoint.full_pass_offset + i * self.page_size
+                for i in range(self.concurrency)
+            ]
+            pages = await asyncio.gather(*(self._fetch(api, o) for o in offsets))
+            for page in pages:
+                stored += len(await self._store(checkpoint, page))
+                if len(page) < self.page_size:
+                    done = True
+                    break
+            checkpoint.full_pass_offset = offsets[-1] + self.page_size
+            await checkpoint.save()
+
+        if not done:
+            return stored
+        # Anything not seen since the previous pass started was missed by
+        # both passes and has left the feed.
+        removed = []
+        if checkpoint.previous_full_pass_started_at is not None:
+            removed = await purge_listings(checkpoint.previous_full_pass_started_at)
+        LISTING_SYNC_CHANGES_TOTAL.labels("purged").inc(len(removed))
+        checkpoint.previous_full_pass_started_at = checkpoint.full_pass_started_at
+        checkpoint.full_pass_started_at = None
+        checkpoint.full_pass_offset = 0
+        checkpoint.full_synced_at = _now()
+        await checkpoint.save()
+        await self._emit(
+            ListingChanges(changed=[], removed=removed, full_sync_done=True)
+        )
+        return stored + len(removed)
+
+    async def sync_once(self, full: bool = False) -> int:
+        """
+        Runs one full or incremental pass and returns its change count.
+        """
+        kind = "full" if full else "incremental"
+        started = time.perf_counter()
+        changes = await (self.full_sync() if full else self.incremental_sync())
+        elapsed = time.perf_counter() - started
+        LISTING_SYNC_DURATION.labels(kind).observe(elapsed)
+        logger.info(
+            "%s listing sync: %d change(s) (%.2fs).", kind.title(), changes, elapsed
+        )
+        return changes
+
+    async def _full_due(self) -> bool:
+        checkpoint = await self.checkpoint()
+        return (
+            checkpoint.full_pass_started_at is not None
+            or checkpoint.full_synced_at is None
+            or _seconds_since(checkpoint.full_synced_at) >= self.full_interval
+        )
+
+    async def run(self) -> None:
+        """
+        Syncs until stopped. API and database errors are logged and retried
+        next interval.
+        """
+        while not self._stopping.is_set():
+            try:
+                await self.sync_once(full=await self._full_due())
+            except (SwipeAPIError, PyMongoError) as e:
+                logger.warning("Listing sync failed: %s", e)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """
+        Makes `run` return after the batch being fetched; a full pass in
+        progress resumes from its checkpoint on the next start.
+        """
+        self._stopping.set()
@@ -0,0 +1,21 @@
+"""src/infrastructure/tracing/__init__.py."""
+
+from .exporters import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+)
+from .tracer import Span, Tracer, current_span, inject_headers, tracer
+
+__all__ = [
+    "BatchSpanProcessor",
+    "FileSpanExporter",
+    "OtlpHttpSpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "current_span",
+    "inject_headers",
+    "tracer",
+]
@@ -0,0 +1,179 @@
+"""src/infrastructure/tracing/exporters.py."""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+import httpx
+from .tracer import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter:
+    """
+    Base class for span exporters.
+    """
+
+    async def export(self, spans: List[Span]) -> None:
+        """
+        Sends a batch of finished spans.
+        """
+        raise NotImplementedError
+
+    async def shutdown(self) -> None:
+        """
+        Releases exporter resources.
+        """
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends spans to a JSON Lines file, one span per line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _write(self, lines: List[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    async def export(self, spans: List[Span]) -> None:
+        lines = [json.dumps(s.to_dict(), default=str) + "\n" for s in spans]
+        await asyncio.to_thread(self._write, lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    payload = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()
+        ],
+        "status": ({"code": 2, "message": span.error} if span.error else {"code": 1}),
+    }
+    if span.parent_id:
+        payload["parentSpanId"] = span.parent_id
+    return payload
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Sends spans to an OpenTelemetry collector using OTLP/HTTP with JSON encoding.
+    """
+
+    def __init__(self, endpoint: str, service_name: str):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client = httpx.AsyncClient(timeout=5.0)
+
+    async def export(self, spans: List[Span]) -> None:
+        body = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "swipe-bot"},
+                            "spans": [_otlp_span(s) for s in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        response = await self._client.post(self.endpoint, json=body)
+        response.raise_for_status()
+
+    async def shutdown(self) -> None:
+        await self._client.aclose()
+
+
+class BatchSpanProcessor:
+    """
+    Buffers finished spans and exports them in batches from a background task,
+    so span creation never waits on I/O. The oldest spans are dropped when the
+    buffer is full.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 10_000,
+        max_batch_size: int = 512,
+        interval: float = 2.0,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.interval = interval
+        self._queue: Deque[Span] = deque(maxlen=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def on_end(self, span: Span) -> None:
+        """
+        Queues a finished span.
+        """
+        self._queue.append(span)
+
+    def start(self) -> None:
+        """
+        Starts the background export loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="span-exporter")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Exports everything queued so far.
+        """
+        while self._queue:
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self.max_batch_size, len(self._queue)))
+            ]
+            try:
+                await self.exporter.export(batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to export %s spans: %s", len(batch), e)
+                return
+
+    async def shutdown(self) -> None:
+        """
+        Stops the export loop and flushes the remaining spans.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await self.exporter.shutdown()
@@ -0,0 +1,192 @@
+"""src/infrastructure/tracing/tracer.py."""
+
+import functools
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+class Span:
+    """
+    A single timed operation inside a trace (W3C trace context ids).
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "sampled",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes = attributes or {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """
+        Returns the W3C `traceparent` header value for this span.
+        """
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Attaches an attribute to the span.
+        """
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        """
+        Marks the span as failed.
+        """
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the finished span.
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(((self.end_ns or 0) - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class Tracer:
+    """
+    Creates spans and hands finished, sampled spans to the configured processor.
+    Disabled by default: `span()` then costs a single attribute check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_ratio = 1.0
+        self.processor = None
+
+    def configure(self, processor, sample_ratio: float = 1.0) -> None:
+        """
+        Enables tracing with the given span processor.
+        """
+        self.processor = processor
+        self.sample_ratio = sample_ratio
+        self.enabled = True
+
+    async def shutdown(self) -> None:
+        """
+        Flushes pending spans and disables tracing.
+        """
+        self.enabled = False
+        if self.processor is not None:
+            await self.processor.shutdown()
+            self.processor = None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Opens a child of the current span (or a new trace root).
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        if parent is None:
+            trace_id = _new_id(16)
+            sampled = random.random() < self.sample_ratio
+            parent_id = None
+        else:
+            trace_id, sampled, parent_id = (
+                parent.trace_id,
+                parent.sampled,
+                parent.span_id,
+            )
+
+        span = Span(name, trace_id, parent_id, sampled, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if span.sampled and self.processor is not None:
+                self.processor.on_end(span)
+
+    def traced(
+        self, name: Optional[str] = None
+    ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+        """
+        Decorator wrapping a coroutine function in a span.
+        """
+
+        def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                with self.span(span_name):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+def current_span() -> Optional[Span]:
+    """
+    Returns the active span, if any.
+    """
+    return _current_span.get()
+
+
+def inject_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """
+    Adds correlation headers (`traceparent`, `X-Request-ID`) for the active span.
+    """
+    span = _current_span.get()
+    if span is not None:
+        headers["traceparent"] = span.traceparent
+        headers["X-Request-ID"] = span.trace_id
+    return headers
+
+
+tracer = Tracer()
@@ -1,85 +1,420 @@
 """src/main.py."""
 
+# Heavy dependencies (aiogram routers, pymongo/beanie, redis) are imported inside
+# the functions that need them, so `import src.main` stays cheap and the
+# startup profile mode can measure them.
+# pylint: disable=import-outside-toplevel
+
 import asyncio
 import logging
-from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-from aiogram.fsm.storage.redis import RedisStorage
-from aiogram.utils.i18n import I18n
-from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
-from src.bot.handlers import main_router
-from src.bot.middlewares import LanguageMiddleware
-from src.config import settings
-from src.database import BotUser, get_redis_client
-from src.bot.ui_commands import set_ui_commands
-
-
-async def on_startup():
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple, TYPE_CHECKING
+from src.config import get_settings
+from src.infrastructure.profiling import StartupProfiler
+
+if TYPE_CHECKING:
+    from aiogram import Bot, Dispatcher
+    from aiogram.client.session.base import BaseSession
+    from aiogram.utils.i18n import I18n
+    from pymongo import AsyncMongoClient
+    from redis.asyncio import Redis
+    from src.bot.utils import (
+        Broadcaster,
+        ChatThrottle,
+        SavedSearchAlerts,
+        SendQueue,
+        TokenBucket,
+    )
+    from src.infrastructure.sync import ListingChanges
+
+ready = asyncio.Event()
+metrics_server = None
+loop_watchdog = None
+
+
+def configure_tracing() -> None:
     """
-    Performs startup actions for the bot application.
+    Enables span export when tracing is switched on in the settings.
+    """
+    from src.infrastructure.tracing import (
+        BatchSpanProcessor,
+        FileSpanExporter,
+        OtlpHttpSpanExporter,
+        tracer,
+    )
+
+    settings = get_settings()
+    if settings.TRACING_EXPORTER == "otlp":
+        exporter = OtlpHttpSpanExporter(
+            settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME
+        )
+    else:
+        exporter = FileSpanExporter(settings.TRACING_FILE)
+    tracer.configure(BatchSpanProcessor(exporter), settings.TRACING_SAMPLE_RATIO)
+
+
+async def init_mongo(client: Optional["AsyncMongoClient"] = None):
     """
+    Connects to MongoDB, initializes the ODM models and verifies that their
+    indexes exist. Uses the shared client unless one is passed in
+    (e.g. by the benchmark suite).
+    """
+    from beanie import init_beanie
+    from src.database import DOCUMENT_MODELS, get_mongo_client, verify_indexes
+
+    settings = get_settings()
     logging.info("Connecting to MongoDB...")
-    client = AsyncIOMotorClient(settings.MONGO_URL)
+    if client is None:
+        client = get_mongo_client()
+        await client.admin.command("ping")
 
     await init_beanie(
         database=client[settings.MONGO_DB_NAME],
-        document_models=[BotUser],
+        document_models=DOCUMENT_MODELS,
     )
+    await verify_indexes(DOCUMENT_MODELS)
     logging.info("MongoDB connected successfully.")
 
 
-async def main():
+def start_send_queue(
+    bot: "Bot", bucket: "TokenBucket", throttle: "ChatThrottle"
+) -> "SendQueue":
     """
-    Entry point for the Telegram bot application.
+    Starts the background sender for bot-initiated messages; it is stopped
+    before shutdown drains the background tasks.
     """
-    logging.basicConfig(
-        level=settings.LOG_LEVEL,
-        format="%(asctime)s - [%(levelname)s] - %(name)s - (%(filename)s)"
-        ".%(funcName)s(%(lineno)d) - %(message)s",
+    from src.bot.utils import SendQueue
+    from src.infrastructure.shutdown import shutdown_coordinator
+
+    send_queue = SendQueue(bot, bucket, throttle)
+    shutdown_coordinator.on_stop("send_queue", send_queue.stop)
+    shutdown_coordinator.spawn(send_queue.run(), group="send", name="send-queue")
+    return send_queue
+
+
+def start_broadcaster(
+    bot: "Bot",
+    redis: "Redis",
+    i18n: "I18n",
+    bucket: "TokenBucket",
+    throttle: "ChatThrottle",
+) -> "Broadcaster":
+    """
+    Starts the worker delivering admin broadcasts, which first resumes any
+    broadcast left unfinished; it is stopped before shutdown drains the
+    background tasks.
+    """
+    from src.bot.utils import Broadcaster
+    from src.infrastructure.shutdown import shutdown_coordinator
+
+    broadcaster = Broadcaster(
+        bot,
+        redis,
+        i18n,
+        bucket,
+        throttle,
+        report_interval=get_settings().BROADCAST_REPORT_INTERVAL,
+    )
+    shutdown_coordinator.on_stop("broadcaster", broadcaster.stop)
+    shutdown_coordinator.spawn(broadcaster.run(), group="send", name="broadcaster")
+    return broadcaster
+
+
+def start_listing_sync(alerts: Optional["SavedSearchAlerts"] = None) -> None:
+    """
+    Starts the background worker mirroring the feed into MongoDB. The search
+    index (and the saved-search alerts) are first loaded from MongoDB, then
+    follow the sync's changes. The worker is stopped before shutdown drains
+    the background tasks. Purged listings are unsaved from users' favorites.
+    """
+    from src.database import iter_listings, remove_favorites
+    from src.infrastructure.search import listing_index
+    from src.infrastructure.shutdown import shutdown_coordinator
+    from src.infrastructure.sync import ListingSync
+
+    settings = get_settings()
+    token = settings.SWIPE_API_SERVICE_TOKEN
+    listing_sync = ListingSync(
+        interval=settings.SEARCH_SYNC_INTERVAL,
+        full_interval=settings.SEARCH_FULL_SYNC_INTERVAL,
+        page_size=settings.SEARCH_SYNC_PAGE_SIZE,
+        concurrency=settings.SEARCH_SYNC_CONCURRENCY,
+        token=token.get_secret_value() if token else None,
+    )
+
+    async def unsave_purged(changes: "ListingChanges") -> None:
+        await remove_favorites(changes.removed)
+
+    async def run() -> None:
+        await listing_index.load(iter_listings())
+        synced = await listing_sync.is_synced()
+        listing_index.ready = synced
+        listing_sync.add_listener(listing_index.apply)
+        listing_sync.add_listener(unsave_purged)
+        if alerts is not None:
+            await alerts.load()
+            alerts.ready = synced
+            listing_sync.add_listener(alerts.apply)
+        await listing_sync.run()
+
+    shutdown_coordinator.on_stop("listing_sync", listing_sync.stop)
+    shutdown_coordinator.spawn(run(), group="sync", name="listing-sync")
+
+
+async def on_startup(
+    bot: "Bot",
+    dispatcher: "Dispatcher",
+    redis: "Redis",
+    i18n: "I18n",
+    startup_profiler: Optional[StartupProfiler] = None,
+):
+    """
+    Performs startup actions for the bot application.
+    Independent I/O runs concurrently; readiness is signalled once all succeed.
+    """
+    from src.bot.ui_commands import ensure_polling_mode, sync_ui_commands
+    from src.bot.utils import (
+        ChatThrottle,
+        SavedSearchAlerts,
+        TokenBucket,
+        mark_user_inactive,
     )
+    from src.database import close_mongo_client, close_redis_client
+    from src.infrastructure.executors import executors
+    from src.infrastructure.loop_monitor import LoopWatchdog, enable_debug_mode
+    from src.infrastructure.search import subscription_index
+    from src.infrastructure.shutdown import shutdown_coordinator
+    from src.infrastructure.tracing import tracer
+
+    global metrics_server, loop_watchdog  # pylint: disable=global-statement
+
+    settings = get_settings()
+    started = time.perf_counter()
+    if settings.LOOP_DEBUG:
+        enable_debug_mode(settings.LOOP_SLOW_CALLBACK_MS / 1000)
+    if settings.LOOP_MONITOR_ENABLED and loop_watchdog is None:
+        loop_watchdog = LoopWatchdog(threshold=settings.LOOP_STALL_THRESHOLD_MS / 1000)
+        loop_watchdog.start()
+    if tracer.processor is not None:
+        tracer.processor.start()
+    if settings.METRICS_ENABLED and metrics_server is None:
+        from src.infrastructure.metrics import MetricsServer
+
+        metrics_server = MetricsServer(settings.METRICS_HOST, settings.METRICS_PORT)
+        await metrics_server.start()
+
+    shutdown_coordinator.on_flush("spans", tracer.shutdown)
+    shutdown_coordinator.on_close("executors", executors.shutdown)
+    shutdown_coordinator.on_close("mongo", close_mongo_client)
+    shutdown_coordinator.on_close("redis", close_redis_client)
+
+    await asyncio.gather(
+        init_mongo(),
+        redis.ping(),
+        sync_ui_commands(bot, redis),
+        ensure_polling_mode(bot),
+    )
+    # Alerts and broadcasts share one rate limit.
+    bucket = TokenBucket(settings.SEND_RATE_LIMIT)
+    throttle = ChatThrottle()
+    send_queue = start_send_queue(bot, bucket, throttle)
+    send_queue.on_blocked(mark_user_inactive)
+    dispatcher["broadcaster"] = start_broadcaster(bot, redis, i18n, bucket, throttle)
+    if settings.SEARCH_SYNC_ENABLED:
+        alerts = SavedSearchAlerts(
+            subscription_index,
+            send_queue,
+            i18n,
+            max_listings=settings.SAVED_SEARCH_ALERT_LISTINGS,
+        )
+        send_queue.on_blocked(alerts.forget_user)
+        start_listing_sync(alerts)
+
+    ready.set()
+    if startup_profiler:
+        startup_profiler.phases["startup_io"] = time.perf_counter() - started
+    if settings.READINESS_FILE:
+        Path(settings.READINESS_FILE).touch()
+    logging.info("Bot is ready (startup took %.3fs).", time.perf_counter() - started)
+
+
+async def on_shutdown():
+    """
+    Runs once polling has stopped: withdraws the readiness signal, waits for
+    in-flight updates and background work, flushes pending spans, closes the
+    worker and connection pools, then stops the metrics endpoint and the
+    loop watchdog. The Bot API session is closed by aiogram afterwards.
+    """
+    from src.infrastructure.shutdown import shutdown_coordinator
+
+    global metrics_server, loop_watchdog  # pylint: disable=global-statement
+
+    settings = get_settings()
+    ready.clear()
+    if settings.READINESS_FILE:
+        Path(settings.READINESS_FILE).unlink(missing_ok=True)
+    await shutdown_coordinator.shutdown(settings.SHUTDOWN_TIMEOUT)
+    if metrics_server is not None:
+        await metrics_server.stop()
+        metrics_server = None
+    if loop_watchdog is not None:
+        await loop_watchdog.stop()
+        loop_watchdog = None
+
+
+def create_app(
+    profiler: Optional[StartupProfiler] = None,
+    redis: Optional["Redis"] = None,
+    session: Optional["BaseSession"] = None,
+) -> Tuple["Bot", "Dispatcher", "Redis"]:
+    """
+    Builds the bot, the dispatcher with all middlewares and routers, and the
+    Redis client. Performs no network I/O.
+    The Redis client and the Bot API session can be injected (e.g. fakes).
+    """
+    from aiogram import Bot, Dispatcher
+    from aiogram.client.default import DefaultBotProperties
+    from aiogram.enums import ParseMode
+    from src.bot.handlers import main_router
+    from src.bot.i18n import (
+        add_reload_hook,
+        load_i18n,
+        reload_catalogs,
+        text_actions,
+        validate_catalogs,
+    )
+    from src.bot.keyboards.registry import keyboard_registry
+    from src.bot.middlewares import (
+        HandlerMetricsMiddleware,
+        InFlightMiddleware,
+        LanguageMiddleware,
+        RequestMetricsMiddleware,
+        RequestTracingMiddleware,
+        TaskAttributionMiddleware,
+        TextActionMiddleware,
+        TracingMiddleware,
+        UpdateMetricsMiddleware,
+    )
+    from src.database import get_redis_client
+    from src.database.storage import InstrumentedRedisStorage
+    from src.infrastructure.shutdown import shutdown_coordinator
+
+    settings = get_settings()
     logger = logging.getLogger(__name__)
-    logger.info("Starting Swipe Bot...")
 
     logger.info("Initializing Redis storage...")
-    redis = get_redis_client()
-    storage = RedisStorage(redis=redis)
+    if redis is None:
+        redis = get_redis_client()
+    storage = InstrumentedRedisStorage(redis=redis)
 
     bot = Bot(
         token=settings.BOT_TOKEN.get_secret_value(),
+        session=session,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+    if settings.METRICS_ENABLED:
+        bot.session.middleware(RequestMetricsMiddleware())
+    if settings.TRACING_ENABLED:
+        configure_tracing()
+        bot.session.middleware(RequestTracingMiddleware())
 
     logger.info("Configuring i18n...")
-    i18n = I18n(path="src/locales", default_locale="en", domain="messages")
-    dp = Dispatcher(storage=storage)
+    i18n = load_i18n(settings.LOCALES_PATH, default_locale="en", domain="messages")
+    if settings.I18N_VALIDATE_ON_STARTUP:
+        validate_catalogs(settings.LOCALES_PATH, "src/bot", strict=settings.I18N_STRICT)
+    text_actions.build(i18n)
+    add_reload_hook("keyboards", keyboard_registry.clear)
+    add_reload_hook("text_actions", lambda: text_actions.build(i18n))
+    dp = Dispatcher(storage=storage, redis=redis, i18n=i18n, startup_profiler=profiler)
 
     logger.info("Registering middlewares...")
+    if settings.TRACING_ENABLED:
+        # The root span has to enclose aiogram's own outer middlewares too,
+        # since FSMContextMiddleware loads the state before any of ours run.
+        builtin = list(dp.update.outer_middleware)
+        for middleware in builtin:
+            dp.update.outer_middleware.unregister(middleware)
+        dp.update.outer_middleware(TracingMiddleware())
+        for middleware in builtin:
+            dp.update.outer_middleware(middleware)
+    if profiler:
+        dp.update.outer_middleware(profiler)
+    dp.update.outer_middleware(InFlightMiddleware(shutdown_coordinator))
+    if settings.LOOP_MONITOR_ENABLED or settings.LOOP_DEBUG:
+        attribution = TaskAttributionMiddleware()
+        dp.update.outer_middleware(attribution)
+        for name, observer in dp.observers.items():
+            if name not in ("update", "error"):
+                observer.middleware(attribution)
+    if settings.METRICS_ENABLED:
+        dp.update.outer_middleware(UpdateMetricsMiddleware())
+        handler_metrics = HandlerMetricsMiddleware()
+        for name, observer in dp.observers.items():
+            if name not in ("update", "error"):
+                observer.middleware(handler_metrics)
     dp.update.outer_middleware(LanguageMiddleware(i18n))
+    dp.message.outer_middleware(TextActionMiddleware())
 
     logger.info("Registering routers...")
     dp.include_router(main_router)
 
+    async def watch_catalog_reload():
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, reload_catalogs, i18n
+        )
+
+    dp.startup.register(watch_catalog_reload)
     dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
+
+    return bot, dp, redis
+
+
+async def main(profile_startup: bool = False):
+    """
+    Entry point for the Telegram bot application.
+    """
+    from src.database import close_mongo_client, close_redis_client
+    from src.infrastructure.log_config import configure_logging
+
+    settings = get_settings()
+    configure_logging(
+        level=settings.LOG_LEVEL,
+        fmt=settings.LOG_FORMAT,
+        sampling=settings.LOG_SAMPLING,
+        max_length=settings.LOG_MAX_MESSAGE_LENGTH,
+    )
+    logger = logging.getLogger(__name__)
+    logger.info("Starting Swipe Bot...")
 
-    logger.info("Setting up UI commands...")
-    await set_ui_commands(bot)
+    profiler = None
+    if profile_startup or settings.STARTUP_PROFILE:
+        profiler = StartupProfiler(settings.STARTUP_PROFILE_FILE)
+        profiler.start()
+        with profiler.phase("create_app"):
+            bot, dp, _ = create_app(profiler)
+    else:
+        bot, dp, _ = create_app()
 
-    await bot.delete_webhook(drop_pending_updates=True)
     try:
         logger.info("Bot started polling.")
         await dp.start_polling(bot)
     finally:
+        # on_shutdown has normally closed everything already; this covers
+        # a failed startup.
         logger.info("Shutting down bot...")
         await bot.session.close()
-        await redis.aclose()
+        await close_mongo_client()
+        await close_redis_client()
         logger.info("Bot stopped.")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(profile_startup="--profile-startup" in sys.argv))
     except (KeyboardInterrupt, SystemExit):
         logging.info("Bot execution interrupted.")
         raise
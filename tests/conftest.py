@@ -0,0 +1,42 @@
+"""tests/conftest.py."""
+
+import asyncio
+import pytest
+from src.config import get_settings
+
+TEST_ENV = {
+    "BOT_TOKEN": "123456:test",
+    "MONGO_URL": "mongodb://127.0.0.1:27017",
+    "MONGO_DB_NAME": "swipe_bot_test",
+    "REDIS_URL": "redis://127.0.0.1:6379/15",
+    "SWIPE_API_BASE_URL": "http://127.0.0.1:8000",
+}
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """
+    Settings built from dummy connection strings.
+    """
+    for key, value in TEST_ENV.items():
+        monkeypatch.setenv(key, value)
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def mongo(settings):
+    """
+    An in-memory MongoDB the document models are bound to; needs the
+    optional mongomock-motor package.
+    """
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    # pylint: disable=import-outside-toplevel
+    from benchmarks.harness import _patch_mongomock_for_beanie
+    from src.main import init_mongo
+
+    _patch_mongomock_for_beanie()
+    client = mongomock_motor.AsyncMongoMockClient()
+    asyncio.run(init_mongo(client))
+    return client[settings.MONGO_DB_NAME]
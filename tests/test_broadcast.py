@@ -0,0 +1,83 @@
+"""tests/test_broadcast.py."""
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from src.bot.i18n import load_i18n
+from src.bot.utils import Broadcaster, ChatThrottle, TokenBucket
+from src.database import BotUser
+
+ADMIN_CHAT_ID = 999
+
+
+class FakeBot:
+    """
+    Records sent messages; stops `broadcaster` after `stop_after` of them.
+    """
+
+    id = 42
+
+    def __init__(self):
+        self.sent = []
+        self.broadcaster = None
+        self.stop_after = None
+
+    async def send_message(self, chat_id, text):
+        if chat_id != ADMIN_CHAT_ID:
+            self.sent.append(chat_id)
+            if len(self.sent) == self.stop_after:
+                self.broadcaster.stop()
+        return SimpleNamespace(message_id=1)
+
+    async def edit_message_text(self, text, chat_id, message_id):
+        pass
+
+
+def _broadcaster(bot, redis, i18n):
+    broadcaster = Broadcaster(
+        bot, redis, i18n, TokenBucket(1000), ChatThrottle(0), batch_size=5
+    )
+    bot.broadcaster = broadcaster
+    return broadcaster
+
+
+async def _run_until_done(broadcaster, redis, job_id):
+    task = asyncio.create_task(broadcaster.run())
+    key = f"bot:42:broadcast:{job_id}"
+    for _ in range(200):
+        if await redis.hget(key, "status") == "done" or task.done():
+            break
+        await asyncio.sleep(0.01)
+    broadcaster.stop()
+    await task
+
+
+def test_broadcast_resumes_from_the_redis_cursor(mongo):
+    fakeredis = pytest.importorskip("fakeredis")
+    i18n = load_i18n("src/locales", default_locale="en", domain="messages")
+
+    async def scenario():
+        for telegram_id in range(1, 13):
+            await BotUser(telegram_id=telegram_id, full_name="User").insert()
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        bot = FakeBot()
+        job_id = await _broadcaster(bot, redis, i18n).create(
+            "Hello", ADMIN_CHAT_ID, "en"
+        )
+
+        # A previous run queued the first batch and stopped before sending.
+        key = f"bot:42:broadcast:{job_id}"
+        await redis.rpush(f"{key}:queue", *(f"{i}:en" for i in range(1, 6)))
+        await redis.hset(key, mapping={"cursor": 5, "enqueued": 5})
+
+        # This run stops after three messages, the next one finishes the job.
+        bot.stop_after = 3
+        await _run_until_done(_broadcaster(bot, redis, i18n), redis, job_id)
+        assert bot.sent == [1, 2, 3]
+        await _run_until_done(_broadcaster(bot, redis, i18n), redis, job_id)
+
+        assert bot.sent == list(range(1, 13))
+        meta = await redis.hgetall(key)
+        assert (meta["status"], meta["enqueued"], meta["sent"]) == ("done", "12", "12")
+
+    asyncio.run(scenario())
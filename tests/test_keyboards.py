@@ -0,0 +1,59 @@
+"""tests/test_keyboards.py."""
+
+import pydantic
+import pytest
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from src.bot.keyboards.registry import KeyboardRegistry
+
+
+def _menu() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="Listings", callback_data="listings")],
+            [InlineKeyboardButton(text="Profile", callback_data="profile")],
+        ]
+    )
+
+
+def test_cached_markup_is_shared_and_equal_to_the_built_one():
+    registry = KeyboardRegistry()
+    markup = registry.get("menu", (), _menu)
+
+    assert registry.get("menu", (), _menu) is markup
+    assert len(registry) == 1
+    assert markup.model_dump(exclude_none=True) == _menu().model_dump(exclude_none=True)
+    assert isinstance(markup, InlineKeyboardMarkup)
+    assert isinstance(markup.inline_keyboard[0][0], InlineKeyboardButton)
+
+
+def test_cached_markup_rows_and_buttons_are_frozen():
+    markup = KeyboardRegistry().get("menu", (), _menu)
+    extra = InlineKeyboardButton(text="Extra", callback_data="extra")
+
+    with pytest.raises(pydantic.ValidationError):
+        markup.inline_keyboard = []
+    with pytest.raises(TypeError):
+        markup.inline_keyboard.append([extra])
+    with pytest.raises(TypeError):
+        markup.inline_keyboard[0] = [extra]
+    with pytest.raises(TypeError):
+        markup.inline_keyboard[0].append(extra)
+    with pytest.raises(pydantic.ValidationError):
+        markup.inline_keyboard[0][0].text = "Changed"
+    assert markup.inline_keyboard[0][0].text == "Listings"
+
+
+def test_cached_markup_can_be_rebuilt_with_changed_buttons():
+    markup = KeyboardRegistry().get("menu", (), _menu)
+
+    rows = [
+        [button.model_copy(update={"text": f"> {button.text}"}) for button in row]
+        for row in markup.inline_keyboard
+    ]
+    rows.append([InlineKeyboardButton(text="Extra", callback_data="extra")])
+    changed = InlineKeyboardMarkup(inline_keyboard=rows)
+
+    assert changed.inline_keyboard[0][0].text == "> Listings"
+    assert len(changed.inline_keyboard) == 3
+    assert markup.inline_keyboard[0][0].text == "Listings"
+    assert len(markup.inline_keyboard) == 2
@@ -0,0 +1,58 @@
+"""tests/test_listing_sync.py."""
+
+import asyncio
+from src.database import Announcement
+from src.infrastructure.sync import ListingSync
+
+
+class FeedSync(ListingSync):
+    """
+    ListingSync reading pages from an in-memory feed instead of the API.
+    """
+
+    def __init__(self, feed):
+        super().__init__(interval=0, full_interval=0, page_size=2, concurrency=1)
+        self.feed = feed
+        self.removed = []
+        self.add_listener(self._collect)
+
+    async def _fetch(self, api, offset):
+        return self.feed[offset : offset + self.page_size]
+
+    async def _collect(self, changes):
+        self.removed.extend(changes.removed)
+
+
+def _listing(listing_id):
+    return {"id": listing_id, "address": f"Street {listing_id}", "price": 50_000}
+
+
+async def _stored_ids():
+    return sorted(doc.listing_id for doc in await Announcement.find_all().to_list())
+
+
+def test_full_sync_purges_listings_missed_by_two_passes(mongo):
+    async def scenario():
+        sync = FeedSync([_listing(i) for i in (5, 4, 3, 2, 1)])
+        await sync.sync_once(full=True)
+        assert await _stored_ids() == [1, 2, 3, 4, 5]
+
+        # Listing 3 is skipped once, e.g. by a page boundary shift: kept.
+        sync.feed = [_listing(i) for i in (5, 4, 2, 1)]
+        await sync.sync_once(full=True)
+        assert await _stored_ids() == [1, 2, 3, 4, 5]
+        assert not sync.removed
+
+        # Seen again, then missed once more: still kept.
+        sync.feed = [_listing(i) for i in (5, 4, 3, 2, 1)]
+        await sync.sync_once(full=True)
+        sync.feed = [_listing(i) for i in (5, 4, 2, 1)]
+        await sync.sync_once(full=True)
+        assert await _stored_ids() == [1, 2, 3, 4, 5]
+
+        # Missed by a second pass in a row: gone.
+        await sync.sync_once(full=True)
+        assert await _stored_ids() == [1, 2, 4, 5]
+        assert sync.removed == [3]
+
+    asyncio.run(scenario())
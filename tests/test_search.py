@@ -0,0 +1,108 @@
+"""tests/test_search.py."""
+
+import asyncio
+import pytest
+from src.bot.handlers.announcement.search import parse_range
+from src.infrastructure.search import SearchFilters
+from src.infrastructure.search.index import ListingIndex
+
+
+def _listing(listing_id, **fields):
+    return {
+        "id": listing_id,
+        "address": "Baker St, 221B",
+        "price": 60_000,
+        "area": 55,
+        "number_of_rooms": "2",
+        **fields,
+    }
+
+
+def _assert_sorted(index):
+    assert index._price == sorted(index._price)
+    assert index._area == sorted(index._area)
+    assert index._vocabulary == sorted(index._tokens)
+
+
+def test_parse_range():
+    assert parse_range("50000-100000") == (50_000, 100_000)
+    assert parse_range("50 000 – 100 000") == (50_000, 100_000)
+    assert parse_range("-100000") == (None, 100_000)
+    assert parse_range("50000-") == (50_000, None)
+    assert parse_range("100000") == (None, 100_000)
+    assert parse_range("42,5-60") == (42.5, 60)
+
+
+@pytest.mark.parametrize("text", ["", "-", "abc", "100000-50000", "1-2-3"])
+def test_parse_range_rejects_invalid_ranges(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
+
+
+def test_search_matches_keyword_prefixes():
+    index = ListingIndex()
+    index.upsert(_listing(1, address="Baker Street 221B"))
+    index.upsert(_listing(2, address="Bakery Lane 5"))
+    index.upsert(_listing(3, address="Abbey Road 3"))
+
+    assert index.search(SearchFilters(keywords=["bak"])) == [2, 1]
+    assert index.search(SearchFilters(keywords=["baker"])) == [2, 1]
+    assert index.search(SearchFilters(keywords=["baker street"])) == [1]
+    assert index.search(SearchFilters(keywords=["road"], max_price=50_000)) == []
+
+
+def test_search_pages_below_max_id():
+    index = ListingIndex()
+    for listing_id in range(1, 8):
+        index.upsert(_listing(listing_id, price=10_000 * listing_id))
+    filters = SearchFilters(min_price=20_000)
+
+    assert index.search(filters, limit=2) == [7, 6]
+    assert index.search(filters, limit=2, max_id=5) == [5, 4]
+    assert index.search(filters, limit=2, offset=2, max_id=5) == [3, 2]
+    assert index.search(filters, limit=2, offset=4, max_id=5) == []
+
+
+def test_upsert_and_remove_keep_arrays_sorted():
+    index = ListingIndex()
+    for listing_id, price, area in [(1, 90_000, 70), (2, 30_000, 40), (3, 60, 55)]:
+        index.upsert(_listing(listing_id, price=price, area=area))
+    index.upsert(_listing(4, price=None, address="Abbey Road"))
+    _assert_sorted(index)
+
+    moved = _listing(2, price=120_000, area=40, address="Zoo Lane")
+    assert index.upsert(moved)
+    assert not index.upsert(moved)
+    _assert_sorted(index)
+    assert index.search(SearchFilters(min_price=100_000)) == [2]
+
+    assert index.remove(1)
+    assert not index.remove(1)
+    assert index.remove(4)
+    _assert_sorted(index)
+    assert "abbey" not in index._vocabulary
+    assert index.search(SearchFilters(max_area=50)) == [2]
+
+
+def test_load_builds_the_same_index_as_upserts():
+    listings = [
+        _listing(listing_id, price=(listing_id * 7919) % 100_000, address=address)
+        for listing_id, address in enumerate(
+            ["Baker St", "Abbey Road", "Zoo Lane", "Baker Lane", "Elm St"] * 5, 1
+        )
+    ]
+
+    async def stored():
+        for item in listings:
+            yield item
+
+    loaded = ListingIndex()
+    asyncio.run(loaded.load(stored()))
+    upserted = ListingIndex()
+    for item in listings:
+        upserted.upsert(item)
+
+    _assert_sorted(loaded)
+    assert loaded._price == upserted._price
+    assert loaded._tokens == upserted._tokens
+    assert loaded._vocabulary == upserted._vocabulary
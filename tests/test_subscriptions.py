@@ -0,0 +1,26 @@
+"""tests/test_subscriptions.py."""
+
+from src.infrastructure.search import SearchFilters
+from src.infrastructure.search.subscriptions import SubscriptionIndex
+
+
+def _listing(**fields):
+    return {
+        "id": 1,
+        "address": "Baker St, 221B",
+        "price": 60_000,
+        "area": 55,
+        "number_of_rooms": "2",
+        **fields,
+    }
+
+
+def test_rooms_filter_matches_new_listing():
+    index = SubscriptionIndex()
+    index.add("rooms", 100, SearchFilters(rooms=2))
+    index.add("rooms_and_price", 200, SearchFilters(rooms=2, max_price=70_000))
+    index.add("other_rooms", 300, SearchFilters(rooms=3))
+
+    assert index.match(_listing()) == {100, 200}
+    assert index.match(_listing(number_of_rooms="3")) == {300}
+    assert index.match(_listing(number_of_rooms=None)) == set()